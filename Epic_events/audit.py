@@ -0,0 +1,82 @@
+"""
+📜 Buffered Audit Trail for Epic Events CRM
+
+Business events (user created, role changed, contract signed, ...) are recorded in the
+append-only `audit_log` table instead of being sent to Sentry from the request path.
+Entries are buffered on the session and written with a single batched INSERT when the
+session commits, so they share the transaction of the change they describe and add
+no network hop of their own. A rollback discards them together with the change.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+from datetime import datetime, UTC
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .auth.utils import get_current_user
+from .models import AuditLog
+
+
+AUDIT_BUFFER = "audit_buffer"
+
+
+# 👤 Resolve the Acting User ────────────────────────────────────────
+def current_actor():
+    """Return (user_id, name) from the stored token, or (None, None) when nobody is logged in."""
+    try:
+        payload = get_current_user()
+    except Exception:
+        return None, None
+    return int(payload["sub"]), payload.get("name")
+
+
+# 📝 Record an Entry ────────────────────────────────────────────────
+def record_audit(session: Session, action: str, entity_type: str, entity_id: int = None, **details):
+    """
+    Buffer an audit entry on `session`; it is written when the session commits.
+
+    Args:
+        session: Session whose transaction the entry belongs to.
+        action: Dotted action name, e.g. "user.created" or "contract.signed".
+        entity_type: Kind of entity affected ("user", "client", "contract", "event").
+        entity_id: Primary key of the affected entity, if any.
+        **details: Extra JSON-serialisable context.
+    """
+    session.info.setdefault(AUDIT_BUFFER, []).append({
+        "created_at": datetime.now(UTC),
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "details": details or None,
+    })
+
+
+# 🚚 Flush the Buffer at Commit ─────────────────────────────────────
+@event.listens_for(Session, "before_commit")
+def _write_audit_buffer(session):
+    entries = session.info.pop(AUDIT_BUFFER, None)
+    if not entries:
+        return
+    actor_id, actor_name = current_actor()
+    for entry in entries:
+        entry["actor_id"] = actor_id
+        entry["actor_name"] = actor_name
+    session.execute(insert(AuditLog), entries)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_audit_buffer(session):
+    session.info.pop(AUDIT_BUFFER, None)
+
+
+# ↩️ Savepoint Support ─────────────────────────────────────────────
+def audit_mark(session: Session) -> int:
+    """Return the current size of the audit buffer, to undo entries after a savepoint rollback."""
+    return len(session.info.get(AUDIT_BUFFER, ()))
+
+
+def discard_audit_since(session: Session, mark: int):
+    """Drop entries buffered after `mark`; their savepoint was rolled back, so they never happened."""
+    del session.info.get(AUDIT_BUFFER, [])[mark:]
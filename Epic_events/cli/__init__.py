@@ -17,20 +17,35 @@ from .user import user
 from .client import client
 from .contract import contract
 from .event import event
+from .sync import sync
+from .audit import audit
+from .batch import batch
+from .doctor import doctor
+from .dashboard import dashboard
+from .cache import cache
+from .reminders import reminders
+from Epic_events.rich_styles import set_plain_mode
+from Epic_events.timeouts import set_query_timeout
+from Epic_events.config import STATEMENT_TIMEOUT_SECONDS
 
 
 # 🚀 ROOT CLI GROUP ───────────────────────────────────────────────────
 @click.group(cls=click.RichGroup)
+@click.option("--plain", is_flag=True, envvar="EPIC_PLAIN",
+              help="Plain aligned text output: no panels, banners or table borders (for pipes and slow terminals).")
+@click.option("--timeout", type=click.FloatRange(min=0), default=STATEMENT_TIMEOUT_SECONDS, show_default=True,
+              metavar="SECONDS", help="Cancel any single query running longer than this (0: no limit).")
 @click.pass_context
-def cli(ctx):
+def cli(ctx, plain, timeout):
     """
     📦 Epic Events CRM CLI
 
     Use this interface to manage users, clients, contracts, and events.
     Type --help after any command for detailed usage information.
     """
-    # No banner or panel needed here anymore (handled in main.py)
-    pass
+    # Banners are handled in main.py; only the rendering mode is set here.
+    set_plain_mode(plain)
+    set_query_timeout(timeout)
 
 
 # 👤 Add user command group (login, registration, etc.)
@@ -41,3 +56,17 @@ cli.add_command(client)
 cli.add_command(contract)
 # 🎉 Add event command group (assign support, view event details)
 cli.add_command(event)
+# 🔄 Add snapshot sync command (local read-only copy)
+cli.add_command(sync)
+# 📜 Add audit command group (business event trail)
+cli.add_command(audit)
+# 📦 Add batch command group (non-interactive JSON-lines operations)
+cli.add_command(batch)
+# 🩺 Add doctor command (startup and latency diagnostics)
+cli.add_command(doctor)
+# 📊 Add dashboard command (per-role key numbers in one query)
+cli.add_command(dashboard)
+# 🗂️ Add cache command group (result cache of list commands)
+cli.add_command(cache)
+# ⏰ Add reminders command group (upcoming-event reminder scheduler)
+cli.add_command(reminders)
@@ -0,0 +1,55 @@
+"""
+📜 Audit Command Handlers for Epic Events CRM
+
+This module defines CLI commands to read the append-only audit trail: the latest
+entries and filtered searches. Access is restricted to the gestion role.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.completion import complete_ids
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.audit_service import query_audit_logic
+from Epic_events.rich_styles import render_command_banner
+
+DATE_FORMATS = ["%d-%m-%Y", "%d-%m-%Y %H:%M"]
+
+
+# ─── 📜 Audit Command Group ──────────────────────────────
+@click.group(
+    cls=click.RichGroup,
+    help="📜 Browse the audit trail of business events."
+)
+def audit():
+    """📜 Audit Commands
+
+    Read who created, updated, signed or deleted what, and when.
+    """
+
+
+@audit.command(name="tail")
+@click.option("-n", "--limit", type=int, default=20, show_default=True, help="Number of entries to show.")
+@role_required(["gestion"])
+def tail(limit):
+    """🕒 Show the most recent audit entries (gestion only)."""
+    render_command_banner("Audit Tail", "Most recent business events, newest first.")
+    query_audit_logic(limit=limit)
+
+
+@audit.command(name="query")
+@click.option("--actor", "actor_id", type=int, default=None, help="User ID who performed the action.",
+              shell_complete=complete_ids("users"))
+@click.option("--action", default=None, help="Action name, e.g. contract.signed (use user.* for a prefix).")
+@click.option("--entity-type", type=click.Choice(["user", "client", "contract", "event"]), default=None)
+@click.option("--entity-id", type=int, default=None, help="ID of the affected entity.")
+@click.option("--since", type=click.DateTime(formats=DATE_FORMATS), default=None, help="From date (DD-MM-YYYY).")
+@click.option("--until", type=click.DateTime(formats=DATE_FORMATS), default=None, help="Until date (DD-MM-YYYY).")
+@click.option("-n", "--limit", type=int, default=100, show_default=True, help="Maximum entries to show.")
+@role_required(["gestion"])
+def query(actor_id, action, entity_type, entity_id, since, until, limit):
+    """🔎 Search the audit log with filters (gestion only)."""
+    render_command_banner("Audit Query", "Filter business events by actor, action, entity and date.")
+    query_audit_logic(limit=limit, actor_id=actor_id, action=action, entity_type=entity_type,
+                      entity_id=entity_id, since=since, until=until)
@@ -0,0 +1,38 @@
+"""
+📦 Batch Command Handlers for Epic Events CRM
+
+This module defines the `batch` command group, which applies create/update operations
+from a JSON-lines file without prompts, for scripting and bulk imports.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.batch_service import run_batch_logic
+from Epic_events.rich_styles import render_command_banner
+
+
+# ─── 📦 Batch Command Group ──────────────────────────────
+@click.group(
+    cls=click.RichGroup,
+    help="📦 Apply many operations from a JSON-lines file, without prompts."
+)
+def batch():
+    """📦 Batch Commands
+
+    Each line is one JSON object with an "op" (client.create, client.update,
+    contract.create, contract.update, event.create, event.update) and its fields.
+    """
+
+
+@batch.command(name="run")
+@click.argument("file", type=click.Path(allow_dash=True, dir_okay=False))
+@click.option("--atomic", is_flag=True, help="Commit every line or none of them.")
+@click.option("--dry-run", is_flag=True, help="Validate every line, then roll back.")
+@role_required(["gestion", "commercial", "support"])
+def run(file, atomic, dry_run):
+    """▶️ Run a JSON-lines batch file ("-" reads stdin)."""
+    render_command_banner("Batch Run", "Each line runs in its own savepoint; failures do not stop the batch.")
+    run_batch_logic(file, atomic=atomic, dry_run=dry_run)
@@ -0,0 +1,42 @@
+"""
+🗂️ Cache Command Handlers for Epic Events CRM
+
+This module defines CLI commands to inspect and clear the result cache used by
+the list commands.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.cache_service import cache_stats_logic, cache_clear_logic
+from Epic_events.rich_styles import render_command_banner
+
+
+# ─── 🗂️ Cache Command Group ──────────────────────────────
+@click.group(
+    cls=click.RichGroup,
+    help="🗂️ Inspect or clear the result cache of list commands."
+)
+def cache():
+    """🗂️ Cache Commands
+
+    List commands reuse their last result while the tables they read are unchanged.
+    """
+
+
+@cache.command(name="stats")
+@role_required(["gestion", "commercial", "support"])
+def stats():
+    """📈 Show hit rates per cached listing and the table change counters."""
+    render_command_banner("Cache Stats", "Hits, misses and hit rate of each cached listing.")
+    cache_stats_logic()
+
+
+@cache.command(name="clear")
+@role_required(["gestion", "commercial", "support"])
+def clear():
+    """🧹 Drop every cached listing and reset the stats."""
+    render_command_banner("Cache Clear", "Cached listings are rebuilt on their next use.")
+    cache_clear_logic()
@@ -6,13 +6,10 @@ and listings. It uses role-based and ownership-based permissions to ensure secur
 """
 # 🥉 External Imports ──────────────────────────────────────────
 import rich_click as click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
 
 # 🏗️ Internal Imports ──────────────────────────────────────────
 from Epic_events.models import Client
+from Epic_events.completion import complete_ids
 from Epic_events.auth.permissions import role_required, owner_required
 from Epic_events.service.client_service import (
     register_client_logic,
@@ -21,24 +18,15 @@ from Epic_events.service.client_service import (
     delete_client_logic,
     update_client_logic,
     reassign_commercial_logic,
+    prompt_reassign_commercial_targets,
+    reassign_all_clients_logic,
     list_client_details_logic,
+    rebuild_client_counters_logic,
+    CLIENT_SORTS,
 )
-
-console = Console()
-
-# 🖼️ Utility function for CLI banners ──────────────────────────────────────
-
-
-def render_command_banner(title: str, message: str):
-    banner = Panel(
-        Text(message, justify="left", style="bold yellow"),
-        title=f"[bold magenta]{title}[/bold magenta]",
-        subtitle="[italic cyan]Your Command-Line CRM[/italic cyan]",
-        border_style="green",
-        padding=(1, 2),
-        expand=False
-    )
-    console.print(Align.left(banner))
+from Epic_events.service.batch_service import read_json_source, merge_cli_fields
+from Epic_events.cli.options import SINCE_OPTION
+from Epic_events.rich_styles import render_command_banner
 
 
 # ─── 👥 Client Command Group ──────────────────────────────
@@ -61,31 +49,60 @@ def client(ctx):
 
 # 📝 CLI Commands: Client Registration & Update ──────────────────────────
 @client.command(name="register")
+@click.option("--full-name", default=None, help="Client full name.")
+@click.option("--email", default=None, help="Client email.")
+@click.option("--phone", default=None, help="Client phone (digits only).")
+@click.option("--company-name", default=None, help="Company name.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @role_required(["commercial"])
-def register_client():
-    """📝 Register a new client (commercial only)."""
+def register_client(full_name, email, phone, company_name, from_json):
+    """📝 Register a new client (commercial only).
+
+    Without options or --from-json, the fields are prompted for.
+    """
     render_command_banner("Register Client", "Register a new client profile and assign a commercial contact.")
-    register_client_logic()
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, full_name=full_name,
+                            email=email, phone=phone, company_name=company_name)
+    register_client_logic(data)
 
 
 @client.command("update")
-@click.option("--client-id", type=int, prompt="🔹 Enter the client ID to update")
+@click.option("--client-id", type=int, prompt="🔹 Enter the client ID to update",
+              shell_complete=complete_ids("clients"))
+@click.option("--full-name", default=None, help="New full name.")
+@click.option("--email", default=None, help="New email.")
+@click.option("--phone", default=None, help="New phone (digits only).")
+@click.option("--company-name", default=None, help="New company name.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @owner_required(Client, owner_field="commercial_id", id_arg="client_id")
-def update_client(client_id):
+def update_client(client_id, full_name, email, phone, company_name, from_json):
     """🔧 Update a client's information (commercial owner or gestion)."""
     render_command_banner("Update Client", "Update a client's contact information or business name.")
-    update_client_logic(client_id)
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, full_name=full_name,
+                            email=email, phone=phone, company_name=company_name)
+    update_client_logic(client_id, data)
 
 
 # 🔄 CLI Command: Client Reassignment ────────────────────────────
 @client.command("reassign")
+@click.option("--client-id", type=int, default=None, help="Client to reassign.",
+              shell_complete=complete_ids("clients"))
+@click.option("--commercial-id", "new_commercial_id", type=int, default=None, help="New commercial in charge.",
+              shell_complete=complete_ids("users", role="commercial"))
 @role_required(["gestion"])
-def reassign_commercial():
-    """🔄 Reassign a client to a different commercial (gestion only)."""
+def reassign_commercial(client_id, new_commercial_id):
+    """🔄 Reassign a client to a different commercial (gestion only).
+
+    Without --client-id and --commercial-id, both are picked interactively.
+    """
     render_command_banner("Reassign Commercial", "Assign a different commercial to an existing client.")
     try:
-        client_id = click.prompt("🔹 Enter the client ID to reassign", type=int)
-        new_commercial_id = click.prompt("💼 Enter the new commercial's user ID", type=int)
+        if client_id is None and new_commercial_id is None:
+            client_id, new_commercial_id = prompt_reassign_commercial_targets()
+        elif client_id is None or new_commercial_id is None:
+            raise ValueError("Give both --client-id and --commercial-id, or neither to pick them.")
 
         success_message = reassign_commercial_logic(client_id, new_commercial_id)
         click.secho(f" {success_message}", fg="green")
@@ -97,9 +114,39 @@ def reassign_commercial():
         click.secho(f"🚨 An unexpected error occurred: {e}", fg="red")
 
 
+@client.command("reassign-all")
+@click.option("--from", "from_id", type=int, prompt="💼 Commercial ID to move clients from",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--to", "to_id", type=int, prompt="💼 Commercial ID to move clients to",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--company", "company_name", default=None, help="Only move clients of this company.")
+@click.option("--with-contracts", is_flag=True, help="Also move those clients' contracts.")
+@click.option("--yes", is_flag=True, help="Skip the confirmation prompt.")
+@role_required(["gestion"])
+def reassign_all_clients(from_id, to_id, company_name, with_contracts, yes):
+    """🔄 Move every client of one commercial to another (gestion only)."""
+    render_command_banner("Reassign All Clients", "Hand over a commercial's whole portfolio in one transaction.")
+    if not yes and not click.confirm(f"Move all clients of commercial {from_id} to {to_id}?"):
+        click.secho("❌ Aborted.", fg="red")
+        return
+    try:
+        clients_moved, contracts_moved = reassign_all_clients_logic(
+            from_id, to_id, company_name=company_name, with_contracts=with_contracts
+        )
+        click.secho(f"✅ {clients_moved} client(s) and {contracts_moved} contract(s) "
+                    f"moved from commercial {from_id} to {to_id}.", fg="green")
+
+    except ValueError as e:
+        click.secho(f"❌ Error: {e}", fg="red")
+
+    except Exception as e:
+        click.secho(f"🚨 An unexpected error occurred: {e}", fg="red")
+
+
 # 🗑️ CLI Command: Delete Client ────────────────────────────
 @client.command("delete")
-@click.option("--client-id", type=int, prompt="🗑️ Enter the client ID to delete")
+@click.option("--client-id", type=int, prompt="🗑️ Enter the client ID to delete",
+              shell_complete=complete_ids("clients"))
 @owner_required(Client, owner_field="commercial_id", id_arg="client_id")
 def delete_client(client_id):
     """🗑️ Delete a client by ID (owner or gestion only)."""
@@ -112,20 +159,39 @@ def delete_client(client_id):
 
 
 # 📋 CLI Commands: Client Listings ───────────────────────────
+SORT_OPTION = click.option("--sort", type=click.Choice(list(CLIENT_SORTS)), default="client_id", show_default=True,
+                           help="Order of the listing; total_due puts the largest balances first.")
+
+
 @client.command(name="list-my-clients")
+@SORT_OPTION
+@SINCE_OPTION
 @role_required(["commercial"])
-def list_my_clients():
+def list_my_clients(sort, since):
     """📋 List only the clients assigned to the logged-in commercial."""
     render_command_banner("My Clients", "Display only the clients assigned to your user account.")
-    list_my_clients_logic()
+    list_my_clients_logic(sort=sort, since=since)
 
 
 @client.command(name="list-clients")
+@SORT_OPTION
+@click.option("--pager", is_flag=True, help="Browse one screen at a time: n/p to scroll, / to search, # to jump.")
+@SINCE_OPTION
 @role_required(["commercial", "gestion", "support"])
-def list_clients():
+def list_clients(sort, pager, since):
     """🌐 List all clients (visible to all roles)."""
     render_command_banner("All Clients", "View all client records in the system.")
-    list_clients_logic()
+    list_clients_logic(sort=sort, pager=pager, since=since)
+
+
+@client.command(name="rebuild-counters")
+@role_required(["gestion"])
+def rebuild_counters():
+    """🔢 Recount every client's contract, balance and upcoming-event counters."""
+    render_command_banner("Rebuild Client Counters",
+                          "Recount open and unsigned contracts, total due and upcoming events for every client.\n"
+                          "Run it after a manual data fix, or nightly so upcoming-event counts age out.")
+    rebuild_client_counters_logic()
 
 
 @client.command(name="list-details")
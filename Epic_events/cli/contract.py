@@ -7,13 +7,10 @@ and listings. Permissions are enforced to ensure that only authorized roles can
 
 # 🥉 External Imports ──────────────────────────────────────────
 import rich_click as click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
 
 # 🏗️ Internal Imports ──────────────────────────────────────────
 from Epic_events.models import Contract
+from Epic_events.completion import complete_ids
 from Epic_events.auth.permissions import role_required, owner_required, attach_sentry_user
 from Epic_events.service.contract_service import (
     create_contract_logic,
@@ -22,25 +19,17 @@ from Epic_events.service.contract_service import (
     delete_contract_logic,
     list_client_contracts_logic,
     reassign_contract_logic,
+    reassign_all_contracts_logic,
     list_my_contracts_logic,
     list_contract_details_logic,
     list_not_signed_contract_logic,
+    pay_contract_logic,
+    import_payments_logic,
+    list_contract_payments_logic,
 )
-
-console = Console()
-
-
-# 🖼️ Utility for rendering command banners ───────────────────────────────
-def render_command_banner(title: str, message: str):
-    banner = Panel(
-        Text(message, justify="left", style="bold yellow"),
-        title=f"[bold magenta]{title}[/bold magenta]",
-        subtitle="[italic cyan]Your Command-Line CRM[/italic cyan]",
-        border_style="green",
-        padding=(1, 2),
-        expand=False
-    )
-    console.print(Align.left(banner))
+from Epic_events.service.batch_service import read_json_source, merge_cli_fields
+from Epic_events.cli.options import SINCE_OPTION
+from Epic_events.rich_styles import render_command_banner
 
 
 @click.group(
@@ -65,38 +54,57 @@ def contract(ctx):
 
 # 📝 CLI Command: Create Contract ───────────────────────────
 @contract.command(name="create")
+@click.option("--client-id", type=int, default=None, help="Client the contract is for.",
+              shell_complete=complete_ids("clients"))
+@click.option("--commercial-id", type=int, default=None, help="Commercial in charge of the contract.",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--amount-total", type=int, default=None, help="Total amount of the contract.")
+@click.option("--amount-due", type=int, default=None, help="Amount remaining to pay.")
+@click.option("--signed/--unsigned", "is_signed", default=None, help="Whether the contract is signed.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @role_required(["gestion", "commercial"])
-def create_contract():
-    """📝 Create a new contract (gestion or commercial)."""
+def create_contract(client_id, commercial_id, amount_total, amount_due, is_signed, from_json):
+    """📝 Create a new contract (gestion or commercial).
+
+    Without options or --from-json, the fields are prompted for.
+    """
     render_command_banner("Create Contract", "Create and initialize a new event contract for a client.")
-    create_contract_logic()
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, client_id=client_id,
+                            commercial_id=commercial_id, amount_total=amount_total, amount_due=amount_due,
+                            is_signed=is_signed)
+    create_contract_logic(data)
 
 
 # 📋 CLI Commands: Contract Listings ───────────────────────────
 @contract.command(name="list")
+@click.option("--pager", is_flag=True, help="Browse one screen at a time: n/p to scroll, # to jump to an ID.")
+@SINCE_OPTION
 @role_required(["gestion", "commercial", "support"])
-def list_contracts():
+def list_contracts(pager, since):
     """📋 List all contracts in the system (visible to all roles)."""
     render_command_banner("List Contracts", "View all contracts regardless of status or assignment.")
-    list_contracts_logic()
+    list_contracts_logic(pager=pager, since=since)
 
 
 # 📋 CLI Commands: Client Listings ───────────────────────────
 @contract.command(name="list-my-contracts")
+@SINCE_OPTION
 @role_required(["commercial"])
-def list_my_contracts():
+def list_my_contracts(since):
     """📋 List contracts assigned to the logged-in commercial user."""
     render_command_banner("My Contracts", "Display only the contracts assigned to your user account.")
-    list_my_contracts_logic()
+    list_my_contracts_logic(since=since)
 
 
 @contract.command(name="list-client-contracts")
+@SINCE_OPTION
 @role_required(["gestion", "commercial", "support"])
-def list_client_contracts():
+def list_client_contracts(since):
     """📄 List contracts linked to a specific client."""
     render_command_banner("Client Contracts",
                           "Display all contracts associated with a selected client.")
-    list_client_contracts_logic()
+    list_client_contracts_logic(since=since)
 
 
 @contract.command(name="list-details")
@@ -109,39 +117,125 @@ def list_contract_details():
 
 
 @contract.command(name="not-signed")
+@SINCE_OPTION
 @role_required(["gestion", "commercial", "support"])
-def list_not_signed():
+def list_not_signed(since):
     """❗ List all contracts that are not signed."""
     render_command_banner("Contract Details",
                           "Display full contract information.")
-    list_not_signed_contract_logic()
+    list_not_signed_contract_logic(since=since)
 
 
 # 🔧 CLI Command: Update Contract ────────────────────────────
 @contract.command(name="update")
-@click.option("--contract-id", type=int, prompt="🔹 Enter the Contract ID to update")
+@click.option("--contract-id", type=int, prompt="🔹 Enter the Contract ID to update",
+              shell_complete=complete_ids("contracts"))
+@click.option("--amount-total", type=int, default=None,
+              help="New total amount; the amount due moves by the same difference.")
+@click.option("--signed/--unsigned", "is_signed", default=None, help="Mark the contract signed or unsigned.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @attach_sentry_user
 @owner_required(Contract, owner_field="commercial_id", id_arg="contract_id")
-def update_contract(contract_id: int):
-    """🔧 Update a contract's status or details (owner or gestion only)."""
+def update_contract(contract_id: int, amount_total, is_signed, from_json):
+    """🔧 Update a contract's status or details (owner or gestion only).
+
+    The amount due only changes with `contract pay`.
+    """
     render_command_banner("Update Contract", "Modify the payment status or terms of an existing contract.")
-    update_contract_logic(contract_id)
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, amount_total=amount_total,
+                            is_signed=is_signed)
+    update_contract_logic(contract_id, data)
+
+
+# 💳 CLI Commands: Payments ───────────────────────────
+@contract.command(name="pay")
+@click.argument("contract_id", type=int, shell_complete=complete_ids("contracts"))
+@click.argument("amount", type=int)
+@click.option("--reference", default=None, help="Bank or receipt reference (must be unique).")
+@attach_sentry_user
+@owner_required(Contract, owner_field="commercial_id", id_arg="contract_id")
+def pay_contract(contract_id: int, amount: int, reference):
+    """💳 Record a payment and decrease the amount due (owner or gestion only)."""
+    render_command_banner("Record Payment", "Add a payment to the ledger and update the remaining balance.")
+    pay_contract_logic(contract_id, amount, reference=reference)
+
+
+@contract.command(name="import-payments")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--dry-run", is_flag=True, help="Validate every row, then roll back.")
+@role_required(["gestion"])
+def import_payments(file, dry_run):
+    """🏦 Import payments from a bank statement CSV (gestion only).
+
+    Columns: contract_id, amount, and optionally reference and paid_at.
+    Rows whose reference was already imported are skipped.
+    """
+    render_command_banner("Import Payments", "Record every payment of a bank statement; bad rows are reported.")
+    import_payments_logic(file, dry_run=dry_run)
+
+
+@contract.command(name="payments")
+@click.argument("contract_id", type=int, shell_complete=complete_ids("contracts"))
+@SINCE_OPTION
+@role_required(["gestion", "commercial", "support"])
+def list_payments(contract_id: int, since):
+    """📒 Show the payment history of a contract (all roles)."""
+    render_command_banner("Contract Payments", "Every payment recorded on this contract, oldest first.")
+    list_contract_payments_logic(contract_id, since=since)
 
 
 # 🔄 CLI Command: Reassign Contract ───────────────────────────
 @contract.command(name="reassign")
+@click.option("--contract-id", type=int, prompt="🔹 Enter contract ID",
+              shell_complete=complete_ids("contracts"))
+@click.option("--commercial-id", type=int, default=None, help="New commercial in charge.",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--client-id", type=int, default=None, help="New client.",
+              shell_complete=complete_ids("clients"))
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @role_required(["gestion"])
-def reassign_contract():
-    """🔄 Reassign client or commercial for a contract (gestion only)."""
+def reassign_contract(contract_id, commercial_id, client_id, from_json):
+    """🔄 Reassign client or commercial for a contract (gestion only).
+
+    Without --commercial-id, --client-id or --from-json, the new values are picked interactively.
+    """
     render_command_banner("Reassign Contract", "Reassign the client or commercial contact tied to a contract.")
-    contract_id = click.prompt("🔹 Enter contract ID", type=int)
-    reassign_contract_logic(contract_id)
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None,
+                            commercial_id=commercial_id, client_id=client_id)
+    reassign_contract_logic(contract_id, data)
+
+
+@contract.command(name="reassign-all")
+@click.option("--from", "from_id", type=int, prompt="💼 Commercial ID to move contracts from",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--to", "to_id", type=int, prompt="💼 Commercial ID to move contracts to",
+              shell_complete=complete_ids("users", role="commercial"))
+@click.option("--client-id", type=int, default=None, help="Only move contracts of this client.",
+              shell_complete=complete_ids("clients"))
+@click.option("--unsigned-only", is_flag=True, help="Only move contracts that are not signed yet.")
+@click.option("--yes", is_flag=True, help="Skip the confirmation prompt.")
+@role_required(["gestion"])
+def reassign_all_contracts(from_id, to_id, client_id, unsigned_only, yes):
+    """🔄 Move every contract of one commercial to another (gestion only)."""
+    render_command_banner("Reassign All Contracts", "Hand over a commercial's contracts in one transaction.")
+    if not yes and not click.confirm(f"Move all contracts of commercial {from_id} to {to_id}?"):
+        click.secho("❌ Aborted.", fg="red")
+        return
+    try:
+        moved = reassign_all_contracts_logic(from_id, to_id, client_id=client_id, unsigned_only=unsigned_only)
+        click.secho(f"✅ {moved} contract(s) moved from commercial {from_id} to {to_id}.", fg="green")
+    except Exception as e:
+        click.secho(f"❌ Error: {e}", fg="red")
 
 
 # 🗑️ CLI Command: Delete Contract ───────────────────────────
 @contract.command(name="delete")
+@click.option("--contract-id", type=int, prompt="🗑️ Enter the contract ID to delete",
+              shell_complete=complete_ids("contracts"))
 @role_required(["gestion"])
-def delete_contract():
+def delete_contract(contract_id):
     """🗑️ Delete a contract by ID (gestion only)."""
     render_command_banner("Delete Contract", "Permanently remove a contract from the system by its ID.")
-    delete_contract_logic()
+    delete_contract_logic(contract_id)
@@ -0,0 +1,26 @@
+"""
+📊 Dashboard Command Handler for Epic Events CRM
+
+This module defines the `dashboard` command: one screen with the logged-in user's
+key numbers and upcoming events, fetched in a single query.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.dashboard_service import dashboard_logic
+from Epic_events.rich_styles import render_command_banner
+
+
+# ─── 📊 Personal Dashboard ──────────────────────────────
+@click.command(name="dashboard")
+@click.option("--limit", default=10, show_default=True, type=click.IntRange(1, 100),
+              help="Maximum number of upcoming events listed.")
+@role_required(["gestion", "commercial", "support"])
+def dashboard(limit):
+    """📊 Your day at a glance: unsigned contracts, amounts due, upcoming and unassigned events."""
+    render_command_banner("Dashboard",
+                          "Key numbers for your role and the events of the next 7 days, in one query.")
+    dashboard_logic(limit=limit)
@@ -0,0 +1,26 @@
+"""
+🩺 Doctor Command Handler for Epic Events CRM
+
+This module defines the `doctor` command, which explains where the time of a command
+goes: startup phases, token decode, database latency and rendering, plus the pool
+state, missing indexes and table sizes.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.service.doctor_service import doctor_logic
+from Epic_events.rich_styles import render_command_banner
+
+
+# ─── 🩺 Diagnostics ──────────────────────────────
+@click.command(name="doctor")
+@click.option("--pings", default=5, show_default=True, type=click.IntRange(1, 1000),
+              help="Number of SELECT 1 round-trips to time.")
+def doctor(pings):
+    """🩺 Diagnose slow commands: startup phases, DB latency, pool, indexes and table sizes."""
+    render_command_banner("Doctor",
+                          "Time each startup and command phase and check the database setup.\n"
+                          "Works without logging in; the token phase is then reported as skipped.")
+    doctor_logic(pings=pings)
@@ -7,13 +7,11 @@ deletion, and detailed views. Permissions are enforced based on role or ownershi
 
 # 🥉 External Imports ──────────────────────────────────────────
 import rich_click as click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
+from datetime import datetime, timedelta
 
 # 🏗️ Internal Imports ──────────────────────────────────────────
 from Epic_events.models import Event, Contract
+from Epic_events.completion import complete_ids
 from Epic_events.auth.permissions import role_required, owner_required
 from Epic_events.service.event_service import (
     create_event_logic,
@@ -23,23 +21,16 @@ from Epic_events.service.event_service import (
     delete_event_logic,
     list_client_events_logic,
     list_my_events_logic,
-    reassign_event_logic
+    reassign_event_logic,
+    reassign_all_events_logic,
+    archive_events_logic,
+    maintain_partitions_logic,
+    claim_event_logic,
 )
-
-console = Console()
-
-
-# 🖼️ Utility for rendering rich command banners ───────────────────────────
-def render_command_banner(title: str, message: str):
-    banner = Panel(
-        Text(message, justify="left", style="bold yellow"),
-        title=f"[bold magenta]{title}[/bold magenta]",
-        subtitle="[italic cyan]Your Command-Line CRM[/italic cyan]",
-        border_style="green",
-        padding=(1, 2),
-        expand=False
-    )
-    console.print(Align.left(banner))
+from Epic_events.config import EVENT_RETENTION_DAYS, EVENTS_PARTITIONED, EVENT_PARTITION_MONTHS_AHEAD
+from Epic_events.service.batch_service import read_json_source, merge_cli_fields
+from Epic_events.cli.options import SINCE_OPTION
+from Epic_events.rich_styles import render_command_banner
 
 
 # ─── 🎉 Event Command Group ───────────────────────────────
@@ -64,38 +55,63 @@ def event(ctx):
 
 # ─── 📝 Event Creation ──────────────────────────────
 @event.command(name="create")
+@click.option("--client-id", type=int, default=None, help="Client the event is for.",
+              shell_complete=complete_ids("clients"))
+@click.option("--contract-id", type=int, default=None, help="Contract the event belongs to.",
+              shell_complete=complete_ids("contracts"))
+@click.option("--support-id", type=int, default=None, help="Support user in charge.",
+              shell_complete=complete_ids("users", role="support"))
+@click.option("--name", "event_name", default=None, help="Event name.")
+@click.option("--start", "start_date", default=None, help="Start date (DD-MM-YYYY HH:MM or ISO 8601).")
+@click.option("--end", "end_date", default=None, help="End date (DD-MM-YYYY HH:MM or ISO 8601).")
+@click.option("--location", default=None, help="Event location.")
+@click.option("--notes", default=None, help="Notes or description.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @role_required(["gestion", "commercial"])
-def create():
-    """📝 Create a new event (gestion or commercial)."""
+def create(client_id, contract_id, support_id, event_name, start_date, end_date, location, notes, from_json):
+    """📝 Create a new event (gestion or commercial).
+
+    Without options or --from-json, the fields are prompted for.
+    """
     render_command_banner("Create Event", "Create a new event for a client with a signed contract.")
-    create_event_logic()
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, client_id=client_id,
+                            contract_id=contract_id, support_id=support_id, event_name=event_name,
+                            start_date=start_date, end_date=end_date, location=location, notes=notes)
+    create_event_logic(data)
 
 
 # ─── 📋 Event Listings ──────────────────────────────
 @event.command(name="list")
+@click.option("--archived", is_flag=True, help="List archived events instead of current ones.")
+@click.option("--pager", is_flag=True, help="Browse one screen at a time: n/p to scroll, / to search, # to jump.")
+@SINCE_OPTION
 @role_required(["gestion", "commercial", "support"])
-def list_events():
+def list_events(archived, pager, since):
     """📋 List all events in the system (all roles)."""
     render_command_banner("List Events", "View all scheduled events across all departments.")
-    list_events_logic()
+    list_events_logic(archived=archived, pager=pager, since=since)
 
 
 # 📋 CLI Commands: Client Listings ───────────────────────────
 @event.command(name="list-my-event")
+@SINCE_OPTION
 @role_required(["support"])
-def list_my_events():
+def list_my_events(since):
     """📋 List events assigned to the logged-in support user."""
     render_command_banner("My Events",
                           "Display only the Events assigned to your user account.")
-    list_my_events_logic()
+    list_my_events_logic(since=since)
 
 
 @event.command(name="list-client")
+@click.option("--archived", is_flag=True, help="List archived events instead of current ones.")
+@SINCE_OPTION
 @role_required(["gestion", "commercial", "support"])
-def list_client_events():
+def list_client_events(archived, since):
     """📄 List all events associated with a specific client."""
     render_command_banner("List Client Events", "View all events associated with a selected client.")
-    list_client_events_logic()
+    list_client_events_logic(archived=archived, since=since)
 
 
 @event.command(name="list-details")
@@ -108,26 +124,129 @@ def list_event_details():
 
 # ─── 🔧 Event Modification ──────────────────────────────
 @event.command(name="update")
-@click.option("--event-id", type=int, prompt="🔹 Enter the Event ID to update")
+@click.option("--event-id", type=int, prompt="🔹 Enter the Event ID to update",
+              shell_complete=complete_ids("events"))
+@click.option("--name", "event_name", default=None, help="New event name.")
+@click.option("--start", "start_date", default=None, help="New start date (DD-MM-YYYY HH:MM or ISO 8601).")
+@click.option("--end", "end_date", default=None, help="New end date (DD-MM-YYYY HH:MM or ISO 8601).")
+@click.option("--location", default=None, help="New location.")
+@click.option("--notes", default=None, help="New notes.")
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @owner_required(Event, owner_field="support_id", id_arg="event_id")
-def update_event(event_id):
+def update_event(event_id, event_name, start_date, end_date, location, notes, from_json):
     """🔧 Update event details (support or gestion only)."""
     render_command_banner("Update Event", "Modify event details like location, time, and assigned staff.")
-    update_event_logic(event_id)
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None, event_name=event_name,
+                            start_date=start_date, end_date=end_date, location=location, notes=notes)
+    update_event_logic(event_id, data)
+
+
+@event.command(name="claim")
+@role_required(["support"])
+def claim_event():
+    """🙋 Claim the next unassigned event that fits your schedule (support only)."""
+    render_command_banner("Claim Event", "Take the next upcoming unassigned event that does not overlap yours.")
+    claim_event_logic()
 
 
 @event.command(name="reassign")
+@click.option("--event-id", type=int, prompt="🔢 Enter Event ID",
+              shell_complete=complete_ids("events"))
+@click.option("--support-id", type=int, default=None, help="New support user in charge.",
+              shell_complete=complete_ids("users", role="support"))
+@click.option("--client-id", type=int, default=None, help="New client.",
+              shell_complete=complete_ids("clients"))
+@click.option("--from-json", "from_json", type=click.Path(allow_dash=True, dir_okay=False), default=None,
+              help="Read the fields from a JSON object file ('-' for stdin); options override it.")
 @role_required(["gestion"])
-def reassign_event():
-    """🔄 Reassign support or client for an event (gestion only)."""
+def reassign_event(event_id, support_id, client_id, from_json):
+    """🔄 Reassign support or client for an event (gestion only).
+
+    Without --support-id, --client-id or --from-json, the new values are picked interactively.
+    """
     render_command_banner("Reassign Event", "Reassign the support contact or client attached to an event.")
-    reassign_event_logic()
+    data = merge_cli_fields(read_json_source(from_json) if from_json else None,
+                            support_id=support_id, client_id=client_id)
+    reassign_event_logic(event_id, data)
+
+
+@event.command(name="reassign-all")
+@click.option("--from", "from_id", type=int, prompt="👔 Support ID to move events from",
+              shell_complete=complete_ids("users", role="support"))
+@click.option("--to", "to_id", type=int, prompt="👔 Support ID to move events to",
+              shell_complete=complete_ids("users", role="support"))
+@click.option("--after", "starting_after", type=click.DateTime(formats=["%d-%m-%Y %H:%M", "%d-%m-%Y"]),
+              default=None, help="Only move events starting after this date (DD-MM-YYYY [HH:MM]).")
+@click.option("--client-id", type=int, default=None, help="Only move events of this client.",
+              shell_complete=complete_ids("clients"))
+@click.option("--yes", is_flag=True, help="Skip the confirmation prompt.")
+@role_required(["gestion"])
+def reassign_all_events(from_id, to_id, starting_after, client_id, yes):
+    """🔄 Move every event of one support user to another (gestion only)."""
+    render_command_banner("Reassign All Events", "Hand over a support user's calendar in one transaction.")
+    if not yes and not click.confirm(f"Move all events of support {from_id} to {to_id}?"):
+        click.secho("❌ Aborted.", fg="red")
+        return
+    try:
+        moved = reassign_all_events_logic(from_id, to_id, starting_after=starting_after, client_id=client_id)
+        click.secho(f"✅ {moved} event(s) moved from support {from_id} to {to_id}.", fg="green")
+    except Exception as e:
+        click.secho(f"❌ Error: {e}", fg="red")
+
+
+# ─── 🗄️ Event Archiving ──────────────────────────────
+@event.command(name="archive")
+@click.option("--before", type=click.DateTime(formats=["%d-%m-%Y", "%d-%m-%Y %H:%M"]), default=None,
+              help=f"Archive events starting before this date (DD-MM-YYYY). "
+                   f"Defaults to {EVENT_RETENTION_DAYS} days ago.")
+@click.option("--yes", is_flag=True, help="Skip the confirmation prompt.")
+@role_required(["gestion"])
+def archive_events(before, yes):
+    """🗄️ Move old events into the archive (gestion only)."""
+    render_command_banner("Archive Events", "Move past events out of the live table.\n"
+                                            "They stay available with `event list --archived`.")
+    before = before or datetime.now() - timedelta(days=EVENT_RETENTION_DAYS)
+    if not yes and not click.confirm(f"Archive every event starting before {before:%d-%m-%Y %H:%M}?"):
+        click.secho("❌ Aborted.", fg="red")
+        return
+    try:
+        archived, dropped = archive_events_logic(before)
+        click.secho(f"✅ {archived} event(s) archived.", fg="green")
+        if dropped:
+            click.secho(f"🧹 Dropped empty partitions: {', '.join(dropped)}", fg="cyan")
+    except Exception as e:
+        click.secho(f"❌ Error: {e}", fg="red")
+
+
+# ─── 🗓️ Partition Maintenance ──────────────────────────────
+@event.command(name="partitions")
+@click.option("--months-ahead", type=click.IntRange(min=0), default=EVENT_PARTITION_MONTHS_AHEAD,
+              show_default=True, help="Create monthly partitions up to this many months ahead.")
+@role_required(["gestion"])
+def maintain_partitions(months_ahead):
+    """🗓️ Create upcoming monthly partitions of the events table (gestion only)."""
+    render_command_banner("Event Partitions", "Prepare monthly partitions ahead of time.\n"
+                                              "Run it regularly, e.g. monthly from cron.")
+    if not EVENTS_PARTITIONED:
+        click.secho("⚠️ The events table is not partitioned (EVENTS_PARTITIONED=1 on PostgreSQL).", fg="yellow")
+        return
+    try:
+        created, moved = maintain_partitions_logic(months_ahead)
+        click.secho(f"✅ {len(created)} partition(s) created{': ' + ', '.join(created) if created else ''}.",
+                    fg="green")
+        if moved:
+            click.secho(f"📦 {moved} event(s) moved out of the default partition.", fg="cyan")
+    except Exception as e:
+        click.secho(f"❌ Error: {e}", fg="red")
 
 
 # ─── 🗑️ Event Deletion ──────────────────────────────
 @event.command(name="delete")
+@click.option("--event-id", type=int, prompt="🗑️ Enter the Event ID to delete",
+              shell_complete=complete_ids("events"))
 @role_required(["gestion"])
-def delete_event():
+def delete_event(event_id):
     """🗑️ Delete an event by ID (gestion only)."""
     render_command_banner("Delete Event", "Permanently remove an event from the system by its ID.")
-    delete_event_logic()
+    delete_event_logic(event_id)
@@ -0,0 +1,17 @@
+"""
+🧷 Shared CLI Options for Epic Events CRM
+
+Options reused by several command groups.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# Timestamps are UTC, as stored. The ISO forms accept the `updated_at` values a previous poll printed.
+SINCE_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f",
+                 "%Y-%m-%d %H:%M:%S.%f", "%d-%m-%Y", "%d-%m-%Y %H:%M"]
+
+# ─── 🕒 Delta Listings ──────────────────────────────
+SINCE_OPTION = click.option(
+    "--since", type=click.DateTime(formats=SINCE_FORMATS), default=None, metavar="TIMESTAMP",
+    help="Only rows changed at or after this UTC time, e.g. 2026-10-19T08:30:00 (for polling).")
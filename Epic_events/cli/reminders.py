@@ -0,0 +1,45 @@
+"""
+⏰ Reminder Command Handlers for Epic Events CRM
+
+This module defines the CLI command that runs the upcoming-event reminder scheduler.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+from pathlib import Path
+
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.reminder_service import run_reminders_logic
+from Epic_events.rich_styles import render_command_banner
+from Epic_events.config import REMINDER_LEAD_HOURS, REMINDER_SINK
+
+
+# ─── ⏰ Reminders Command Group ──────────────────────────────
+@click.group(
+    cls=click.RichGroup,
+    help="⏰ Remind support staff of their upcoming events."
+)
+def reminders():
+    """⏰ Reminder Commands
+
+    A long-running scheduler notifies each event's support a lead time before it starts.
+    """
+
+
+@reminders.command(name="run")
+@click.option("--lead-hours", type=click.FloatRange(min=0), default=REMINDER_LEAD_HOURS, show_default=True,
+              help="Remind this many hours before an event starts.")
+@click.option("--sink", type=click.Choice(["file", "smtp"]), default=REMINDER_SINK, show_default=True,
+              help="Where reminders are delivered.")
+@click.option("--file", "path", type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help="JSON-lines file for the file sink (default: REMINDER_FILE).")
+@click.option("--smtp-host", default=None, help="SMTP server for the smtp sink (default: REMINDER_SMTP_HOST).")
+@click.option("--smtp-port", type=int, default=None, help="SMTP port (default: REMINDER_SMTP_PORT).")
+@click.option("--once", is_flag=True, help="Send the reminders due now and exit instead of running.")
+@role_required(["gestion"])
+def run(lead_hours, sink, path, smtp_host, smtp_port, once):
+    """▶️ Run the reminder scheduler until Ctrl-C."""
+    render_command_banner("Event Reminders", "Notifying support staff of upcoming events.")
+    run_reminders_logic(lead_hours, sink, path, smtp_host, smtp_port, once)
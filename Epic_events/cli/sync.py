@@ -0,0 +1,28 @@
+"""
+🔄 Sync Command Handler for Epic Events CRM
+
+This module defines the `sync` command, which refreshes the local read-only snapshot
+used to serve read-only commands without a round-trip to the central database.
+"""
+
+# 🥉 External Imports ──────────────────────────────────────────
+import rich_click as click
+
+# 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.auth.permissions import role_required
+from Epic_events.service.sync_service import sync_snapshot_logic
+from Epic_events.completion import refresh_id_cache
+from Epic_events.rich_styles import render_command_banner
+
+
+# ─── 🔄 Snapshot Sync ──────────────────────────────
+@click.command(name="sync")
+@click.option("--full", is_flag=True, help="Ignore watermarks and copy every row again.")
+@role_required(["gestion", "commercial", "support"])
+def sync(full):
+    """🔄 Pull recent changes into the local read-only snapshot."""
+    render_command_banner("Sync Snapshot",
+                          "Copy rows changed since the last sync into the local snapshot.\n"
+                          "Read-only listings use it while it is fresh; writes still go to the server.")
+    sync_snapshot_logic(full=full)
+    refresh_id_cache(full=full)  # Shell completion reads IDs from this cache
@@ -8,12 +8,9 @@ are integrated to ensure secure operations.
 
 # 🥉 External Imports ──────────────────────────────────────────
 import rich_click as click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
 
 # 🏗️ Internal Imports ──────────────────────────────────────────
+from Epic_events.completion import complete_ids
 from Epic_events.auth.permissions import role_required, attach_sentry_user
 from Epic_events.service.user_service import (
     register_user_logic,
@@ -25,21 +22,8 @@ from Epic_events.service.user_service import (
     update_user_role_logic,
     list_user_details_logic,
 )
-
-console = Console()
-
-
-# 🖼️ Utility for rendering rich CLI banners ─────────────────────────────
-def render_command_banner(title: str, message: str):
-    banner = Panel(
-        Text(message, justify="left", style="bold yellow"),
-        title=f"[bold magenta]{title}[/bold magenta]",
-        subtitle="[italic cyan]Your Command-Line CRM[/italic cyan]",
-        border_style="green",
-        padding=(1, 2),
-        expand=False
-    )
-    console.print(Align.left(banner))
+from Epic_events.cli.options import SINCE_OPTION
+from Epic_events.rich_styles import render_command_banner
 
 
 # ─── 👤 User Command Group ──────────────────────────────
@@ -83,50 +67,46 @@ def logout():
 
 # 📝 CLI Commands: User Registration ───────────────────────────
 @user.command(name="register-admin")
-def register_admin():
+@click.option("--name", prompt="🧑 Name", help="Full name.")
+@click.option("--email", prompt="📧 Email", help="Login email.")
+@click.option("--password", prompt="🔑 Password", hide_input=True, confirmation_prompt=True,
+              help="Password (prompted with confirmation when omitted).")
+def register_admin(name, email, password):
     """👑 Register the first admin user (role: 'gestion')."""
     render_command_banner("Register Admin",
                           "Create the first administrative user with gestion privileges.")
     click.secho("👑 Registering a new admin user...", fg="cyan")
-    name = click.prompt("🧑 Name")
-    email = click.prompt("📧 Email")
-    password = click.prompt("🔑 Password", hide_input=True, confirmation_prompt=True)
     role = 'gestion'
     register_user_logic(name, email, password, role)
 
 
 @user.command(name="register-user")
+@click.option("--name", prompt="🧑 Name", help="Full name.")
+@click.option("--email", prompt="📧 Email", help="Login email.")
+@click.option("--password", prompt="🔑 Password", hide_input=True, confirmation_prompt=True,
+              help="Password (prompted with confirmation when omitted).")
+@click.option("--role", prompt="🥉 Role", type=click.Choice(['commercial', 'gestion', 'support']),
+              help="Access role.")
 @attach_sentry_user
 @role_required(["gestion"])
-def register_user():
+def register_user(name, email, password, role):
     """➕ Register a new user (requires 'gestion' privileges)."""
     render_command_banner("Register User", "Add a new user and assign their access role.")
     click.secho("➕ Registering a new user...", fg="cyan")
-    name = click.prompt("🧑 Name")
-    email = click.prompt("📧 Email")
-    password = click.prompt("🔑 Password", hide_input=True, confirmation_prompt=True)
-    role = click.prompt("🥉 Role", type=click.Choice(['commercial', 'gestion', 'support']))
     register_user_logic(name, email, password, role)
 
 
 # 🛠️ CLI Commands: User Management ──────────────────────────
 @user.command(name="update-user-role")
+@click.option("--user-id", type=int, prompt="🔹 Enter user ID to modify",
+              shell_complete=complete_ids("users"))
+@click.option("--role", prompt="🥉 Enter new role",
+              type=click.Choice(['commercial', 'gestion', 'support'], case_sensitive=False), help="New role.")
 @attach_sentry_user
 @role_required(["gestion"])
-def update_user_role():
+def update_user_role(user_id, role):
     """🛠️ Change a user's role (requires 'gestion' privileges)."""
     render_command_banner("Update User Role", "Change the access level of an existing user.")
-    try:
-        user_id = click.prompt("🔹 Enter user ID to modify", type=int)
-    except click.Abort:
-        click.secho("❌ Aborted.", fg="red")
-        return
-
-    role = click.prompt(
-        "🥉 Enter new role",
-        type=click.Choice(['commercial', 'gestion', 'support'], case_sensitive=False)
-    )
-
     if update_user_role_logic(user_id=user_id, role=role):
         click.secho(f"✅ Role of user {user_id} updated to '{role}'.", fg="green")
     else:
@@ -134,13 +114,14 @@ def update_user_role():
 
 
 @user.command(name="delete")
+@click.option("--user-id", type=int, prompt="🔹 Enter the ID of the user to delete",
+              shell_complete=complete_ids("users"))
 @attach_sentry_user
 @role_required(["gestion"])
-def delete_user():
+def delete_user(user_id):
     """🗑️ Delete a user by their ID (requires 'gestion' privileges)."""
     render_command_banner("Delete User", "Remove a user account from the system.")
     try:
-        user_id = click.prompt("🔹 Enter the ID of the user to delete", type=int)
         if delete_user_by_id(user_id):
             click.secho(f"✅ User with ID {user_id} was successfully deleted.", fg="green")
         else:
@@ -151,12 +132,13 @@ def delete_user():
 
 # 📋 CLI Commands: Information ───────────────────────────
 @user.command()
+@SINCE_OPTION
 @role_required(["commercial", "gestion", "support"])
-def list_users():
+def list_users(since):
     """📋 Display a list of all registered users."""
     render_command_banner("List Users", "Display all registered users and their roles.")
     click.secho("📋 Listing all users...", fg="cyan")
-    list_users_logic()
+    list_users_logic(since=since)
 
 
 @user.command(name="list-details")
@@ -0,0 +1,355 @@
+"""
+⌨️ Shell Completion for Entity IDs in Epic Events CRM
+
+Options and arguments taking a client, contract, event or user ID complete from a small
+JSON file of IDs and display names. Completion only reads that file, so pressing Tab never
+opens a database connection.
+
+The file also holds a description of the command tree (subcommands, options and which
+parameters take IDs). `complete_from_cache` answers the shell from it before main.py
+imports the CLI, SQLAlchemy or Sentry, so Tab costs little more than starting Python.
+Anything it cannot answer (choices, file paths) falls back to click's own completion.
+
+The file is refreshed incrementally (rows changed since the last refresh, plus a cheap
+ID-only pass to drop deleted rows) by `sync`. Completion itself starts the refresh in a
+background process when the file is older than ID_CACHE_MAX_AGE_SECONDS or than the
+last write, and answers from the current file meanwhile.
+
+This module only imports the standard library and the config at load time; database
+and click imports happen inside the functions that need them.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import json
+import os
+import shlex
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .config import ID_CACHE_PATH, ID_CACHE_MAX_AGE_SECONDS, LAST_WRITE_FILE, CHANGE_OVERLAP_SECONDS
+
+
+MAX_COMPLETIONS = 50
+REFRESH_LOCK = ID_CACHE_PATH.with_suffix(".refreshing")
+REFRESH_LOCK_SECONDS = 60  # A lock older than this belongs to a refresh that died
+
+
+# 🧭 Cached Entities ────────────────────────────────────────────────
+def _label_user(row):
+    return f"{row.name} ({row.role.value})", row.role.value
+
+
+def _label_client(row):
+    return f"{row.full_name} · {row.company_name}", None
+
+
+def _label_contract(row):
+    status = "signed" if row.is_signed else "unsigned"
+    return f"{row.full_name} · {row.amount_due}/{row.amount_total} due · {status}", None
+
+
+def _label_event(row):
+    return f"{row.event_name} · {row.start_date:%d-%m-%Y}", None
+
+
+def cached_entities() -> dict:
+    """kind -> (primary key, change column, columns to label, label function)."""
+    from .models import User, Client, Contract, Event
+
+    return {
+        "users": (User.user_id, User.updated_at, [User.user_id, User.name, User.role], _label_user),
+        "clients": (Client.client_id, Client.updated_at,
+                    [Client.client_id, Client.full_name, Client.company_name], _label_client),
+        "contracts": (Contract.contract_id, Contract.updated_at,
+                      [Contract.contract_id, Client.full_name, Contract.amount_due, Contract.amount_total,
+                       Contract.is_signed], _label_contract),
+        "events": (Event.event_id, Event.updated_at,
+                   [Event.event_id, Event.event_name, Event.start_date], _label_event),
+    }
+
+
+# 📥 Read the Cache ─────────────────────────────────────────────────
+def load_id_cache() -> dict:
+    """Return the cache content, or an empty cache when the file is missing or unreadable."""
+    try:
+        with open(ID_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"refreshed_at": 0, "watermarks": {}, "entities": {}}
+
+
+def matching_ids(cache: dict, kind: str, role: str, incomplete: str) -> list[tuple[str, str]]:
+    """
+    (ID, label) pairs of `kind` matching `incomplete`.
+
+    Digits match ID prefixes; anything else matches the display name, case-insensitively.
+    `role` restricts user IDs to one role (e.g. "support").
+    """
+    needle = incomplete.lower()
+    found = []
+    for entity_id, (label, tag) in cache["entities"].get(kind, {}).items():
+        if role is not None and tag != role:
+            continue
+        if entity_id.startswith(incomplete) or (needle and not needle.isdigit() and needle in label.lower()):
+            found.append((entity_id, label))
+            if len(found) >= MAX_COMPLETIONS:
+                break
+    return found
+
+
+def complete_ids(kind: str, role: str = None):
+    """Build a click `shell_complete` callback for IDs of `kind` ("users", "clients", ...)."""
+    def complete(ctx, param, incomplete: str):
+        from click.shell_completion import CompletionItem
+
+        return [CompletionItem(entity_id, help=label)
+                for entity_id, label in matching_ids(load_id_cache(), kind, role, incomplete)]
+
+    complete.kind, complete.role = kind, role  # Read by `describe_cli` for the fast path
+    return complete
+
+
+# ⚡ Fast Path (before the CLI is imported) ──────────────────────────
+def _split(line: str) -> list[str]:
+    """Split like a shell, keeping a trailing unclosed quote as a partial word (as click does)."""
+    lexer = shlex.shlex(line, posix=True)
+    lexer.whitespace_split, lexer.commenters = True, ""
+    words = []
+    try:
+        words.extend(lexer)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _completion_args(shell: str) -> tuple[list[str], str]:
+    """Words before the cursor and the word being completed, as click reads them."""
+    words = _split(os.environ.get("COMP_WORDS", ""))
+    if shell == "fish":
+        incomplete = (_split(os.environ.get("COMP_CWORD", "")) or [""])[0]
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+    cword = int(os.environ.get("COMP_CWORD", 0))
+    return words[1:cword], words[cword] if cword < len(words) else ""
+
+
+def _format(shell: str, value: str, help_text: str) -> str:
+    """One completion in the format of click's completion scripts."""
+    if shell == "zsh":
+        value = value.replace(":", "\\:") if help_text else value  # zsh `_describe` splits on ":"
+        return f"plain\n{value}\n{help_text or '_'}"
+    if shell == "fish" and help_text:
+        return f"plain,{value}\t{help_text}"
+    return f"plain,{value}"
+
+
+def _candidates(cache: dict, args: list[str], incomplete: str):
+    """
+    Completions from the cached command tree and IDs, or None when click must answer.
+
+    Returns:
+        list[tuple[str, str]] | None: (value, help) pairs.
+    """
+    spec = cache["cli"]
+    path, positional, pending = "", 0, None
+    for arg in args:
+        command = spec[path]
+        if pending is not None:
+            pending = None
+        elif arg in command["subcommands"]:
+            path, positional = f"{path} {arg}".strip(), 0
+        elif arg.startswith("-"):
+            option = command["options"].get(arg.split("=", 1)[0])
+            if option is None:
+                return None
+            if option["value"] and "=" not in arg:
+                pending = option
+        else:
+            positional += 1
+
+    command = spec[path]
+    if pending is not None:
+        return None if pending["ids"] is None else matching_ids(cache, *pending["ids"], incomplete)
+    if incomplete.startswith("-"):
+        return [(name, option["help"]) for name, option in sorted(command["options"].items())
+                if name.startswith(incomplete)]
+    if command["subcommands"]:
+        return [(name, command["help"].get(name, "")) for name in command["subcommands"]
+                if name.startswith(incomplete)]
+    if positional < len(command["arguments"]) and command["arguments"][positional] is not None:
+        return matching_ids(cache, *command["arguments"][positional], incomplete)
+    return None
+
+
+def complete_from_cache(instruction: str) -> bool:
+    """
+    Answer a `<shell>_complete` request from the cache file alone.
+
+    Args:
+        instruction: Value of _EPIC_COMPLETE, e.g. "bash_complete".
+
+    Returns:
+        True if the completions were printed; False to let click answer.
+    """
+    shell, _, action = instruction.partition("_")
+    if action != "complete" or shell not in ("bash", "zsh", "fish"):
+        return False
+    cache = load_id_cache()
+    refresh_in_background_if_stale(cache)
+    if not cache.get("cli"):
+        return False
+
+    args, incomplete = _completion_args(shell)
+    try:
+        found = _candidates(cache, args, incomplete)
+    except (KeyError, IndexError, ValueError):
+        return False
+    if found is None:
+        return False
+    print("\n".join(_format(shell, value, help_text) for value, help_text in found))
+    return True
+
+
+# 🔄 Refresh the Cache ──────────────────────────────────────────────
+def _write_id_cache(cache: dict):
+    """Replace the cache file atomically so a concurrent Tab never reads half a file."""
+    ID_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=ID_CACHE_PATH.parent, prefix=".epic_ids_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, ID_CACHE_PATH)
+
+
+def describe_cli(root) -> dict:
+    """
+    Command path -> subcommands, options and ID parameters of every command under `root`.
+
+    Written into the cache so `complete_from_cache` needs neither click nor the CLI modules.
+    """
+    import click
+
+    spec = {}
+
+    def walk(command, path):
+        subcommands = getattr(command, "commands", {})
+        entry = {"subcommands": sorted(subcommands),
+                 "help": {name: sub.get_short_help_str(80) for name, sub in subcommands.items()},
+                 "options": {"--help": {"value": False, "ids": None, "help": "Show this message and exit."}},
+                 "arguments": []}
+        for param in command.params:
+            complete = getattr(param, "_custom_shell_complete", None)
+            ids = [complete.kind, complete.role] if hasattr(complete, "kind") else None
+            if isinstance(param, click.Option):
+                if param.hidden:
+                    continue
+                for name in param.opts + param.secondary_opts:
+                    entry["options"][name] = {"value": not (param.is_flag or param.count), "ids": ids,
+                                              "help": (param.help or "").split("\n")[0]}
+            else:
+                entry["arguments"].append(ids)
+        spec[path] = entry
+        for name, sub in subcommands.items():
+            walk(sub, f"{path} {name}".strip())
+
+    walk(root, "")
+    return spec
+
+
+def refresh_id_cache(full: bool = False) -> dict:
+    """
+    Pull rows changed since the last refresh into the ID cache and drop deleted IDs.
+
+    Args:
+        full: Ignore watermarks and rebuild every entry.
+
+    Returns:
+        The number of cached IDs per kind.
+    """
+    from sqlalchemy import select
+    from .database import ReadSessionLocal
+    from .models import Client, Contract
+    from .cli import cli
+
+    cache = {"refreshed_at": 0, "watermarks": {}, "entities": {}} if full else load_id_cache()
+    started = time.time()
+    session = ReadSessionLocal()
+    try:
+        for kind, (pk, change_column, columns, label) in cached_entities().items():
+            entries = cache["entities"].setdefault(kind, {})
+            query = select(*columns)
+            if kind == "contracts":
+                query = query.join(Client, Client.client_id == Contract.client_id)
+            watermark = cache["watermarks"].get(kind)
+            if watermark:
+                since = datetime.fromisoformat(watermark) - timedelta(seconds=CHANGE_OVERLAP_SECONDS)
+                query = query.where(change_column >= since)
+
+            for row in session.execute(query.add_columns(change_column.label("changed_at"))):
+                entries[str(row[0])] = list(label(row))
+                if row.changed_at and (not watermark or row.changed_at.isoformat() > watermark):
+                    watermark = row.changed_at.isoformat()
+
+            live_ids = {str(entity_id) for entity_id in session.scalars(select(pk))}
+            for stale_id in set(entries) - live_ids:
+                del entries[stale_id]
+            cache["watermarks"][kind] = watermark
+    finally:
+        session.close()
+
+    cache["cli"] = describe_cli(cli)
+    cache["refreshed_at"] = started
+    _write_id_cache(cache)
+    return {kind: len(entries) for kind, entries in cache["entities"].items()}
+
+
+def is_stale(cache: dict) -> bool:
+    """Older than ID_CACHE_MAX_AGE_SECONDS, or older than the last write made from this machine."""
+    refreshed_at = cache.get("refreshed_at", 0)
+    if time.time() - refreshed_at > ID_CACHE_MAX_AGE_SECONDS or "cli" not in cache:
+        return True
+    try:
+        return LAST_WRITE_FILE.stat().st_mtime > refreshed_at
+    except OSError:
+        return False
+
+
+def refresh_in_background_if_stale(cache: dict):
+    """Start one detached refresh process when the cache is stale; never waits for it."""
+    if not is_stale(cache):
+        return
+    try:
+        if time.time() - REFRESH_LOCK.stat().st_mtime < REFRESH_LOCK_SECONDS:
+            return  # Another Tab already started a refresh
+        REFRESH_LOCK.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.close(os.open(REFRESH_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except OSError:
+        return
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-c", "from Epic_events.completion import background_refresh; background_refresh()"],
+        cwd=Path(__file__).resolve().parent.parent, start_new_session=True,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def background_refresh():
+    """Entry point of the refresh process started by completion; never fails loudly."""
+    try:
+        refresh_id_cache()
+    except Exception:
+        pass  # Completion data is a convenience; a failed refresh is retried on a later Tab.
+    finally:
+        try:
+            REFRESH_LOCK.unlink()
+        except OSError:
+            pass
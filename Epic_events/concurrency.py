@@ -0,0 +1,111 @@
+"""
+🔀 Optimistic Concurrency for Epic Events CRM
+
+Clients, contracts and events carry a `version_id` column that SQLAlchemy checks and bumps
+on every UPDATE. An edit remembers the version it started from, collects the changes (slow,
+interactive prompts) without holding a transaction or lock, and writes them only if nobody
+else changed the row meanwhile. On a conflict, the user is shown both versions and chooses
+to overwrite, start again from the latest values, or cancel.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import click
+from sqlalchemy.orm.exc import StaleDataError
+from werkzeug.exceptions import NotFound
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .database import get_by_id, release_transaction
+from .rich_styles import build_table, console
+
+
+# 🔍 Version Check ──────────────────────────────────────────────────
+def check_version(entity, expected_version: int = None, label: str = "Record"):
+    """
+    Raise StaleDataError if `entity` no longer has the version the edit started from.
+
+    The UPDATE itself is also guarded by `version_id`, which covers the short window
+    between this check and the flush.
+    """
+    if expected_version is not None and entity.version_id != int(expected_version):
+        raise StaleDataError(
+            f"{label} was changed by someone else (now version {entity.version_id}, "
+            f"you edited version {expected_version})."
+        )
+
+
+# 🤝 Conflict Resolution Prompt ─────────────────────────────────────
+def ask_conflict_resolution(label: str, changes: dict, current) -> str:
+    """
+    Show the user's changes next to the latest stored values and ask how to proceed.
+
+    Returns:
+        "overwrite" (apply my changes on the latest version), "retry" (edit again from the
+        latest values) or "cancel".
+    """
+    console.print(f"[yellow]⚠️ {label} was modified by someone else while you were editing it.[/yellow]")
+    table = build_table(f"🔀 Conflict on {label}", ["🏷️ Field", "✏️ Your Value", "💾 Current Value"])
+    for field, value in changes.items():
+        table.add_row(field, str(value), str(getattr(current, field, "—")))
+    console.print(table)
+    return click.prompt(
+        "🔀 Overwrite with your values, retry from the latest version, or cancel?",
+        type=click.Choice(["overwrite", "retry", "cancel"]),
+        default="retry",
+    )
+
+
+# 🔁 Edit Loop ──────────────────────────────────────────────────────
+def edit_with_version_check(session, model, entity_id: int, label: str, collect, apply,
+                            expected_version: int = None, interactive: bool = True):
+    """
+    Run an optimistic edit of one row: remember its version, collect changes, write if unchanged.
+
+    Args:
+        session: Session used for the read and the write.
+        model: Mapped class with a `version_id_col`.
+        entity_id: Primary key of the row to edit.
+        label: Human-readable name used in messages, e.g. "Contract 12".
+        collect: Callable returning the dict of changes (prompts, or fixed data).
+        apply: Callable (session, expected_version, changes) that validates and flushes.
+        expected_version: Version the caller already saw (e.g. from --from-json); defaults to
+            the version loaded here.
+        interactive: When False, a conflict is raised instead of prompting.
+
+    Returns:
+        The applied changes; an empty dict if none were entered, None if the user cancelled.
+    """
+    entity = get_by_id(session, model, entity_id)
+    if entity is None:
+        raise NotFound(f"{label} not found.")
+    if expected_version is None:
+        expected_version = entity.version_id
+
+    changes = None
+    while True:
+        if changes is None:
+            # No transaction (hence no lock or stale SQLite snapshot) is kept while the user is typing.
+            release_transaction(session)
+            changes = collect()
+            if not changes:
+                return {}
+        release_transaction(session)
+        try:
+            apply(session, expected_version, dict(changes))
+            session.commit()
+            return changes
+        except StaleDataError:
+            session.rollback()
+            if not interactive:
+                raise
+            current = get_by_id(session, model, entity_id)
+            if current is None:
+                raise NotFound(f"{label} was deleted by someone else.")
+            expected_version = current.version_id
+            session.expunge(current)  # Keeps its loaded values for the prompt below
+            release_transaction(session)
+            choice = ask_conflict_resolution(label, changes, current)
+            if choice == "cancel":
+                click.secho("🚫 Update cancelled; nothing was written.", fg="yellow")
+                return None
+            if choice == "retry":
+                changes = None
@@ -22,8 +22,89 @@ load_dotenv(dotenv_path=env_path)
 # Should be set in .env for production security.
 SECRET_KEY = os.getenv("SECRET_KEY")
 
-# 🗄️ PostgreSQL connection URL, used to initialize SQLAlchemy.
-DATABASE_URL = os.getenv("DATABASE_URL")
+# 🗃️ Local SQLite file used by the embedded profile (offline / edge use).
+SQLITE_PATH = Path(os.getenv("SQLITE_PATH", "~/.epic_crm.db")).expanduser()
+
+# 🗄️ Database connection URL, used to initialize SQLAlchemy.
+# Falls back to the embedded SQLite profile when no server URL is configured.
+DATABASE_URL = os.getenv("DATABASE_URL") or f"sqlite:///{SQLITE_PATH}"
+
+# ⚡ SQLite pragmas applied on every new connection (embedded profile only).
+# mmap size is in bytes; a negative cache size is expressed in KiB (SQLite convention).
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", -64 * 1024))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
 
 # 📂 Path to the local token file for storing the JWT token.
 TOKEN_FILE = Path(token_path).expanduser()
+
+# 📦 Local read-only snapshot used by `sync` and served to read-only commands.
+SNAPSHOT_PATH = Path(os.getenv("SNAPSHOT_PATH", "~/.epic_crm_snapshot.db")).expanduser()
+
+# ⏳ How old (in minutes) the snapshot may be before reads go back to the primary.
+SNAPSHOT_MAX_AGE_MINUTES = int(os.getenv("SNAPSHOT_MAX_AGE_MINUTES", 15))
+
+# 🪞 Optional read replica. When set, listings and detail views read from it.
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# 🧲 Read-your-writes window (seconds): reads stay on the primary this long after a write.
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", 10))
+
+# 🐢 Replica lag guard (seconds): reads fall back to the primary beyond this lag.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
+
+# 🔁 Overlap (seconds) re-read behind each incremental watermark (sync, ID cache, reminders).
+# Change times are stamped when a statement runs, so a row can commit after a later-stamped one.
+CHANGE_OVERLAP_SECONDS = float(os.getenv("CHANGE_OVERLAP_SECONDS", 60))
+
+# 🕒 Marker file recording the last write, shared by successive CLI invocations.
+LAST_WRITE_FILE = Path(os.getenv("LAST_WRITE_FILE", "~/.epic_crm_last_write")).expanduser()
+
+# 🗓️ PostgreSQL only: partition `events` by month on start_date (set EVENTS_PARTITIONED=1).
+EVENTS_PARTITIONED = os.getenv("EVENTS_PARTITIONED", "0") == "1" and DATABASE_URL.startswith("postgresql")
+
+# 📆 Number of future monthly partitions kept ready ahead of time.
+EVENT_PARTITION_MONTHS_AHEAD = int(os.getenv("EVENT_PARTITION_MONTHS_AHEAD", 12))
+
+# 🗄️ Default retention (days) for `event archive` when no --before date is given.
+EVENT_RETENTION_DAYS = int(os.getenv("EVENT_RETENTION_DAYS", 365))
+
+# ⌨️ Local cache of IDs and display names read by shell completion (no DB connection).
+ID_CACHE_PATH = Path(os.getenv("ID_CACHE_PATH", "~/.epic_crm_ids.json")).expanduser()
+
+# ⏳ Age (seconds) after which a finished command refreshes the ID cache incrementally.
+ID_CACHE_MAX_AGE_SECONDS = int(os.getenv("ID_CACHE_MAX_AGE_SECONDS", 300))
+
+# 🗂️ Result cache for list commands: "0" disables it entirely.
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE", "1") == "1"
+
+# 💾 Directory for the on-disk result cache shared by successive commands (unset: in-process only).
+RESULT_CACHE_DIR = Path(os.environ["RESULT_CACHE_DIR"]).expanduser() if os.getenv("RESULT_CACHE_DIR") else None
+
+# ⏱️ Per-statement timeout in seconds (0: no limit); `--timeout` overrides it for one command.
+STATEMENT_TIMEOUT_SECONDS = float(os.getenv("STATEMENT_TIMEOUT_SECONDS", 30))
+
+# 🔒 PostgreSQL only: longest wait for a row lock, capped by the statement timeout (0: no limit).
+LOCK_TIMEOUT_SECONDS = float(os.getenv("LOCK_TIMEOUT_SECONDS", 10))
+
+# ⏰ `reminders run`: remind support staff this many hours before an event starts.
+REMINDER_LEAD_HOURS = float(os.getenv("REMINDER_LEAD_HOURS", 24))
+
+# 🔭 Hours of upcoming reminders loaded into the scheduler's timer heap per refill.
+REMINDER_LOOKAHEAD_HOURS = float(os.getenv("REMINDER_LOOKAHEAD_HOURS", 6))
+
+# 📬 Reminders falling due within this many minutes of each other are sent as one batch.
+REMINDER_BATCH_MINUTES = float(os.getenv("REMINDER_BATCH_MINUTES", 5))
+
+# 📨 Reminder sink: "file" (JSON lines at REMINDER_FILE) or "smtp" (REMINDER_SMTP_HOST:PORT).
+REMINDER_SINK = os.getenv("REMINDER_SINK", "file")
+REMINDER_FILE = Path(os.getenv("REMINDER_FILE", "~/.epic_crm_reminders.jsonl")).expanduser()
+REMINDER_SMTP_HOST = os.getenv("REMINDER_SMTP_HOST", "localhost")
+REMINDER_SMTP_PORT = int(os.getenv("REMINDER_SMTP_PORT", 1025))
+REMINDER_SMTP_FROM = os.getenv("REMINDER_SMTP_FROM", "reminders@epic-events.local")
+
+# 🙋 Address that receives reminders for events with no support assigned (unset: file sink only).
+REMINDER_UNASSIGNED_TO = os.getenv("REMINDER_UNASSIGNED_TO")
+
+# 💾 Start time of the last event reminded, so a restarted scheduler neither repeats nor skips.
+REMINDER_STATE_FILE = Path(os.getenv("REMINDER_STATE_FILE", "~/.epic_crm_reminders_state.json")).expanduser()
@@ -0,0 +1,139 @@
+"""
+🔢 Denormalized Client Counters for Epic Events CRM
+
+Each client row carries `open_contracts`, `unsigned_contracts`, `total_due` and
+`upcoming_events`, so listings can show and sort by them without a correlated
+subquery per row.
+
+Flushes of contracts and events mark their client (old and new, on a reassignment)
+as touched. Core statements that bypass the ORM (payments, archiving) mark clients
+explicitly with `touch_client_counters`. Just before the session commits, the
+counters of every touched client are recomputed with one set-based UPDATE in the
+same transaction. A rolled-back savepoint only makes the recount cover a few extra
+clients.
+
+A recount alone is not enough under PostgreSQL READ COMMITTED. Two transactions adding
+contracts to the same client would each count from their own snapshot, and the last
+commit would overwrite the other's count. So the touched client rows are first locked
+(`SELECT ... FOR NO KEY UPDATE`, in client_id order). The second transaction waits for
+the first to commit, and its recount, a new statement with a new snapshot, sees both
+contracts. NO KEY UPDATE does not conflict with the KEY SHARE locks taken by inserting a
+contract or event for the client. SQLite serializes writers anyway.
+
+`upcoming_events` ages as events start; `rebuild_client_counters` (run by
+`client rebuild-counters`) recounts every client and reports how many were off.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+from datetime import datetime, UTC
+from itertools import chain
+
+from sqlalchemy import event, select, update, func, or_, inspect
+from sqlalchemy.orm import Session
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .models import Client, Contract, Event, utcnow
+
+
+TOUCHED_CLIENTS = "touched_client_counters"
+COUNTERS = ("open_contracts", "unsigned_contracts", "total_due", "upcoming_events")
+CHUNK_SIZE = 500  # Client IDs per UPDATE, below SQLite's bound-parameter limit
+
+
+# 🧮 Set-Based Recount ──────────────────────────────────────────────
+def client_counter_values(client_ids=None, now: datetime = None):
+    """SELECT of (client_id, *COUNTERS) computed from contracts and events, optionally for some clients."""
+    now = now or datetime.now(UTC)
+    contracts = select(
+        Contract.client_id,
+        func.count().filter(Contract.is_signed.is_(True), Contract.amount_due > 0).label("open_contracts"),
+        func.count().filter(Contract.is_signed.is_(False)).label("unsigned_contracts"),
+        func.sum(Contract.amount_due).label("total_due"),
+    ).group_by(Contract.client_id)
+    events = (select(Event.client_id, func.count().label("upcoming_events"))
+              .where(Event.start_date > now).group_by(Event.client_id))
+    clients = select(Client.client_id)
+    if client_ids is not None:
+        contracts = contracts.where(Contract.client_id.in_(client_ids))
+        events = events.where(Event.client_id.in_(client_ids))
+        clients = clients.where(Client.client_id.in_(client_ids))
+    contracts, events = contracts.subquery(), events.subquery()
+
+    return (
+        clients.add_columns(*(func.coalesce(source.c[name], 0).label(name)
+                              for source, name in ((contracts, "open_contracts"), (contracts, "unsigned_contracts"),
+                                                   (contracts, "total_due"), (events, "upcoming_events"))))
+        .outerjoin(contracts, contracts.c.client_id == Client.client_id)
+        .outerjoin(events, events.c.client_id == Client.client_id)
+    )
+
+
+def lock_clients(session: Session, client_ids=None):
+    """Lock the rows of `client_ids` (every client if None) in client_id order until commit."""
+    query = select(Client.client_id).order_by(Client.client_id).with_for_update(key_share=True)
+    if client_ids is not None:
+        query = query.where(Client.client_id.in_(client_ids))
+    session.execute(query).all()
+
+
+def refresh_client_counters(session: Session, client_ids=None, now: datetime = None) -> int:
+    """
+    Recount the counters of `client_ids` (every client if None) and write those that differ.
+
+    The client rows are locked first (see the module docstring), so concurrent recounts
+    of the same client run one after the other. `last_contact` is kept as is: a recount
+    is not a contact with the client. `updated_at` is stamped, so sync and `--since`
+    see the new counters. The version is not bumped, so it never conflicts with an edit
+    in progress.
+
+    Returns:
+        Number of clients whose counters were corrected.
+    """
+    batches = [None] if client_ids is None else [
+        sorted(client_ids)[start:start + CHUNK_SIZE] for start in range(0, len(client_ids), CHUNK_SIZE)
+    ]
+    corrected = 0
+    for batch in batches:
+        lock_clients(session, batch)
+        values = client_counter_values(batch, now).subquery()
+        corrected += session.execute(
+            update(Client)
+            .where(Client.client_id == values.c.client_id,
+                   or_(*(getattr(Client, name) != values.c[name] for name in COUNTERS)))
+            .values(last_contact=Client.last_contact, updated_at=utcnow(),
+                    **{name: values.c[name] for name in COUNTERS})
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    return corrected
+
+
+def rebuild_client_counters(session: Session) -> int:
+    """Recount every client's counters; returns how many were wrong."""
+    return refresh_client_counters(session)
+
+
+# 📝 Track Touched Clients ──────────────────────────────────────────
+def touch_client_counters(session: Session, *client_ids):
+    """Mark clients whose counters must be recounted before `session` commits."""
+    session.info.setdefault(TOUCHED_CLIENTS, set()).update(cid for cid in client_ids if cid is not None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_touched_clients(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (Contract, Event)) and (obj not in session.dirty or session.is_modified(obj)):
+            history = inspect(obj).attrs.client_id.history
+            touch_client_counters(session, obj.client_id, *history.deleted)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_touched_clients(session):
+    session.flush()  # The commit's own flush comes after this hook; catch its changes here
+    client_ids = session.info.pop(TOUCHED_CLIENTS, None)
+    if client_ids:
+        refresh_client_counters(session, client_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_touched_clients(session):
+    session.info.pop(TOUCHED_CLIENTS, None)
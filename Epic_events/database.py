@@ -3,20 +3,206 @@
 
 This module sets up the SQLAlchemy engine, session, and base class.
 It also provides a function to initialize the database schema using all defined models.
+Both PostgreSQL and an embedded SQLite file (offline / edge profile) are supported.
+
+Writes use `SessionLocal` (primary). Listings and detail views use `ReadSessionLocal`,
+which reads from the optional replica unless a recent write or replica lag requires the primary.
 """
 
 # ─── External Imports ───────────────────────────────────────────────
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+
+from sqlalchemy import create_engine, event, text, select
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 
 # ⚙️ Load Configuration ─────────────────────────────────────────────
-from .config import DATABASE_URL  # Cleanly imported from config
+from .config import (  # Cleanly imported from config
+    DATABASE_URL,
+    DATABASE_REPLICA_URL,
+    EVENTS_PARTITIONED,
+    LAST_WRITE_FILE,
+    READ_YOUR_WRITES_SECONDS,
+    REPLICA_MAX_LAG_SECONDS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+)
+from .timeouts import install_query_timeouts
+
+
+WRITE_TRANSACTION = "epic_write_transaction"  # Execution option marking the sessions that write
+
+
+# 🗃️ SQLITE PROFILE ──────────────────────────────────────────────────
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection for a local, mostly-read workload.
+
+    WAL lets readers run while a writer commits, synchronous=NORMAL is durable
+    in WAL mode without an fsync per commit, and foreign keys are off by default
+    in SQLite so they are switched on here to match the server behaviour.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see `begin_sqlite_transaction`); pysqlite's own
+    # implicit transactions start too late for SAVEPOINTs to nest correctly.
+    dbapi_connection.isolation_level = None
+
+
+def begin_sqlite_transaction(conn):
+    """
+    Open the SQLite transaction explicitly so `Session.begin_nested()` savepoints work.
+
+    Write sessions (`SessionLocal`) start with `BEGIN IMMEDIATE`. It waits for the write lock
+    up front, within `busy_timeout`. A deferred `BEGIN` would read first and fail at once with
+    "database is locked" (SQLITE_BUSY_SNAPSHOT) when it later writes after a concurrent
+    commit, because `busy_timeout` does not apply to that case. Read sessions stay deferred.
+    """
+    conn.exec_driver_sql("BEGIN IMMEDIATE" if conn.get_execution_options().get(WRITE_TRANSACTION) else "BEGIN")
+
+
+def make_engine(url: str):
+    """
+    Create an engine for the given URL, applying the SQLite profile when relevant
+    and the statement timeouts (see `Epic_events/timeouts.py`).
+
+    Args:
+        url (str): SQLAlchemy database URL.
+
+    Returns:
+        Engine: A configured SQLAlchemy engine.
+    """
+    new_engine = create_engine(url)
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine, "connect", apply_sqlite_pragmas)
+        event.listen(new_engine, "begin", begin_sqlite_transaction)
+    install_query_timeouts(new_engine)
+    return new_engine
 
 
 # 🛠️ DATABASE ENGINE & SESSION ──────────────────────────────────────
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine)
+engine = make_engine(DATABASE_URL)
+replica_engine = make_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+SessionLocal = sessionmaker(bind=engine, execution_options={WRITE_TRANSACTION: True})
+
+
+def release_transaction(session):
+    """
+    End the session's transaction before prompting the user.
+
+    On SQLite a write session holds the write lock from its first statement, so it must not
+    stay open while someone is typing. Loaded objects are expired and reload on next use.
+    """
+    session.rollback()
+
+
+# 🧲 READ-YOUR-WRITES STICKINESS ─────────────────────────────────────
+def record_write():
+    """Remember that this user just wrote to the primary (shared across CLI invocations)."""
+    try:
+        LAST_WRITE_FILE.touch()
+    except OSError:
+        pass  # Stickiness is best-effort; never fail a committed write over it.
+
+
+def wrote_recently() -> bool:
+    """Return True if the last write happened within READ_YOUR_WRITES_SECONDS."""
+    try:
+        return time.time() - LAST_WRITE_FILE.stat().st_mtime < READ_YOUR_WRITES_SECONDS
+    except OSError:
+        return False
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _record_committed_write(session):
+    if session.info.pop("wrote", False):
+        record_write()
+
+
+# 🐢 REPLICA LAG GUARD ───────────────────────────────────────────────
+REPLICA_LAG_QUERIES = {
+    # 0 when the replica has replayed everything it received, else seconds since the last replay.
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+}
+
+
+def replica_lag_seconds():
+    """
+    Measure the replica's replication lag in seconds.
+
+    Returns:
+        float | None: The lag, 0 when the dialect cannot report it, or None if the replica is unreachable.
+    """
+    query = REPLICA_LAG_QUERIES.get(replica_engine.dialect.name)
+    try:
+        with replica_engine.connect() as conn:
+            return float(conn.execute(text(query)).scalar() or 0) if query else 0.0
+    except Exception:
+        return None
+
+
+def choose_read_engine():
+    """Pick the engine for a read-only session: replica when safe, primary otherwise."""
+    if replica_engine is None or wrote_recently():
+        return engine
+    lag = replica_lag_seconds()
+    if lag is None or lag > REPLICA_MAX_LAG_SECONDS:
+        return engine
+    return replica_engine
+
+
+# 🔀 ROUTING SESSION ─────────────────────────────────────────────────
+class RoutingSession(Session):
+    """
+    Session that serves reads from the replica and sends anything it writes to the primary.
+
+    The read engine is chosen once per session so every query in a command sees the same source.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            return engine
+        if "read_bind" not in self.info:
+            self.info["read_bind"] = choose_read_engine()
+        return self.info["read_bind"]
+
+
+ReadSessionLocal = sessionmaker(bind=engine, class_=RoutingSession)
+
+
+# 🔎 LOOKUP BY ID ────────────────────────────────────────────────────
+def get_by_id(session, model, entity_id):
+    """
+    Load one row by its ID column, or None.
+
+    Use this instead of `session.get`, which needs the whole primary key: with
+    EVENTS_PARTITIONED, `events` is keyed on (event_id, start_date).
+    """
+    id_column = model.__mapper__.primary_key[0]
+    return session.scalars(select(model).where(id_column == entity_id)).one_or_none()
+
 
 # 🧱 BASE ORM CLASS ──────────────────────────────────────────────────
 Base = declarative_base()
@@ -27,5 +213,10 @@ def init_db():
     """
     Initialize the database by importing all models and creating tables if they do not exist.
     """
-    from .models import User, Client, Contract, Event  # Ensure models are loaded
+    from .models import User, Client, Contract, Payment, Event, EventArchive, AuditLog, TableVersion  # Ensure models are loaded
+    from .partitioning import create_default_partition
+    from . import result_cache  # noqa: F401 (seeds table_versions when it is created)
     Base.metadata.create_all(bind=engine)
+    if EVENTS_PARTITIONED:
+        with engine.begin() as conn:
+            create_default_partition(conn)
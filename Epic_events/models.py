@@ -8,14 +8,16 @@ established to reflect business logic and ensure data integrity.
 
 # 📦 External & Internal Imports ───────────────────────────────────────
 # ─── External Imports ───────────────────────────────────────────────
-from sqlalchemy import Column, Integer, String, Enum, DateTime, ForeignKey, Boolean
-from sqlalchemy.dialects.mysql import VARCHAR
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Enum, DateTime, ForeignKey, Boolean, JSON, Index
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql.expression import FunctionElement
 from datetime import datetime, UTC
 import enum
 
 # ─── Internal Imports ───────────────────────────────────────────────
 from .database import Base
+from .config import EVENTS_PARTITIONED
 
 
 # 🧩 ENUMS ────────────────────────────────────────────────────────────
@@ -25,6 +27,35 @@ class UserRole(enum.Enum):
     support = "support"
 
 
+# 🕒 SERVER TIME ──────────────────────────────────────────────────────
+class utcnow(FunctionElement):
+    """
+    Naive UTC time read from the database server, for the change-time columns.
+
+    Stamping `updated_at` / `last_contact` in SQL keeps every client on one clock. The value
+    is still taken when the statement runs, not at commit, so incremental readers re-read
+    an overlap window (CHANGE_OVERLAP_SECONDS) behind their last watermark.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # Microsecond text, the same format SQLAlchemy writes for Python datetimes
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 # 👤 USER MODEL ──────────────────────────────────────────────────────
 class User(Base):
     __tablename__ = 'users'
@@ -32,10 +63,12 @@ class User(Base):
     user_id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
-    password = Column(String, nullable=False)  # Reminder: hash before storing
+    # Reminder: hash before storing. Deferred: the local snapshot keeps no copy of the hashes
+    password = deferred(Column(String, nullable=False))
     role = Column(Enum(UserRole), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC), nullable=False)
+    updated_at = Column(DateTime, default=utcnow(), onupdate=utcnow(), server_default=utcnow(), nullable=False,
+                        index=True)
 
     # Relationships
     clients = relationship("Client", back_populates="commercial", passive_deletes=True)
@@ -50,11 +83,21 @@ class Client(Base):
     client_id = Column(Integer, primary_key=True)
     full_name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
-    phone = Column(VARCHAR(20), nullable=False)
+    phone = Column(String(20), nullable=False)
     company_name = Column(String, nullable=False)
     created_date = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
-    last_contact = Column(DateTime, default=lambda: datetime.now(UTC),
-                          onupdate=lambda: datetime.now(UTC), nullable=False)
+    last_contact = Column(DateTime, default=utcnow(), onupdate=utcnow(), server_default=utcnow(),
+                          nullable=False, index=True)
+    # Change time of any column, counter recounts included (sync and `--since` read this one)
+    updated_at = Column(DateTime, default=utcnow(), onupdate=utcnow(), server_default=utcnow(),
+                        nullable=False, index=True)
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Denormalized counters, kept current at commit by Epic_events/counters.py
+    open_contracts = Column(Integer, nullable=False, default=0, server_default="0")  # Signed, not fully paid
+    unsigned_contracts = Column(Integer, nullable=False, default=0, server_default="0")
+    total_due = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+    upcoming_events = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Foreign key
     commercial_id = Column(Integer, ForeignKey('users.user_id', ondelete='SET NULL'), nullable=True)
@@ -64,6 +107,9 @@ class Client(Base):
     contracts = relationship("Contract", back_populates="client", passive_deletes=True)
     events = relationship("Event", back_populates="client")
 
+    # Optimistic concurrency: every UPDATE checks and bumps version_id (StaleDataError on conflict).
+    __mapper_args__ = {"version_id_col": version_id}
+
 
 # 📄 CONTRACT MODEL ──────────────────────────────────────────────────
 class Contract(Base):
@@ -73,7 +119,10 @@ class Contract(Base):
     amount_total = Column(Integer, default=0, nullable=False)
     amount_due = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    updated_at = Column(DateTime, default=utcnow(), onupdate=utcnow(), server_default=utcnow(),
+                        nullable=False, index=True)
     is_signed = Column(Boolean, nullable=False, default=False)
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Foreign keys
     client_id = Column(Integer, ForeignKey('clients.client_id', ondelete='RESTRICT'), nullable=False)
@@ -83,18 +132,49 @@ class Contract(Base):
     client = relationship("Client", back_populates="contracts")
     commercial = relationship("User", back_populates="contracts")
     events = relationship("Event", back_populates="contract")
+    payments = relationship("Payment", back_populates="contract")
+
+    __mapper_args__ = {"version_id_col": version_id}
+
+
+# 💳 PAYMENT MODEL ───────────────────────────────────────────────────
+class Payment(Base):
+    """Ledger of payments received on a contract; `amount_due` is decremented in the same transaction."""
+    __tablename__ = 'payments'
+
+    payment_id = Column(Integer, primary_key=True)
+    amount = Column(Integer, nullable=False)
+    amount_due_after = Column(Integer, nullable=False)
+    paid_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False, index=True)
+    reference = Column(String, nullable=True, unique=True)  # Bank reference: re-importing a statement is a no-op
+
+    # Foreign keys
+    contract_id = Column(Integer, ForeignKey('contracts.contract_id', ondelete='RESTRICT'), nullable=False,
+                         index=True)
+    recorded_by = Column(Integer, ForeignKey('users.user_id', ondelete='SET NULL'), nullable=True)
+
+    # Relationships
+    contract = relationship("Contract", back_populates="payments")
 
 
 # 🎉 EVENT MODEL ─────────────────────────────────────────────────────
 class Event(Base):
     __tablename__ = 'events'
+    # PostgreSQL declarative partitioning by month; the partition key must be part of the primary key.
+    # The primary key is then (event_id, start_date): look events up with a filter on event_id,
+    # never with `session.get(Event, event_id)`.
+    __table_args__ = {"postgresql_partition_by": "RANGE (start_date)"} if EVENTS_PARTITIONED else {}
 
-    event_id = Column(Integer, primary_key=True)
+    event_id = Column(Integer, primary_key=True, autoincrement=True)
     event_name = Column(String, nullable=False)
-    start_date = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    start_date = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False,
+                        primary_key=EVENTS_PARTITIONED, index=True)
     end_date = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
     location = Column(String, nullable=False)
     notes = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=utcnow(), onupdate=utcnow(), server_default=utcnow(),
+                        nullable=False, index=True)
+    version_id = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Foreign keys
     client_id = Column(Integer, ForeignKey('clients.client_id', ondelete='RESTRICT'), nullable=False)
@@ -105,3 +185,52 @@ class Event(Base):
     client = relationship("Client", back_populates="events")
     contract = relationship("Contract", back_populates="events")
     support = relationship("User", back_populates="events")
+
+    __mapper_args__ = {"version_id_col": version_id}
+
+
+# 🗄️ EVENT ARCHIVE MODEL ─────────────────────────────────────────────
+class EventArchive(Base):
+    """Cold storage for events moved out of the hot `events` table by `event archive`."""
+    __tablename__ = 'events_archive'
+
+    event_id = Column(Integer, primary_key=True, autoincrement=False)
+    event_name = Column(String, nullable=False)
+    start_date = Column(DateTime, nullable=False, index=True)
+    end_date = Column(DateTime, nullable=False)
+    location = Column(String, nullable=False)
+    notes = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False, index=True)
+
+    # References are kept as plain values: archived history must survive client/contract deletion.
+    client_id = Column(Integer, nullable=False, index=True)
+    contract_id = Column(Integer, nullable=False)
+    support_id = Column(Integer, nullable=True)
+
+
+# 📜 AUDIT LOG MODEL ─────────────────────────────────────────────────
+class AuditLog(Base):
+    """Append-only trail of business events (who did what, to which entity, when)."""
+    __tablename__ = 'audit_log'
+    __table_args__ = (
+        Index("ix_audit_log_entity", "entity_type", "entity_id"),
+    )
+
+    audit_id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False, index=True)
+    actor_id = Column(Integer, nullable=True, index=True)  # No FK: the trail outlives deleted users
+    actor_name = Column(String, nullable=True)
+    action = Column(String, nullable=False, index=True)
+    entity_type = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)
+
+
+# 🔢 TABLE VERSION MODEL ─────────────────────────────────────────────
+class TableVersion(Base):
+    """Change counter per table, bumped by every committed write; keys the list result cache."""
+    __tablename__ = 'table_versions'
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
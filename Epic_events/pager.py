@@ -0,0 +1,214 @@
+"""
+📜 Interactive Keyset Pager for Epic Events CRM
+
+`--pager` on a list command browses the listing one screen at a time instead of
+printing every row. Pages are fetched from the database only when the user scrolls to
+them, with a keyset cursor: "the next N rows after the last key shown". That costs the
+same on page 1 and on page 10,000, unlike OFFSET. Only the visible page is rendered,
+and only a few pages are kept in memory, so browsing a million events is instant.
+
+Keys:
+    n / space / ↓ / →   next page          p / b / ↑ / ←   previous page
+    g / Home            first page         G / End         last page
+    /                   search forward     #               jump to an ID
+    q / Esc             quit
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import sys
+from collections import OrderedDict
+
+import click
+from sqlalchemy import and_, or_, cast, String
+from sqlalchemy.sql import operators
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .rich_styles import console
+
+PAGE_CACHE_SIZE = 5  # Pages kept in memory; older ones are fetched again if revisited
+SCREEN_CHROME_LINES = 9  # Title, header, borders and the key help line around the rows
+
+KEYS_NEXT = {"n", " ", "\x1b[B", "\x1b[C", "\x1b[6~", "j"}
+KEYS_PREVIOUS = {"p", "b", "\x1b[A", "\x1b[D", "\x1b[5~", "k"}
+KEYS_FIRST = {"g", "\x1b[H", "\x1b[1~"}
+KEYS_LAST = {"G", "\x1b[F", "\x1b[4~"}
+KEYS_QUIT = {"q", "Q", "\x1b"}
+HELP_LINE = ("[dim]n/↓ next · p/↑ previous · g first · G last · / search · # jump to ID · q quit[/dim]")
+
+
+def order_parts(order_by) -> list[tuple]:
+    """Split ORDER BY clauses (`Client.total_due.desc()`, `Client.client_id`) into (column, descending)."""
+    parts = []
+    for clause in order_by:
+        if getattr(clause, "modifier", None) is operators.desc_op:
+            parts.append((clause.element, True))
+        elif getattr(clause, "modifier", None) is operators.asc_op:
+            parts.append((clause.element, False))
+        else:
+            parts.append((clause, False))
+    return parts
+
+
+# 🔑 Keyset Cursor ───────────────────────────────────────────────────
+class KeysetPager:
+    """
+    Page through `query` in `order_by` order without OFFSET.
+
+    Args:
+        session: Read session used for every page fetch.
+        query: SELECT of the rendered columns, unordered; it must include the order columns.
+        order_by: ORDER BY clauses; the last one must be unique (usually the primary key).
+        page_size: Rows per page.
+        search_columns: Text columns matched by `/` search (case-insensitive substring).
+        id_column: Column matched by `#` jump.
+    """
+
+    def __init__(self, session, query, order_by, page_size: int, search_columns=(), id_column=None):
+        self.session = session
+        self.query = query
+        self.order = order_parts(order_by)
+        self.page_size = page_size
+        self.search_columns = search_columns
+        self.id_column = id_column
+        self.rows = []
+        self._pages = OrderedDict()  # (anchor key, direction) -> rows, least recently used first
+
+    # ── Keyset predicates ──
+    def key_of(self, row) -> tuple:
+        return tuple(row._mapping[column] for column, _ in self.order)
+
+    def _beyond(self, key, forward: bool, inclusive: bool = False):
+        """Rows strictly after (`forward`) or before `key` in display order, or at it if `inclusive`."""
+        alternatives = []
+        for position, (column, descending) in enumerate(self.order):
+            equal_prefix = [c == k for (c, _), k in zip(self.order[:position], key)]
+            at_key = inclusive and position == len(self.order) - 1  # Single range test keeps the index usable
+            if descending == forward:
+                later = column <= key[position] if at_key else column < key[position]
+            else:
+                later = column >= key[position] if at_key else column > key[position]
+            alternatives.append(and_(*equal_prefix, later))
+        return or_(*alternatives)
+
+    def _ordered(self, forward: bool):
+        """Display order, or its exact reverse to read backwards from a key."""
+        return [column.desc() if descending == forward else column.asc()
+                for column, descending in self.order]
+
+    def _fetch(self, *criteria, forward: bool = True) -> list:
+        rows = self.session.execute(
+            self.query.where(*criteria).order_by(*self._ordered(forward)).limit(self.page_size)
+        ).all()
+        return rows if forward else rows[::-1]
+
+    def _cached(self, cache_key, fetch) -> list:
+        if cache_key in self._pages:
+            self._pages.move_to_end(cache_key)
+            return self._pages[cache_key]
+        rows = fetch()
+        self._pages[cache_key] = rows
+        while len(self._pages) > PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return rows
+
+    def _show(self, rows) -> bool:
+        """Make `rows` the visible page unless empty; returns whether the page moved."""
+        if rows:
+            self.rows = rows
+        return bool(rows)
+
+    # ── Navigation ──
+    def first(self) -> bool:
+        return self._show(self._cached(("first",), lambda: self._fetch()))
+
+    def last(self) -> bool:
+        return self._show(self._cached(("last",), lambda: self._fetch(forward=False)))
+
+    def next(self) -> bool:
+        if not self.rows:
+            return self.first()
+        key = self.key_of(self.rows[-1])
+        return self._show(self._cached((key, "after"), lambda: self._fetch(self._beyond(key, True))))
+
+    def previous(self) -> bool:
+        if not self.rows:
+            return self.first()
+        key = self.key_of(self.rows[0])
+        return self._show(self._cached((key, "before"), lambda: self._fetch(self._beyond(key, False),
+                                                                            forward=False)))
+
+    def start_at(self, *criteria) -> bool:
+        """Show the page starting at the first row (in display order) matching `criteria`."""
+        match = self.session.execute(self.query.where(*criteria).order_by(*self._ordered(True)).limit(1)).first()
+        if match is None:
+            return False
+        key = self.key_of(match)
+        return self._show(self._fetch(self._beyond(key, True, inclusive=True)))
+
+    def jump(self, entity_id) -> bool:
+        return self.id_column is not None and self.start_at(self.id_column == entity_id)
+
+    def search(self, text: str) -> bool:
+        """Move to the next row after the top of the page matching `text`, wrapping to the start."""
+        if not self.search_columns:
+            return False
+        matches = or_(*(cast(column, String).ilike(f"%{text}%") for column in self.search_columns))
+        if self.rows and self.start_at(matches, self._beyond(self.key_of(self.rows[0]), True)):
+            return True
+        return self.start_at(matches)
+
+
+# 🖥️ Interactive Loop ─────────────────────────────────────────────────
+def can_page() -> bool:
+    """The pager needs a terminal on both ends; pipes and redirects get the full listing."""
+    return console.is_terminal and sys.stdin.isatty()
+
+
+def page_size_for_terminal() -> int:
+    return max(5, console.size.height - SCREEN_CHROME_LINES)
+
+
+def browse(pager: KeysetPager, render, title: str, empty_message: str):
+    """
+    Show `pager` one page at a time until the user quits.
+
+    Args:
+        pager: Cursor over the listing.
+        render: Table renderer taking (rows, title=...), e.g. `render_events_table`.
+        title: Table title; the key range of the page is appended.
+        empty_message: Printed when the listing has no rows at all.
+    """
+    if not pager.first():
+        console.print(f"[yellow]⚠️ {empty_message}[/yellow]")
+        return
+
+    status = ""
+    while True:
+        console.clear()
+        first_id, last_id = (row._mapping[pager.id_column] for row in (pager.rows[0], pager.rows[-1]))
+        render(pager.rows, title=f"{title} · IDs {first_id} … {last_id}")
+        console.print(f"{HELP_LINE}  {status}")
+        status = ""
+
+        key = click.getchar()
+        if key in KEYS_QUIT:
+            return
+        if key in KEYS_NEXT:
+            status = "" if pager.next() else "[yellow]⏹️ Last page.[/yellow]"
+        elif key in KEYS_PREVIOUS:
+            status = "" if pager.previous() else "[yellow]⏹️ First page.[/yellow]"
+        elif key in KEYS_FIRST:
+            pager.first()
+        elif key in KEYS_LAST:
+            pager.last()
+        elif key == "/":
+            if not pager.search_columns:
+                status = "[yellow]🔎 This listing has no text to search; use # to jump to an ID.[/yellow]"
+                continue
+            text = click.prompt("🔎 Search", default="", show_default=False).strip()
+            if text and not pager.search(text):
+                status = f"[yellow]🔎 No match for '{text}'.[/yellow]"
+        elif key == "#":
+            entity_id = click.prompt("🆔 Jump to ID", type=int)
+            if not pager.jump(entity_id):
+                status = f"[yellow]🆔 No row with ID {entity_id}.[/yellow]"
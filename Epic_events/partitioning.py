@@ -0,0 +1,132 @@
+"""
+🗓️ Monthly Partition Maintenance for the Events Table (PostgreSQL)
+
+When `EVENTS_PARTITIONED=1` on PostgreSQL, `events` is created as a declaratively partitioned
+table (`PARTITION BY RANGE (start_date)`). This module keeps one partition per month ready
+ahead of time (`event partitions`, run e.g. monthly from cron), plus a DEFAULT partition
+catching anything outside the prepared range, and drops monthly partitions emptied by
+`event archive`.
+
+Partitions are not created at every startup. Once rows for a month have landed in the
+DEFAULT partition, that month's partition can only be added after moving them out, which
+needs an exclusive lock on `events`; that belongs to a maintenance command.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import re
+from datetime import datetime, UTC
+
+from sqlalchemy import text
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .config import EVENTS_PARTITIONED, EVENT_PARTITION_MONTHS_AHEAD
+
+
+PARTITION_NAME = re.compile(r"^events_y(\d{4})m(\d{2})$")
+
+
+# 🧮 Month Helpers ──────────────────────────────────────────────────
+def month_start(moment: datetime) -> datetime:
+    """Return the first instant of the month containing `moment` (naive)."""
+    return datetime(moment.year, moment.month, 1)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    """Return the first day of the month `months` after `moment`'s month."""
+    index = moment.year * 12 + moment.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the partition holding `month`, e.g. `events_y2025m03`."""
+    return f"events_y{month.year:04d}m{month.month:02d}"
+
+
+# 🛠️ Create Partitions ──────────────────────────────────────────────
+def create_default_partition(conn):
+    """
+    Create the DEFAULT partition, plus this month's, when `events` has no partitions yet.
+
+    Called by `init_db` so a fresh partitioned table accepts rows. Later months are added
+    by `event partitions`.
+    """
+    if not EVENTS_PARTITIONED:
+        return
+    if conn.execute(text("SELECT to_regclass('events_default')")).scalar() is None:
+        conn.execute(text("CREATE TABLE events_default PARTITION OF events DEFAULT"))
+        ensure_event_partitions(conn, months_ahead=0)
+
+
+def ensure_event_partitions(conn, months_ahead: int = EVENT_PARTITION_MONTHS_AHEAD, start: datetime = None):
+    """
+    Create the missing monthly partitions from `start` (default: this month) to `months_ahead` months later.
+
+    Rows already caught by the DEFAULT partition for a new month are moved into it. Otherwise
+    PostgreSQL refuses the new partition ("updated partition constraint for default partition
+    would be violated"). The DEFAULT partition is detached for that, and re-attached after the
+    rows were re-inserted through `events`, all in the caller's transaction.
+
+    Returns:
+        tuple[list[str], int]: Names of the partitions created and number of rows moved.
+    """
+    if not EVENTS_PARTITIONED:
+        return [], 0
+
+    existing = set(list_event_partitions(conn))
+    columns = conn.execute(text(
+        "SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) FROM pg_attribute "
+        "WHERE attrelid = 'events'::regclass AND attnum > 0 AND NOT attisdropped"
+    )).scalar()
+    created, moved = [], 0
+    first = month_start(start or datetime.now(UTC))
+    for offset in range(months_ahead + 1):
+        lower = add_months(first, offset)
+        upper = add_months(first, offset + 1)
+        name = partition_name(lower)
+        if name in existing:
+            continue
+        in_range = f"start_date >= '{lower:%Y-%m-%d}' AND start_date < '{upper:%Y-%m-%d}'"
+        stray = conn.execute(text(f"SELECT count(*) FROM events_default WHERE {in_range}")).scalar()
+        if stray:
+            conn.execute(text("ALTER TABLE events DETACH PARTITION events_default"))
+        conn.execute(text(
+            f"CREATE TABLE {name} PARTITION OF events "
+            f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        ))
+        if stray:
+            conn.execute(text(f"INSERT INTO events ({columns}) SELECT {columns} FROM events_default WHERE {in_range}"))
+            conn.execute(text(f"DELETE FROM events_default WHERE {in_range}"))
+            conn.execute(text("ALTER TABLE events ATTACH PARTITION events_default DEFAULT"))
+            moved += stray
+        created.append(name)
+    return created, moved
+
+
+# 🧹 Drop Archived Partitions ───────────────────────────────────────
+def list_event_partitions(conn) -> list[str]:
+    """Return the names of the monthly partitions currently attached to `events`."""
+    rows = conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = 'events'"
+    )).scalars()
+    return sorted(name for name in rows if PARTITION_NAME.match(name))
+
+
+def drop_partitions_before(conn, cutoff: datetime) -> list[str]:
+    """
+    Drop monthly partitions whose whole range ends on or before `cutoff`.
+
+    Only called after their rows were archived, so the dropped partitions are empty.
+    """
+    if not EVENTS_PARTITIONED:
+        return []
+
+    dropped = []
+    for name in list_event_partitions(conn):
+        year, month = map(int, PARTITION_NAME.match(name).groups())
+        if add_months(datetime(year, month, 1), 1) <= cutoff.replace(tzinfo=None):
+            conn.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,225 @@
+"""
+🔎 Type-Ahead Entity Picker for Epic Events CRM
+
+Interactive prompts that need a client, contract or user ID preload every candidate in a
+single UNION ALL query, then let the user type an ID or part of a name. Matching runs in
+memory against a prefix + trigram index, so a wrong guess costs no database round-trip.
+Where `readline` is available, Tab completes the typed text to matching IDs and lists
+their names.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+from collections import defaultdict
+
+import click
+from sqlalchemy import select, literal, union_all, null, cast, String
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .models import User, Client, Contract, UserRole
+from .rich_styles import build_table, console
+
+try:
+    import readline
+except ImportError:  # Windows without pyreadline: plain prompts, same matching
+    readline = None
+
+MAX_SHOWN = 10
+MIN_SIMILARITY = 0.3
+
+
+# 🧮 Trigram Helpers ────────────────────────────────────────────────
+def trigrams(text: str) -> set[str]:
+    """Trigrams of each lower-cased word, padded like PostgreSQL's pg_trgm ("  ab" .. "ab ")."""
+    grams = set()
+    for word in text.lower().split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+# 🗂️ In-Memory Candidate Index ──────────────────────────────────────
+class CandidateIndex:
+    """
+    Searchable set of (id, label) candidates, optionally tagged with a parent ID
+    (e.g. the client of a contract) so a subset can be taken without re-querying.
+    """
+
+    def __init__(self, rows=()):
+        self.labels = {}
+        self.parents = {}
+        self.grams = {}
+        self.by_gram = defaultdict(set)
+        for entity_id, label, parent_id in rows:
+            self.labels[entity_id] = label
+            self.parents[entity_id] = parent_id
+            self.grams[entity_id] = trigrams(label)
+            for gram in self.grams[entity_id]:
+                self.by_gram[gram].add(entity_id)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.labels
+
+    def only(self, entity_ids) -> "CandidateIndex":
+        """Candidates whose ID is in `entity_ids`."""
+        entity_ids = set(entity_ids)
+        return CandidateIndex((entity_id, label, self.parents[entity_id])
+                              for entity_id, label in self.labels.items() if entity_id in entity_ids)
+
+    def subset(self, parent_id) -> "CandidateIndex":
+        """Candidates whose parent is `parent_id`."""
+        return CandidateIndex((entity_id, label, self.parents[entity_id])
+                              for entity_id, label in self.labels.items()
+                              if self.parents[entity_id] == parent_id)
+
+    def search(self, text: str, limit: int = MAX_SHOWN) -> list[tuple[int, str]]:
+        """
+        Rank candidates for `text`: ID prefix for digits, otherwise word-prefix matches
+        first, then typo-tolerant trigram matches: the share of the query's trigrams found in
+        the label, at least MIN_SIMILARITY, best first.
+        """
+        text = text.strip()
+        if not text:
+            return sorted(self.labels.items())[:limit]
+        if text.isdigit():
+            return [(entity_id, label) for entity_id, label in sorted(self.labels.items())
+                    if str(entity_id).startswith(text)][:limit]
+
+        needle = text.lower()
+        prefixed = [entity_id for entity_id, label in self.labels.items()
+                    if label.lower().startswith(needle) or f" {needle}" in f" {label.lower()}"]
+
+        query_grams = trigrams(text)
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for entity_id in self.by_gram.get(gram, ()):
+                shared[entity_id] += 1
+        scored = sorted(
+            ((count / len(query_grams), entity_id)
+             for entity_id, count in shared.items() if entity_id not in prefixed),
+            reverse=True,
+        )
+        similar = [entity_id for score, entity_id in scored if score >= MIN_SIMILARITY]
+        return [(entity_id, self.labels[entity_id]) for entity_id in (sorted(prefixed) + similar)[:limit]]
+
+
+# 📥 Preload Candidates in One Round-Trip ───────────────────────────
+def candidates(kind: str, id_column, label, parent_column=None):
+    """SELECT of (kind, id, label, parent_id) rows for one candidate set, to be combined by `load_candidates`."""
+    return select(
+        literal(kind).label("kind"),
+        id_column.label("id"),
+        label.label("label"),
+        (parent_column if parent_column is not None else null()).label("parent_id"),
+    )
+
+
+def client_candidates(commercial_id: int = None):
+    """Clients labelled "Full Name · Company", optionally only those of one commercial."""
+    query = candidates("clients", Client.client_id, Client.full_name + " · " + Client.company_name)
+    return query.where(Client.commercial_id == commercial_id) if commercial_id is not None else query
+
+
+def user_candidates(role: UserRole):
+    """Users of one role, labelled by name and email."""
+    return candidates(role.value, User.user_id, User.name + " · " + User.email).where(User.role == role)
+
+
+def signed_contract_candidates(commercial_id: int = None):
+    """Signed contracts tagged with their client, optionally only for one commercial's clients."""
+    query = (
+        candidates("contracts", Contract.contract_id,
+                   "Contract " + cast(Contract.contract_id, String) + " · " + Client.full_name
+                   + " · due " + cast(Contract.amount_due, String) + "/" + cast(Contract.amount_total, String),
+                   Contract.client_id)
+        .join(Client, Client.client_id == Contract.client_id)
+        .where(Contract.is_signed.is_(True))
+    )
+    return query.where(Client.commercial_id == commercial_id) if commercial_id is not None else query
+
+
+def load_candidates(session, *selects) -> dict[str, CandidateIndex]:
+    """Run every candidate SELECT as one UNION ALL query and index the rows per kind."""
+    rows = defaultdict(list)
+    for kind, entity_id, label, parent_id in session.execute(union_all(*selects)):
+        rows[kind].append((entity_id, label, parent_id))
+    return defaultdict(CandidateIndex, {kind: CandidateIndex(found) for kind, found in rows.items()})
+
+
+# ⌨️ Prompt ─────────────────────────────────────────────────────────
+def _show_matches(matches):
+    table = build_table("🔎 Matches", ["🆔 ID", "🏷️ Name"])
+    for entity_id, label in matches:
+        table.add_row(str(entity_id), label)
+    console.print(table)
+
+
+def _install_completer(index: CandidateIndex):
+    """Tab completes to matching IDs; the list of matches is shown with names."""
+    previous = (readline.get_completer(), readline.get_completer_delims())
+
+    def complete(text, state):
+        matches = [str(entity_id) for entity_id, _ in index.search(text)]
+        return matches[state] if state < len(matches) else None
+
+    def display(substitution, matches, longest):
+        print()
+        for match in matches:
+            print(f"  {match:>6}  {index.labels.get(int(match), '')}")
+        print(readline.get_line_buffer(), end="", flush=True)
+
+    readline.set_completer(complete)
+    readline.set_completer_delims("")
+    readline.set_completion_display_matches_hook(display)
+    readline.parse_and_bind("tab: complete")
+    return previous
+
+
+def pick(prompt: str, index: CandidateIndex, optional: bool = False):
+    """
+    Ask for one candidate by ID or name, filtering `index` in memory until one is chosen.
+
+    Args:
+        prompt: Prompt text, e.g. "👤 Client".
+        index: Preloaded candidates.
+        optional: Allow a blank answer (returns None).
+
+    Returns:
+        The chosen ID, or None if `optional` and left blank (or there is nothing to choose).
+
+    Raises:
+        ValueError: If `index` is empty and a choice is required.
+    """
+    if not index:
+        if optional:
+            click.secho(f"⚠️ {prompt}: nothing to choose from, kept as is.", fg="yellow")
+            return None
+        raise ValueError(f"{prompt}: nothing to choose from.")
+
+    previous = _install_completer(index) if readline is not None else None
+    try:
+        while True:
+            answer = click.prompt(f"{prompt} (ID or name, Tab to complete)",
+                                  default="" if optional else None, show_default=False).strip()
+            if optional and not answer:
+                return None
+            if answer.isdigit() and int(answer) in index:
+                return int(answer)
+
+            matches = index.search(answer)
+            if len(matches) == 1 and not answer.isdigit():
+                entity_id, label = matches[0]
+                click.secho(f"✅ {label} (ID {entity_id})", fg="green")
+                return entity_id
+            if not matches:
+                click.secho(f"❌ Nothing matches '{answer}'. Try another ID or name.", fg="red")
+                continue
+            _show_matches(matches)
+            click.secho("🔁 Several matches: type the ID or a more precise name.", fg="yellow")
+    finally:
+        if previous is not None:
+            readline.set_completer(previous[0])
+            readline.set_completer_delims(previous[1])
+            readline.set_completion_display_matches_hook(None)
@@ -0,0 +1,37 @@
+"""
+⏱️ Startup Profiler for Epic Events CRM
+
+Records how long each startup phase takes (imports, Sentry, database schema check,
+banners) so `doctor` can report where the time before the first command goes.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import time
+from contextlib import contextmanager
+
+
+# 🗒️ Recorded Phases ────────────────────────────────────────────────
+# Phase name -> duration in milliseconds, in the order the phases ran.
+STARTUP_PHASES: dict[str, float] = {}
+
+
+def record_phase(name: str, started: float):
+    """Record a phase that began at `started` (a `time.perf_counter()` value) and just ended."""
+    STARTUP_PHASES[name] = (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Time the enclosed block as one startup phase."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, started)
+
+
+def timed(func, *args, **kwargs):
+    """Call `func` and return `(result, elapsed_ms)`."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
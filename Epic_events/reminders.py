@@ -0,0 +1,291 @@
+"""
+⏰ Upcoming-Event Reminder Scheduler for Epic Events CRM
+
+`reminders run` tells support staff about their events a lead time before they start
+(REMINDER_LEAD_HOURS, 24 by default). It does not poll the whole table:
+
+- Refills read only the events starting inside the next lookahead window. That is a
+  range scan on the `start_date` index. Each event is pushed on a timer heap at its due
+  time, `start_date - lead`.
+- The scheduler sleeps until the earliest due time or the next refill, whichever comes
+  first.
+- Refills run every few minutes and only read the new slice of the window, plus events
+  created or rescheduled since the last refill (through the `updated_at` index).
+- When entries come due, they are re-read in one query. Events that were moved,
+  archived or deleted meanwhile are dropped. The rest are sent as one batch per
+  recipient.
+- A failed read or delivery (database restart, SMTP server down) puts the affected
+  reminders back on the heap. They are retried after a growing backoff while the
+  scheduler keeps running.
+
+Sinks are pluggable (`SINKS`): a JSON-lines file, or SMTP, e.g. a local debugging
+server (`python -m aiosmtpd -n -l localhost:1025`). The start time of the last event
+reminded is saved to REMINDER_STATE_FILE. A restarted scheduler then catches up on
+reminders that came due while it was down, without repeating the ones already sent. On
+a first run, every event starting within the lead time is reminded at once.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import heapq
+import json
+import smtplib
+import time
+from collections import defaultdict, namedtuple
+from datetime import datetime, timedelta, UTC
+from email.message import EmailMessage
+
+from sqlalchemy import select, or_
+from sqlalchemy.exc import OperationalError
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .config import (
+    CHANGE_OVERLAP_SECONDS,
+    REMINDER_FILE,
+    REMINDER_SMTP_HOST,
+    REMINDER_SMTP_PORT,
+    REMINDER_SMTP_FROM,
+    REMINDER_UNASSIGNED_TO,
+    REMINDER_STATE_FILE,
+)
+from .models import Event, User
+
+Reminder = namedtuple("Reminder", "event_id event_name start_date location client_id support_id recipient")
+UNASSIGNED = "unassigned"
+REFILL_SECONDS = 300  # How late an event created or moved into the lead window can be noticed
+RETRY_MIN_SECONDS, RETRY_MAX_SECONDS = 5, 300  # Backoff after a database or delivery error
+
+
+def utc_now() -> datetime:
+    """Naive UTC, the form in which `start_date` values are read back."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+# 📨 Sinks ──────────────────────────────────────────────────────────
+class FileSink:
+    """Append each batch as one JSON line per recipient."""
+
+    def __init__(self, path=REMINDER_FILE):
+        self.path = path
+
+    def send(self, recipient: str, reminders: list[Reminder]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "sent_at": utc_now().isoformat(),
+                "recipient": recipient,
+                "events": [{**reminder._asdict(), "start_date": reminder.start_date.isoformat()}
+                           for reminder in reminders],
+            }) + "\n")
+
+
+class SmtpSink:
+    """Send one email per recipient and batch; events without support go to REMINDER_UNASSIGNED_TO."""
+
+    def __init__(self, host=REMINDER_SMTP_HOST, port=REMINDER_SMTP_PORT, sender=REMINDER_SMTP_FROM):
+        self.host, self.port, self.sender = host, port, sender
+
+    def send(self, recipient: str, reminders: list[Reminder]):
+        if recipient == UNASSIGNED:
+            if not REMINDER_UNASSIGNED_TO:
+                return
+            recipient = REMINDER_UNASSIGNED_TO
+        message = EmailMessage()
+        message["From"], message["To"] = self.sender, recipient
+        message["Subject"] = (f"⏰ {len(reminders)} upcoming event(s)" if len(reminders) > 1
+                              else f"⏰ Upcoming event: {reminders[0].event_name}")
+        message.set_content("\n".join(
+            f"- #{r.event_id} {r.event_name}, {r.start_date:%d-%m-%Y %H:%M} UTC at {r.location} (client {r.client_id})"
+            for r in reminders
+        ))
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            smtp.send_message(message)
+
+
+SINKS = {"file": FileSink, "smtp": SmtpSink}
+
+
+# 💾 Restart State ──────────────────────────────────────────────────
+def load_reminded_until(path=REMINDER_STATE_FILE):
+    """Start time of the last event reminded, or None on a first run."""
+    try:
+        return datetime.fromisoformat(json.loads(path.read_text())["reminded_until"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_reminded_until(value: datetime, path=REMINDER_STATE_FILE):
+    try:
+        path.write_text(json.dumps({"reminded_until": value.isoformat()}))
+    except OSError:
+        pass  # Best-effort: a lost state file only means a few repeated reminders after a restart
+
+
+# ⏰ Scheduler ──────────────────────────────────────────────────────
+class ReminderScheduler:
+    """
+    Timer heap of upcoming reminders, refilled from the `start_date` index one window at a time.
+
+    Args:
+        session_factory: Creates a short-lived read session per refill / batch.
+        sink: Object with `send(recipient, reminders)`.
+        lead: How long before the start an event is reminded.
+        lookahead: Width of the start_date window loaded per refill.
+        batch_window: Reminders due within this span of the first one are sent with it.
+        clock, sleep: Injected for tests and benchmarks (naive-UTC `datetime` clock).
+        remember: Resume from and save progress to REMINDER_STATE_FILE.
+    """
+
+    def __init__(self, session_factory, sink, lead: timedelta, lookahead: timedelta,
+                 batch_window: timedelta = timedelta(0), clock=utc_now, sleep=time.sleep, remember: bool = True):
+        self.session_factory = session_factory
+        self.sink = sink
+        self.lead = lead
+        self.lookahead = lookahead
+        self.batch_window = batch_window
+        self.clock = clock
+        self.sleep = sleep
+        self.remember = remember
+
+        self.heap = []       # (due, event_id, start_date), earliest due first
+        self.known = set()   # (event_id, start_date) queued or already reminded, until the event starts
+        now = clock()
+        saved = load_reminded_until() if remember else None
+        self.reminded_until = saved if saved is not None and saved > now else now
+        self.loaded_until = None  # End of the start_date window already on the heap
+        self.last_refill = None
+        self.next_refill = now
+        self.sent = 0
+
+    # ── Refill ──
+    def refill(self) -> int:
+        """Queue events whose start date entered the window, plus events created or moved since the last refill."""
+        now = self.clock()
+        window_end = now + self.lead + self.lookahead
+        if self.loaded_until is None:
+            entering = Event.start_date > self.reminded_until
+        else:
+            # Range scan of the new slice of the window; the updated_at index finds late edits,
+            # re-reading an overlap for edits stamped before the last refill but committed after it
+            edited_since = self.last_refill - timedelta(seconds=CHANGE_OVERLAP_SECONDS)
+            entering = or_(Event.start_date > self.loaded_until,
+                           (Event.updated_at >= edited_since) & (Event.start_date > now))
+
+        session = self.session_factory()
+        try:
+            rows = session.execute(select(Event.event_id, Event.start_date)
+                                   .where(entering, Event.start_date <= window_end)).all()
+        finally:
+            session.close()
+
+        queued = 0
+        for event_id, start_date in rows:
+            if (event_id, start_date) not in self.known:
+                self.known.add((event_id, start_date))
+                heapq.heappush(self.heap, (start_date - self.lead, event_id, start_date))
+                queued += 1
+        self.known = {(event_id, start) for event_id, start in self.known if start > now}
+        self.loaded_until = window_end
+        self.last_refill = now
+        self.next_refill = now + min(self.lookahead, timedelta(seconds=REFILL_SECONDS))
+        return queued
+
+    # ── Fire ──
+    def due_batch(self, now: datetime) -> list:
+        """Pop every heap entry due by `now` (plus the batch window), as (event_id, start_date)."""
+        due = []
+        if self.heap and self.heap[0][0] <= now:
+            until = now + self.batch_window
+            while self.heap and self.heap[0][0] <= until:
+                _, event_id, start_date = heapq.heappop(self.heap)
+                due.append((event_id, start_date))
+        return due
+
+    def send_batch(self, due) -> int:
+        """
+        Re-read the due events in one query and send one batch per recipient; returns reminders sent.
+
+        Entries whose read or send fails go back on the heap and are retried on the next tick.
+        The first delivery error is raised once every other recipient has been tried.
+        """
+        wanted = dict(due)
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(Event.event_id, Event.event_name, Event.start_date, Event.location, Event.client_id,
+                       Event.support_id, User.email)
+                .outerjoin(User, User.user_id == Event.support_id)
+                .where(Event.event_id.in_(wanted))
+                .order_by(Event.start_date)
+            ).all()
+        except Exception:
+            self._requeue(due)
+            raise
+        finally:
+            session.close()
+
+        by_recipient = defaultdict(list)
+        for *fields, email in rows:
+            if fields[2] != wanted[fields[0]]:
+                continue  # Moved since it was queued; a refill queues it again at its new time
+            by_recipient[email or UNASSIGNED].append(Reminder(*fields, recipient=email or UNASSIGNED))
+
+        failed, error, count = [], None, 0
+        for recipient, reminders in by_recipient.items():
+            try:
+                self.sink.send(recipient, reminders)
+                count += len(reminders)
+            except OSError as e:
+                failed.extend((reminder.event_id, reminder.start_date) for reminder in reminders)
+                error = error or e
+        self._requeue(failed)
+
+        # Restart watermark: never past a reminder still waiting to be delivered
+        first_failed = min((start for _, start in failed), default=None)
+        done = [start for start in wanted.values() if first_failed is None or start < first_failed]
+        if done and max(done) > self.reminded_until:
+            self.reminded_until = max(done)
+            if self.remember:
+                save_reminded_until(self.reminded_until)
+        self.sent += count
+        if error is not None:
+            raise error
+        return count
+
+    def _requeue(self, entries):
+        for event_id, start_date in entries:
+            heapq.heappush(self.heap, (start_date - self.lead, event_id, start_date))
+
+    # ── Loop ──
+    def tick(self) -> int:
+        """Refill if due, then send everything that came due; returns reminders sent."""
+        if self.clock() >= self.next_refill:
+            self.refill()
+        due = self.due_batch(self.clock())
+        return self.send_batch(due) if due else 0
+
+    def seconds_until_next(self) -> float:
+        """Time to sleep: until the earliest reminder or the next refill."""
+        wake = min(self.next_refill, self.heap[0][0]) if self.heap else self.next_refill
+        return max(0.0, (wake - self.clock()).total_seconds())
+
+    def run(self, on_batch=None, on_error=None, stop=lambda: False):
+        """
+        Tick, then sleep until the next reminder or refill; loops until `stop()` is true.
+
+        A database or delivery error is passed to `on_error` and retried after a backoff that
+        doubles from RETRY_MIN_SECONDS up to RETRY_MAX_SECONDS; the scheduler keeps running.
+        """
+        backoff = RETRY_MIN_SECONDS
+        while not stop():
+            try:
+                sent = self.tick()
+            except (OperationalError, OSError) as e:
+                if on_error:
+                    on_error(e, backoff)
+                self.sleep(backoff)
+                backoff = min(backoff * 2, RETRY_MAX_SECONDS)
+                continue
+            backoff = RETRY_MIN_SECONDS
+            if sent and on_batch:
+                on_batch(sent)
+            self.sleep(self.seconds_until_next())
@@ -0,0 +1,197 @@
+"""
+🗂️ Result Cache for List Commands in Epic Events CRM
+
+Listing commands usually return the same rows as a minute ago. Each table has a change
+counter in `table_versions`, which is bumped in the same transaction as every committed
+write. A cached listing is keyed by its SQL, its parameters and the counters of the
+tables it reads. When those counters have not moved, the rows come from the cache. A
+lookup costs one small query on `table_versions`; the listing query and its hydration
+are skipped.
+
+What marks a table as changed:
+- ORM flushes (create, update, delete) mark the tables of the flushed objects.
+- Core DML executed through a session (payments, bulk reassignments, claims, archiving,
+  counter recounts) marks its target table.
+
+The counters are bumped just before commit, one table at a time in name order, so two
+writers never wait on each other's counters in opposite orders.
+
+The cache lives in the process and, when `RESULT_CACHE_DIR` is set, on local disk, so
+successive CLI commands share it. Hits and misses are counted per listing (`cache stats`).
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import Counter
+from itertools import chain
+
+from sqlalchemy import event, select, update, insert
+from sqlalchemy.orm import Session, object_mapper
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from . import counters  # noqa: F401 (its before_commit recount must run before the bump below)
+from .config import RESULT_CACHE_ENABLED, RESULT_CACHE_DIR
+from .models import TableVersion
+
+
+CHANGED_TABLES = "changed_tables"
+STATS_FILE = "stats.json"
+
+_memory = {}        # (name, key digest) -> (versions, rows)
+stats = Counter()   # "<name>:hit" / "<name>:miss" in this process
+
+
+# 📝 Track Changed Tables ───────────────────────────────────────────
+def _mark_changed(session: Session, *table_names):
+    session.info.setdefault(CHANGED_TABLES, set()).update(table_names)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj not in session.dirty or session.is_modified(obj):
+            _mark_changed(session, object_mapper(obj).local_table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_changed(orm_execute_state.session, orm_execute_state.statement.table.name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_table_versions(session):
+    session.flush()  # The commit's own flush comes after this hook; catch its changes here
+    table_names = session.info.pop(CHANGED_TABLES, None)
+    if table_names:
+        bump_table_versions(session.connection(), sorted(table_names))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_tables(session):
+    session.info.pop(CHANGED_TABLES, None)
+
+
+def bump_table_versions(connection, table_names):
+    """Increment the change counter of each table, creating counters that do not exist yet."""
+    table_names = [name for name in table_names if name != TableVersion.__tablename__]
+    missing = []
+    for name in table_names:
+        bumped = connection.execute(
+            update(TableVersion).where(TableVersion.table_name == name).values(version=TableVersion.version + 1)
+        ).rowcount
+        if not bumped:
+            missing.append({"table_name": name, "version": 1})
+    if missing:
+        connection.execute(insert(TableVersion), missing)
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_table_versions(table, connection, **kw):
+    """Start every known table at version 0 when `table_versions` is created."""
+    connection.execute(insert(table), [{"table_name": name, "version": 0}
+                                       for name in table.metadata.tables if name != table.name])
+
+
+def table_versions(session: Session, table_names) -> tuple:
+    """Current (table, version) pairs for `table_names`, in one query; unknown tables read as 0."""
+    found = dict(session.execute(
+        select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(table_names))
+    ).all())
+    return tuple((name, found.get(name, 0)) for name in sorted(table_names))
+
+
+# 💾 Disk Store ──────────────────────────────────────────────────────
+def _disk_path(name: str, digest: str):
+    return RESULT_CACHE_DIR / f"{name.replace(' ', '_')}-{digest[:16]}.pickle"
+
+
+def _disk_load(name: str, digest: str):
+    try:
+        with open(_disk_path(name, digest), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+
+
+def _atomic_write(path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _record_stat(name: str, outcome: str):
+    stats[f"{name}:{outcome}"] += 1
+    if RESULT_CACHE_DIR is None:
+        return
+    totals = load_disk_stats()
+    totals[f"{name}:{outcome}"] = totals.get(f"{name}:{outcome}", 0) + 1
+    _atomic_write(RESULT_CACHE_DIR / STATS_FILE, json.dumps(totals).encode())
+
+
+def load_disk_stats() -> dict:
+    """Hit / miss totals accumulated on disk across commands (empty without RESULT_CACHE_DIR)."""
+    if RESULT_CACHE_DIR is None:
+        return {}
+    try:
+        return json.loads((RESULT_CACHE_DIR / STATS_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def clear_cache() -> int:
+    """Drop every cached listing, in memory and on disk, and reset the stats; returns entries removed."""
+    removed = len(_memory)
+    _memory.clear()
+    stats.clear()
+    if RESULT_CACHE_DIR is not None and RESULT_CACHE_DIR.is_dir():
+        for path in RESULT_CACHE_DIR.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        (RESULT_CACHE_DIR / STATS_FILE).unlink(missing_ok=True)
+    return removed
+
+
+# 🔎 Cached Query ────────────────────────────────────────────────────
+def cached_rows(session: Session, name: str, query, table_names) -> list:
+    """
+    Return the rows of `query`, from the cache when none of `table_names` changed since.
+
+    Args:
+        session: Read session; the counters are read from the same database as the rows.
+        name: Listing name used for stats and file names, e.g. "event list".
+        query: Core SELECT returning plain rows (attribute access by column name).
+        table_names: Every table the query reads.
+
+    Returns:
+        list[Row]: The query's rows.
+    """
+    if not RESULT_CACHE_ENABLED:
+        return session.execute(query).all()
+
+    bind = session.get_bind()
+    compiled = query.compile(bind=bind)
+    key = (bind.url.render_as_string(hide_password=True), str(compiled), sorted(compiled.params.items()))
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()
+    versions = table_versions(session, table_names)
+
+    entry = _memory.get((name, digest))
+    if entry is None and RESULT_CACHE_DIR is not None:
+        entry = _disk_load(name, digest)
+    if entry is not None and entry[0] == versions:
+        _memory[(name, digest)] = entry
+        _record_stat(name, "hit")
+        return entry[1]
+
+    rows = session.execute(query).all()
+    _memory[(name, digest)] = (versions, rows)
+    if RESULT_CACHE_DIR is not None:
+        _atomic_write(_disk_path(name, digest), pickle.dumps((versions, rows)))
+    _record_stat(name, "miss")
+    return rows
@@ -2,13 +2,23 @@
 """
 🎨 Rich Styling Utilities for Epic Events CRM
 
-This module defines table styling constants and a helper function to build
-styled Rich tables used across the CLI interface for consistent formatting.
+This module defines table styling constants, the console shared by every module, and
+helpers to build styled Rich tables and command banners used across the CLI interface.
+
+In plain mode (`--plain` or `EPIC_PLAIN=1`) banners and panels are skipped, markup is
+stripped, and tables are written as aligned plain-text columns in a single write.
 """
 
 # 📦 External Imports ───────────────────────────────────────────────
+import os
+import re
+
 from rich import box
+from rich.align import Align
+from rich.console import Console
+from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 
 # 🎨 RICH STYLING CONSTANTS ──────────────────────────────────────────
@@ -16,6 +26,78 @@ DEFAULT_BOX = box.MINIMAL_DOUBLE_HEAD
 HEADER_STYLE = "bold magenta"
 TITLE_STYLE = "bold cyan"
 
+LEADING_SYMBOLS = re.compile(r"^\W+")
+_plain = os.getenv("EPIC_PLAIN") == "1"
+
+
+# 🧾 PLAIN MODE ──────────────────────────────────────────────────────
+def set_plain_mode(enabled: bool):
+    """Switch plain-text rendering on or off for the shared console."""
+    global _plain
+    _plain = bool(enabled)
+
+
+def is_plain_mode() -> bool:
+    return _plain
+
+
+def _plain_text(value) -> str:
+    text = str(value)
+    return Text.from_markup(text).plain if "[" in text else text
+
+
+class PlainTable:
+    """Drop-in for the few `Table` methods used here, rendered as aligned text columns."""
+
+    def __init__(self, title: str, columns: list[str]):
+        self.title = LEADING_SYMBOLS.sub("", title)
+        self.columns = [LEADING_SYMBOLS.sub("", column.strip()) for column in columns]
+        self.rows = []
+
+    def add_column(self, header: str, **kwargs):
+        self.columns.append(LEADING_SYMBOLS.sub("", header.strip()))
+
+    def add_row(self, *cells, **kwargs):
+        self.rows.append([_plain_text(cell) if cell is not None else "" for cell in cells])
+
+    def render(self) -> str:
+        widths = [len(column) for column in self.columns]
+        for row in self.rows:
+            for i, cell in enumerate(row):
+                widths[i] = max(widths[i], len(cell))
+        lines = [self.title, "  ".join(c.ljust(w) for c, w in zip(self.columns, widths)).rstrip(),
+                 "  ".join("-" * w for w in widths)]
+        lines.extend("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip() for row in self.rows)
+        return "\n".join(lines) + "\n"
+
+
+class CrmConsole(Console):
+    """Rich console that writes plain text, through one buffered write per call, in plain mode."""
+
+    def print(self, *objects, **kwargs):
+        if not _plain:
+            return super().print(*objects, **kwargs)
+
+        parts = []
+        for obj in objects:
+            if isinstance(obj, Align):
+                obj = obj.renderable
+            if isinstance(obj, Panel):
+                obj = obj.renderable
+            if isinstance(obj, PlainTable):
+                parts.append(obj.render())
+            elif isinstance(obj, (Panel, Table)):
+                continue  # Decorations and rich-only tables have no plain form
+            else:
+                parts.append(_plain_text(obj) + "\n")
+        if parts:
+            self.file.write("".join(parts))
+            self.file.flush()
+
+
+# 🖥️ SHARED CONSOLE ──────────────────────────────────────────────────
+console = CrmConsole()
+
 
 # 📋 TABLE BUILDER ───────────────────────────────────────────────────
 def build_table(title: str, columns: list[str]) -> "Table":
@@ -27,8 +109,11 @@ def build_table(title: str, columns: list[str]) -> "Table":
         columns (list[str]): List of column header labels.
 
     Returns:
-        Table: A configured Rich Table object.
+        Table: A configured Rich Table object (a `PlainTable` in plain mode).
     """
+    if _plain:
+        return PlainTable(title, columns)
+
     table = Table(
         title=f"📋 [{TITLE_STYLE}]{title}[/{TITLE_STYLE}]",
         title_justify="left",
@@ -41,3 +126,19 @@ def build_table(title: str, columns: list[str]) -> "Table":
         table.add_column(column)
 
     return table
+
+
+# 🖼️ COMMAND BANNER ──────────────────────────────────────────────────
+def render_command_banner(title: str, message: str):
+    """Print the decorative panel shown at the start of a command (skipped in plain mode)."""
+    if _plain:
+        return
+    banner = Panel(
+        Text(message, justify="left", style="bold yellow"),
+        title=f"[bold magenta]{title}[/bold magenta]",
+        subtitle="[italic cyan]Your Command-Line CRM[/italic cyan]",
+        border_style="green",
+        padding=(1, 2),
+        expand=False
+    )
+    console.print(Align.left(banner))
@@ -3,26 +3,171 @@
 
 This module initializes the Sentry SDK for error tracking and performance monitoring.
 It loads configuration from environment variables and attaches user and error context.
+
+Tracing is sampled per command. By default a command is picked up front at
+SENTRY_TRACES_SAMPLE_RATE, and the others record no spans at all. With
+SENTRY_TAIL_SAMPLING=1, every command is recorded and the decision is made once it
+finishes, keeping errors and slow commands at a higher rate than ordinary ones. Spans wrap
+the service functions (`@traced`) and every DB call (SQLAlchemy integration). Traces can also be written to a local JSON-lines file, so they
+can be inspected offline without a Sentry DSN.
 """
 
 # 📦 External Imports ───────────────────────────────────────────────
+import functools
+import json
 import os
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+
 import sentry_sdk
 from dotenv import load_dotenv
+from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+from sentry_sdk.transport import Transport
+
+
+_initialized = False
+
+
+# ⚙️ Sampling Configuration ─────────────────────────────────────────
+def _rate(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+# 🗂️ Local JSON Trace Exporter ───────────────────────────────────────
+class LocalJsonTransport(Transport):
+    """
+    Sentry transport appending every transaction and error event to a JSON-lines file.
+
+    When a DSN is configured too, envelopes are forwarded to the regular HTTP transport.
+    """
+
+    def __init__(self, path: Path, options=None, forward: Transport = None):
+        super().__init__(options)
+        self.path = Path(path).expanduser()
+        self.forward = forward
+
+    def capture_envelope(self, envelope):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for item in envelope.items:
+                payload = item.payload.json
+                if item.type in ("transaction", "event") and payload:
+                    f.write(json.dumps(payload, default=str, ensure_ascii=False) + "\n")
+        if self.forward is not None:
+            self.forward.capture_envelope(envelope)
+
+    def flush(self, timeout, callback=None):
+        if self.forward is not None:
+            self.forward.flush(timeout, callback)
+
+    def kill(self):
+        if self.forward is not None:
+            self.forward.kill()
+
+
+# 🎯 Adaptive Sampling ───────────────────────────────────────────────
+def _as_datetime(value):
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def sample_transaction(event, hint):
+    """
+    Tail-sample a finished command transaction (SENTRY_TAIL_SAMPLING=1 only).
+
+    Failed commands are kept at SENTRY_ERROR_SAMPLE_RATE, commands slower than
+    SENTRY_SLOW_COMMAND_MS at SENTRY_SLOW_SAMPLE_RATE, and all others at
+    SENTRY_TRACES_SAMPLE_RATE.
+    """
+    status = event.get("contexts", {}).get("trace", {}).get("status")
+    duration_ms = (_as_datetime(event["timestamp"]) - _as_datetime(event["start_timestamp"])).total_seconds() * 1000
+
+    if status not in (None, "ok"):
+        rate = _rate("SENTRY_ERROR_SAMPLE_RATE", 1.0)
+    elif duration_ms >= _rate("SENTRY_SLOW_COMMAND_MS", 1000):
+        rate = _rate("SENTRY_SLOW_SAMPLE_RATE", 1.0)
+    else:
+        rate = _rate("SENTRY_TRACES_SAMPLE_RATE", 0.1)
+    return event if random.random() < rate else None
+
+
+def flag_error_on_transaction(event, hint):
+    """Mark the running command as failed when an error is reported, so it is kept by the sampler."""
+    span = sentry_sdk.get_current_span()
+    if span is not None and span.containing_transaction is not None:
+        span.containing_transaction.set_status("internal_error")
+    return event
 
 
 # 🚀 Initialize Sentry SDK ──────────────────────────────────────────
 def init_sentry():
     """
-    Load the SENTRY_DSN from environment and initialize the Sentry SDK with tracking enabled.
+    Load the Sentry settings from environment and initialize the SDK once per process.
+
+    Nothing is initialized when neither SENTRY_DSN nor SENTRY_TRACE_FILE is set.
     """
+    global _initialized
+    if _initialized:
+        return
+
     load_dotenv()
     dsn = os.getenv("SENTRY_DSN")
+    trace_file = os.getenv("SENTRY_TRACE_FILE")
+    if not dsn and not trace_file:
+        return
+
+    options = {
+        "dsn": dsn,
+        "send_default_pii": True,
+        "environment": os.getenv("SENTRY_ENVIRONMENT", "production"),
+        "integrations": [SqlalchemyIntegration()],
+        "before_send": flag_error_on_transaction,
+    }
+    if os.getenv("SENTRY_TAIL_SAMPLING") == "1":
+        # Every command records its spans; the sampler decides afterwards what is sent.
+        tracing = max(_rate("SENTRY_TRACES_SAMPLE_RATE", 0.1), _rate("SENTRY_SLOW_SAMPLE_RATE", 1.0),
+                      _rate("SENTRY_ERROR_SAMPLE_RATE", 1.0)) > 0
+        options["traces_sample_rate"] = 1.0 if tracing else None
+        options["before_send_transaction"] = sample_transaction
+    else:
+        # Head sampling: unsampled commands skip span recording entirely.
+        options["traces_sample_rate"] = _rate("SENTRY_TRACES_SAMPLE_RATE", 0.1) or None
+
+    if trace_file and not dsn:
+        options["transport"] = LocalJsonTransport(trace_file)
+
+    sentry_sdk.init(**options)
+    if trace_file and dsn:
+        # Keep sending to Sentry, but also write a local copy of every envelope.
+        client = sentry_sdk.get_client()
+        client.transport = LocalJsonTransport(trace_file, forward=client.transport)
+    _initialized = True
+
+
+# 🧭 Command Transaction ─────────────────────────────────────────────
+def command_transaction(argv=None):
+    """Start a transaction named after the invoked command, e.g. `cli event list`."""
+    argv = sys.argv[1:] if argv is None else argv
+    words = [arg for arg in argv if not arg.startswith("-")][:2]
+    return sentry_sdk.start_transaction(op="cli.command", name=" ".join(["cli", *words]))
+
+
+# 🧵 Service Spans ───────────────────────────────────────────────────
+# Innermost traced service function running; names the query in timeout reports.
+current_operation = ContextVar("current_operation", default=None)
+
+
+def traced(func):
+    """Wrap a service function in a Sentry span named `<module>.<function>`."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
 
-    if dsn:
-        sentry_sdk.init(
-            dsn=dsn,
-            send_default_pii=True,
-            environment="production",  # or "development"
-            traces_sample_rate=1.0
-        )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = current_operation.set(name)
+        try:
+            with sentry_sdk.start_span(op="service", name=name):
+                return func(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+    return wrapper
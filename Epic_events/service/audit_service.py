@@ -0,0 +1,87 @@
+"""
+📜 Audit Log Queries for Epic Events CRM
+
+This module reads the append-only audit trail: the most recent entries (`audit tail`)
+and filtered searches (`audit query`) by actor, action, entity and time range.
+Every filter maps to an indexed column of `audit_log`.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+import json
+from datetime import datetime
+
+from sqlalchemy import select
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.database import ReadSessionLocal
+from Epic_events.sentry import traced
+from Epic_events.models import AuditLog
+from Epic_events.rich_styles import build_table, console
+
+
+# 🖼️ Utility: Render Audit Entries ──────────────────────────────────────
+def render_audit_table(entries, title: str):
+    """Render audit entries, newest first."""
+    table = build_table(title, ["🆔 ID", "🕒 When", "👤 Actor", "⚡ Action", "🎯 Entity", "🗒️ Details"])
+    for entry in entries:
+        actor = f"{entry.actor_name} ({entry.actor_id})" if entry.actor_id else "—"
+        entity = f"{entry.entity_type} {entry.entity_id}" if entry.entity_id else entry.entity_type
+        table.add_row(
+            str(entry.audit_id),
+            str(entry.created_at),
+            actor,
+            entry.action,
+            entity,
+            json.dumps(entry.details, ensure_ascii=False) if entry.details else "",
+        )
+    console.print(table)
+
+
+# 📜 Query the Audit Log ───────────────────────────────────────────────
+@traced
+def query_audit_logic(limit: int = 20, actor_id: int = None, action: str = None, entity_type: str = None,
+                      entity_id: int = None, since: datetime = None, until: datetime = None):
+    """
+    Display audit entries matching every given filter, newest first.
+
+    Args:
+        limit: Maximum number of entries to show.
+        actor_id: Only entries recorded by this user.
+        action: Only this action (e.g. "contract.signed"); a trailing "*" matches a prefix.
+        entity_type: Only entries about this kind of entity.
+        entity_id: Only entries about this entity ID.
+        since: Only entries recorded at or after this time.
+        until: Only entries recorded before this time.
+    """
+    session = ReadSessionLocal()
+
+    try:
+        query = select(AuditLog)
+        if actor_id is not None:
+            query = query.where(AuditLog.actor_id == actor_id)
+        if action:
+            if action.endswith("*"):
+                query = query.where(AuditLog.action.startswith(action[:-1]))
+            else:
+                query = query.where(AuditLog.action == action)
+        if entity_type:
+            query = query.where(AuditLog.entity_type == entity_type)
+        if entity_id is not None:
+            query = query.where(AuditLog.entity_id == entity_id)
+        if since is not None:
+            query = query.where(AuditLog.created_at >= since)
+        if until is not None:
+            query = query.where(AuditLog.created_at < until)
+
+        entries = session.scalars(query.order_by(AuditLog.created_at.desc(), AuditLog.audit_id.desc())
+                                  .limit(limit)).all()
+        if not entries:
+            console.print("[yellow]⚠️ No audit entries found.[/yellow]")
+            return
+
+        render_audit_table(entries, title=f"📜 Audit Log ({len(entries)} entries)")
+
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+    finally:
+        session.close()
@@ -0,0 +1,196 @@
+"""
+📦 Batch Operations for Epic Events CRM
+
+This module applies a JSON-lines file of create/update operations in a single session,
+without any prompt. Each line is one flat JSON object naming its operation, e.g.:
+
+    {"op": "contract.update", "contract_id": 5, "is_signed": true}
+
+Every operation runs in its own SAVEPOINT, so a failing line is rolled back alone and
+the others still commit. `--atomic` commits all lines or none, and `--dry-run` validates
+everything and rolls back. Role and ownership rules are the same as the CLI commands.
+Update lines may carry the `version_id` they were prepared from; the line fails if the
+row has changed since.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+import json
+import sys
+
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.database import SessionLocal, get_by_id
+from Epic_events.sentry import traced
+from Epic_events.audit import audit_mark, discard_audit_since
+from Epic_events.models import Client, Contract, Event
+from Epic_events.rich_styles import build_table, console
+from Epic_events.service.user_service import get_logged_in_user
+from Epic_events.service.client_service import create_client, update_client
+from Epic_events.service.contract_service import create_contract, update_contract
+from Epic_events.service.event_service import create_event, update_event
+
+
+# 📥 Utility: Read JSON Input ───────────────────────────────────────────
+def read_json_source(path: str) -> dict:
+    """Load one JSON object from a file, or from stdin when `path` is "-"."""
+    if path == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("The JSON input must be an object of field names to values.")
+    return data
+
+
+def merge_cli_fields(data: dict = None, **options) -> dict:
+    """
+    Combine `--from-json` data with explicit CLI options (options win).
+
+    Returns:
+        The merged fields, or None when neither was given (interactive mode).
+    """
+    given = {name: value for name, value in options.items() if value is not None}
+    if data is None and not given:
+        return None
+    return {**(data or {}), **given}
+
+
+# 🧭 Operation Registry ─────────────────────────────────────────────────
+def _create_client(session, user, fields):
+    return create_client(session, **{**fields, "commercial_id": user.user_id}).client_id
+
+
+def _update_client(session, user, fields):
+    client_id = fields.pop("client_id")
+    expected_version = fields.pop("version_id", None)
+    return update_client(session, client_id, expected_version=expected_version, **fields).client_id
+
+
+def _create_contract(session, user, fields):
+    return create_contract(session, **fields).contract_id
+
+
+def _update_contract(session, user, fields):
+    contract_id = fields.pop("contract_id")
+    expected_version = fields.pop("version_id", None)
+    return update_contract(session, contract_id, expected_version=expected_version, **fields).contract_id
+
+
+def _create_event(session, user, fields):
+    return create_event(session, user, **fields).event_id
+
+
+def _update_event(session, user, fields):
+    event_id = fields.pop("event_id")
+    expected_version = fields.pop("version_id", None)
+    return update_event(session, event_id, expected_version=expected_version, **fields).event_id
+
+
+# op -> (handler, allowed roles, ownership rule as (model, owner field, id key) or None)
+OPERATIONS = {
+    "client.create": (_create_client, ["commercial"], None),
+    "client.update": (_update_client, None, (Client, "commercial_id", "client_id")),
+    "contract.create": (_create_contract, ["gestion", "commercial"], None),
+    "contract.update": (_update_contract, None, (Contract, "commercial_id", "contract_id")),
+    "event.create": (_create_event, ["gestion", "commercial"], None),
+    "event.update": (_update_event, None, (Event, "support_id", "event_id")),
+}
+
+
+def check_access(session, user, op: str, fields: dict):
+    """
+    Apply the same rules as `role_required` / `owner_required` for one operation.
+
+    Raises:
+        ValueError: If the operation is unknown or the ID is missing.
+        PermissionError: If the user may not perform it.
+    """
+    if op not in OPERATIONS:
+        raise ValueError(f"Unknown op '{op}'. Expected one of: {', '.join(OPERATIONS)}.")
+    _, roles, ownership = OPERATIONS[op]
+    role = user.role.value
+
+    if roles is not None and role not in roles:
+        raise PermissionError(f"'{role}' users are not allowed to perform {op}.")
+    if ownership is None:
+        return
+
+    model, owner_field, id_key = ownership
+    if fields.get(id_key) is None:
+        raise ValueError(f"Missing required field '{id_key}'.")
+    if role == "gestion":
+        return
+    entity = get_by_id(session, model, fields[id_key])
+    if entity is None:
+        raise ValueError(f"{model.__name__} with ID {fields[id_key]} not found.")
+    if getattr(entity, owner_field) != user.user_id:
+        raise PermissionError("You do not have ownership over this resource.")
+
+
+# 📦 Run a Batch File ───────────────────────────────────────────────────
+@traced
+def run_batch_logic(path: str, atomic: bool = False, dry_run: bool = False):
+    """
+    Apply every operation of a JSON-lines file and print a per-line result table.
+
+    Args:
+        path: JSON-lines file ("-" for stdin).
+        atomic: Roll back every line if any line fails.
+        dry_run: Validate every line, then roll back everything.
+    """
+    session = SessionLocal()
+    results = []
+
+    try:
+        user = get_logged_in_user(session)
+        source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+
+        with source:
+            for line_no, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                op = "?"
+                mark = audit_mark(session)
+                savepoint = session.begin_nested()
+                try:
+                    fields = json.loads(line)
+                    if not isinstance(fields, dict):
+                        raise ValueError("Each line must be a JSON object.")
+                    op = fields.pop("op", None) or "?"
+                    check_access(session, user, op, fields)
+                    entity_id = OPERATIONS[op][0](session, user, fields)
+                    savepoint.commit()
+                    results.append((line_no, op, True, f"ID {entity_id}"))
+                except Exception as e:
+                    savepoint.rollback()
+                    discard_audit_since(session, mark)
+                    results.append((line_no, op, False, str(e)))
+
+        failed = sum(1 for *_, ok, _ in results if not ok)
+        if dry_run or (atomic and failed):
+            session.rollback()
+            committed = 0
+        else:
+            session.commit()
+            committed = len(results) - failed
+
+        table = build_table("Batch Results", ["📄 Line", "⚡ Operation", "📌 Status", "🗒️ Detail"])
+        for line_no, op, ok, detail in results:
+            table.add_row(str(line_no), op, "✅ ok" if ok else "❌ failed", detail)
+        console.print(table)
+
+        if dry_run:
+            console.print(f"[cyan]🧪 Dry run: {len(results) - failed} valid, {failed} failed. "
+                          f"Nothing was written.[/cyan]")
+        elif atomic and failed:
+            console.print(f"[red]❌ {failed} line(s) failed; the whole batch was rolled back.[/red]")
+        else:
+            style = "yellow" if failed else "green"
+            console.print(f"[{style}]✅ {committed} line(s) committed, {failed} failed.[/{style}]")
+
+    except Exception as e:
+        session.rollback()
+        console.print(f"[red]❌ Batch aborted: {e}[/red]")
+    finally:
+        session.close()
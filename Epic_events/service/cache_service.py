@@ -0,0 +1,68 @@
+"""
+🗂️ Result Cache Reporting for Epic Events CRM
+
+This module backs the `cache` commands: hit rates per cached listing, the current
+table change counters, and clearing the cache.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+from sqlalchemy import select
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.database import ReadSessionLocal
+from Epic_events.sentry import traced
+from Epic_events.models import TableVersion
+from Epic_events.config import RESULT_CACHE_ENABLED, RESULT_CACHE_DIR
+from Epic_events.result_cache import stats, load_disk_stats, clear_cache
+from Epic_events.rich_styles import build_table, console
+
+
+def hit_rates(counts: dict) -> list:
+    """Fold "<name>:hit" / "<name>:miss" counts into (name, hits, misses, hit rate %) rows."""
+    names = sorted({key.rsplit(":", 1)[0] for key in counts})
+    rows = []
+    for name in names:
+        hits, misses = counts.get(f"{name}:hit", 0), counts.get(f"{name}:miss", 0)
+        rows.append((name, hits, misses, 100.0 * hits / (hits + misses) if hits + misses else 0.0))
+    return rows
+
+
+# 📈 Cache Stats ─────────────────────────────────────────────────────
+@traced
+def cache_stats_logic():
+    """Show hits, misses and hit rate per cached listing, then the table change counters."""
+    if not RESULT_CACHE_ENABLED:
+        console.print("[yellow]⚠️ The result cache is disabled (RESULT_CACHE=0).[/yellow]")
+
+    counts = load_disk_stats() if RESULT_CACHE_DIR is not None else dict(stats)
+    if RESULT_CACHE_DIR is None:
+        console.print("[dim]💡 RESULT_CACHE_DIR is not set: the cache and its stats only live for one command.[/dim]")
+    rows = hit_rates(counts)
+    if rows:
+        table = build_table("🗂️ Result Cache", ["📋 Listing", "✅ Hits", "🔄 Misses", "📈 Hit Rate"])
+        for name, hits, misses, rate in rows:
+            table.add_row(name, f"{hits:,}", f"{misses:,}", f"{rate:.1f} %")
+        console.print(table)
+    else:
+        console.print("[yellow]⚠️ No cached listing has been served yet.[/yellow]")
+
+    session = ReadSessionLocal()
+    try:
+        versions = session.execute(select(TableVersion.table_name, TableVersion.version)
+                                   .order_by(TableVersion.table_name)).all()
+        table = build_table("🔢 Table Change Counters", ["🗃️ Table", "🔢 Version"])
+        for name, version in versions:
+            table.add_row(name, f"{version:,}")
+        console.print(table)
+    except Exception as e:
+        console.print(f"[red]❌ Error reading table versions: {e}[/red]")
+    finally:
+        session.close()
+
+
+# 🧹 Clear Cache ─────────────────────────────────────────────────────
+@traced
+def cache_clear_logic():
+    """Drop every cached listing and reset the hit / miss stats."""
+    removed = clear_cache()
+    console.print(f"[green]✅ Result cache cleared ({removed} entr{'y' if removed == 1 else 'ies'} removed).[/green]")
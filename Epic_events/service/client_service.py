@@ -8,26 +8,49 @@ enforces validations before changes are made.
 
 # 🧩 External Imports ────────────────────────────────────────────────
 import click
-from rich.console import Console
+from sqlalchemy import update, select, func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime, UTC
 from werkzeug.exceptions import NotFound
 
 # 🏗️ Internal Imports ────────────────────────────────────────────────
-from Epic_events.database import SessionLocal
-from Epic_events.models import Client, User
+from Epic_events.database import SessionLocal, ReadSessionLocal, release_transaction
+from Epic_events.sentry import traced
+from Epic_events.concurrency import check_version, edit_with_version_check
+from Epic_events.counters import rebuild_client_counters
+from Epic_events.result_cache import cached_rows
+from Epic_events.pager import KeysetPager, browse, can_page, page_size_for_terminal
+from Epic_events.snapshot import open_read_session, is_snapshot_session
+from Epic_events.models import Client, User, Contract, UserRole
 from Epic_events.service.user_service import get_logged_in_user
-from Epic_events.rich_styles import build_table
-
-# 🎨 Rich Console Instance ─────────────────────────────────────────────
-console = Console()
+from Epic_events.rich_styles import build_table, console
+from Epic_events.picker import load_candidates, pick, client_candidates, user_candidates
 
 
 # 🖼️ Utility: Render a rich table of clients ─────────────────────────────
+# Columns read by `render_clients_table`; listings select only these into plain rows.
+CLIENT_ROW = (Client.client_id, Client.full_name, Client.email, Client.phone, Client.company_name,
+              Client.commercial_id, Client.created_date, Client.last_contact, Client.open_contracts,
+              Client.unsigned_contracts, Client.total_due, Client.upcoming_events)
+
+
+def client_rows(since: datetime = None):
+    """
+    SELECT of CLIENT_ROW, limited to clients changed at or after `since`.
+
+    `updated_at` also moves when a counter recount changes the amounts shown.
+    """
+    query = select(*CLIENT_ROW)
+    if since is not None:
+        query = query.where(Client.updated_at >= since)
+    return query
+
+
 def render_clients_table(clients, title: str):
     table = build_table(title, ["👤 ID", "🧑 Full Name", "📧 Email", "🔐 phone", " 🏢 Company",
-                                "👤 Commercial Ref", "Creation date", "Last Contact"])
+                                "👤 Commercial Ref", "Creation date", "Last Contact",
+                                "📄 Open", "✍️ Unsigned", "💰 Total Due", "📅 Upcoming"])
     for client in clients:
         table.add_row(
             str(client.client_id),
@@ -37,44 +60,123 @@ def render_clients_table(clients, title: str):
             client.company_name,
             str(client.commercial_id) if client.commercial_id else "Unassigned",
             str(client.created_date),
-            str(client.last_contact)
+            str(client.last_contact),
+            str(client.open_contracts),
+            str(client.unsigned_contracts),
+            str(client.total_due),
+            str(client.upcoming_events),
         )
     console.print(table)
 
 
+# 🧱 Core: Create / Update a Client (no prompts, no commit) ─────────────────
+CLIENT_FIELDS = ("full_name", "email", "phone", "company_name")
+
+
+@traced
+def create_client(session, commercial_id: int, full_name: str = None, email: str = None, phone=None,
+                  company_name: str = None, **unknown) -> Client:
+    """
+    Validate and add a new client to `session` without committing.
+
+    Shared by the interactive prompts, `--from-json` / option mode and `batch run`.
+
+    Raises:
+        ValueError: If a field is missing, unknown or invalid, or the email is already used.
+    """
+    if unknown:
+        raise ValueError(f"Unknown client field(s): {', '.join(sorted(unknown))}.")
+    required = {"full_name": full_name, "email": email, "phone": phone, "company_name": company_name}
+    missing = [name for name, value in required.items() if value in (None, "")]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}.")
+    if not str(phone).isdigit():
+        raise ValueError("Phone number must contain only digits.")
+    if session.query(Client.client_id).filter(Client.email == email).first():
+        raise ValueError(f"Email '{email}' already exists.")
+
+    now = datetime.now(UTC)
+    client = Client(
+        full_name=full_name,
+        email=email,
+        phone=str(phone),
+        company_name=company_name,
+        created_date=now,
+        commercial_id=commercial_id
+    )
+    session.add(client)
+    session.flush()
+    return client
+
+
+@traced
+def update_client(session, client_id: int, expected_version: int = None, **fields) -> Client:
+    """
+    Validate and apply client field changes in `session` without committing.
+
+    Raises:
+        NotFound: If the client does not exist.
+        ValueError: If a field is unknown or invalid.
+        StaleDataError: If the client is no longer at `expected_version`.
+    """
+    unknown = set(fields) - set(CLIENT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown client field(s): {', '.join(sorted(unknown))}.")
+
+    client = session.query(Client).filter(Client.client_id == client_id).first()
+    if not client:
+        raise NotFound(f"Client with ID {client_id} not found.")
+    check_version(client, expected_version, f"Client {client_id}")
+
+    if "phone" in fields and not str(fields["phone"]).isdigit():
+        raise ValueError("Phone number must contain only digits.")
+    if "email" in fields and session.query(Client.client_id).filter(
+            Client.email == fields["email"], Client.client_id != client_id).first():
+        raise ValueError(f"Email '{fields['email']}' already exists.")
+
+    for field, value in fields.items():
+        setattr(client, field, str(value) if field == "phone" else value)
+    session.flush()
+    return client
+
+
 # 📝 Register a New Client ──────────────────────────────────────────────
-def register_client_logic():
-    """Register a new client (commercial only)."""
+@traced
+def prompt_new_client(session) -> dict:
+    """Ask for the fields of a new client, re-prompting until the email is free."""
+    full_name = click.prompt("👤 Client Full Name")
+    while True:
+        email = click.prompt("📧 Client Email")
+        existing = session.query(Client).filter(Client.email == email).first()
+        release_transaction(session)  # No lock while the next prompt waits for the user
+        if existing:
+            console.print(f"[red]❌ Email '{email}' already exists. Please enter a different one.[/red]")
+        else:
+            break
+
+    phone = click.prompt("📱 Client Phone (digits only)", type=int)
+    company_name = click.prompt("🏢 Company Name")
+    return {"full_name": full_name, "email": email, "phone": phone, "company_name": company_name}
+
+
+@traced
+def register_client_logic(data: dict = None):
+    """
+    Register a new client (commercial only).
+
+    Args:
+        data: Client fields for non-interactive use; prompts are shown when omitted.
+    """
     session = SessionLocal()
     try:
         user = get_logged_in_user()
 
-        full_name = click.prompt("👤 Client Full Name")
-        while True:
-            email = click.prompt("📧 Client Email")
-            existing = session.query(Client).filter(Client.email == email).first()
-            if existing:
-                console.print(f"[red]❌ Email '{email}' already exists. Please enter a different one.[/red]")
-            else:
-                break
-
-        phone = click.prompt("📱 Client Phone (digits only)", type=int)
-        company_name = click.prompt("🏢 Company Name")
-        now = datetime.now(UTC)
-
-        client = Client(
-            full_name=full_name,
-            email=email,
-            phone=phone,
-            company_name=company_name,
-            created_date=now,
-            last_contact=now,
-            commercial_id=user.user_id
-        )
+        if data is None:
+            data = prompt_new_client(session)
 
-        session.add(client)
+        client = create_client(session, **{**data, "commercial_id": user.user_id})
         session.commit()
-        console.print(f"[green]✅ Client '{full_name}' added successfully![/green]")
+        console.print(f"[green]✅ Client '{client.full_name}' added successfully![/green]")
 
     except Exception as e:
         session.rollback()
@@ -85,63 +187,78 @@ def register_client_logic():
 
 
 # 🔧 Update an Existing Client ─────────────────────────────────────────────
-def update_client_logic(client_id: int):
-    session = SessionLocal()
-    now = datetime.now(UTC)
+@traced
+def prompt_client_changes(session, client_id: int) -> dict:
+    """Ask for client fields to change; blank answers are skipped."""
     updated_fields = {}
+    click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
+
+    full_name = click.prompt("👤 Full Name", default="", show_default=False)
+    if full_name:
+        updated_fields["full_name"] = full_name
+        click.secho("✅ Full Name updated.", fg="green")
+
+    company_name = click.prompt("🏢 Company Name", default="", show_default=False)
+    if company_name:
+        updated_fields["company_name"] = company_name
+        click.secho("✅ Company Name updated.", fg="green")
+
+    while True:
+        email = click.prompt("📧 Email (leave blank to skip)", default="", show_default=False)
+        if not email:
+            break
+        existing = session.query(Client).filter(Client.email == email, Client.client_id != client_id).first()
+        release_transaction(session)  # No lock while the next prompt waits for the user
+        if existing:
+            console.print(f"[red]❌ Email '{email}' "
+                          f"already exists. Please enter a different one or leave blank.[/red]")
+        else:
+            updated_fields["email"] = email
+            click.secho("✅ Email updated.", fg="green")
+            break
+
+    while True:
+        phone = click.prompt("📱 Phone (leave blank to skip)", default="", show_default=False)
+        if not phone:
+            break
+
+        if phone.isdigit():
+            updated_fields["phone"] = phone
+            click.secho("✅ Phone number updated.", fg="green")
+            break
+        else:
+            click.secho("❌ Error: Phone number must contain only digits.", fg="red")
+
+    return updated_fields
+
+
+@traced
+def update_client_logic(client_id: int, data: dict = None):
+    """
+    Update a client's information.
+
+    Args:
+        client_id: ID of the client to update.
+        data: Fields to change for non-interactive use; prompts are shown when omitted.
+    """
+    session = SessionLocal()
     try:
-        client = session.query(Client).filter(Client.client_id == client_id).first()
-        if not client:
-            raise NotFound(f"Client with ID {client_id} not found.")
-
-        click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
-
-        updated_fields["last_contact"] = now
-
-        full_name = click.prompt("👤 Full Name", default="", show_default=False)
-        if full_name:
-            updated_fields["full_name"] = full_name
-            click.secho("✅ Full Name updated.", fg="green")
-
-        company_name = click.prompt("🏢 Company Name", default="", show_default=False)
-        if company_name:
-            updated_fields["company_name"] = company_name
-            click.secho("✅ Company Name updated.", fg="green")
-
-        while True:
-            email = click.prompt("📧 Email (leave blank to skip)", default="", show_default=False)
-            if not email:
-                break
-            existing = session.query(Client).filter(Client.email == email, Client.client_id != client_id).first()
-            if existing:
-                console.print(f"[red]❌ Email '{email}' "
-                              f"already exists. Please enter a different one or leave blank.[/red]")
-            else:
-                updated_fields["email"] = email
-                click.secho("✅ Email updated.", fg="green")
-                break
-
-        while True:
-            phone = click.prompt("📱 Phone (leave blank to skip)", default="", show_default=False)
-            if not phone:
-                break
-
-            if phone.isdigit():
-                updated_fields["phone"] = phone
-                click.secho("✅ Phone number updated.", fg="green")
-                break
-            else:
-                click.secho("❌ Error: Phone number must contain only digits.", fg="red")
-
+        data = dict(data) if data is not None else None
+        expected_version = data.pop("version_id", None) if data is not None else None
+
+        updated_fields = edit_with_version_check(
+            session, Client, client_id, f"Client {client_id}",
+            collect=lambda: prompt_client_changes(session, client_id) if data is None else data,
+            apply=lambda s, version, fields: update_client(s, client_id, expected_version=version, **fields),
+            expected_version=expected_version,
+            interactive=data is None,
+        )
+        if updated_fields is None:
+            return
         if not updated_fields:
             click.secho("⚠️ No changes entered. Nothing to update.", fg="yellow")
             return
 
-        for field, value in updated_fields.items():
-            if hasattr(client, field):
-                setattr(client, field, value)
-
-        session.commit()
         click.secho(f"✅ Client with ID {client_id} has been updated.", fg="green")
 
     except Exception as e:
@@ -152,6 +269,18 @@ def update_client_logic(client_id: int):
 
 
 # 🔄 Reassign Commercial to Client ─────────────────────────────────────
+@traced
+def prompt_reassign_commercial_targets() -> tuple[int, int]:
+    """Pick the client and its new commercial from candidates preloaded in one query."""
+    session = ReadSessionLocal()
+    try:
+        found = load_candidates(session, client_candidates(), user_candidates(UserRole.commercial))
+    finally:
+        session.close()
+    return pick("🔹 Client to reassign", found["clients"]), pick("💼 New commercial", found["commercial"])
+
+
+@traced
 def reassign_commercial_logic(client_id: int, new_commercial_id: int):
     session = SessionLocal()
     try:
@@ -175,7 +304,108 @@ def reassign_commercial_logic(client_id: int, new_commercial_id: int):
         session.close()
 
 
+# 🔄 Validate Bulk Reassignment Users ─────────────────────────────────
+@traced
+def validate_bulk_reassignment(session, from_id: int, to_id: int, role: UserRole):
+    """
+    Check both ends of a bulk reassignment with a single query.
+
+    The source user may have any role (or already be gone); the target must exist with `role`.
+    """
+    if from_id == to_id:
+        raise ValueError("Source and target users must be different.")
+
+    roles = dict(session.execute(
+        select(User.user_id, User.role).where(User.user_id.in_([from_id, to_id]))
+    ).all())
+    if roles.get(to_id) != role:
+        raise NotFound(f"User ID {to_id} is not a valid {role.value}.")
+
+
+# 🔄 Validate Single Reassignment Targets ─────────────────────────────
+def validate_reassignment(session, fields: dict, user_field: str, role: UserRole, kind: str) -> dict:
+    """
+    Check the new `client_id` and `user_field` of a reassignment given as options or JSON.
+
+    Returns:
+        The fields as integers.
+
+    Raises:
+        ValueError: If a field is unknown, nothing is given, the client does not exist,
+            or the user does not have `role`.
+    """
+    unknown = set(fields) - {"client_id", user_field}
+    if unknown:
+        raise ValueError(f"Unknown {kind} field(s): {', '.join(sorted(unknown))}.")
+    if not fields:
+        raise ValueError(f"Nothing to reassign: give client_id and/or {user_field}.")
+    try:
+        fields = {name: int(value) for name, value in fields.items()}
+    except (TypeError, ValueError):
+        raise ValueError(f"client_id and {user_field} must be integers.")
+
+    if "client_id" in fields and not session.scalar(
+            select(Client.client_id).where(Client.client_id == fields["client_id"])):
+        raise ValueError(f"Client with ID {fields['client_id']} not found.")
+    if user_field in fields and session.scalar(
+            select(User.role).where(User.user_id == fields[user_field])) != role:
+        raise ValueError(f"User ID {fields[user_field]} is not a valid {role.value}.")
+    return fields
+
+
+# 🔄 Bulk Reassign Clients ─────────────────────────────────────────────
+@traced
+def reassign_all_clients_logic(from_id: int, to_id: int, company_name: str = None, with_contracts: bool = False):
+    """
+    Move every client of one commercial to another in a single transaction.
+
+    Args:
+        from_id: Commercial currently assigned to the clients.
+        to_id: Commercial taking over the clients.
+        company_name: Only move clients of this company.
+        with_contracts: Also move those clients' contracts still held by `from_id`.
+
+    Returns:
+        tuple[int, int]: Number of clients and contracts moved.
+    """
+    session = SessionLocal()
+    try:
+        validate_bulk_reassignment(session, from_id, to_id, UserRole.commercial)
+
+        moved_clients = select(Client.client_id).where(Client.commercial_id == from_id)
+        if company_name:
+            moved_clients = moved_clients.where(Client.company_name == company_name)
+
+        contracts_moved = 0
+        if with_contracts:
+            # Contracts go first: the subquery still sees the clients under their old commercial.
+            contracts_moved = session.execute(
+                update(Contract)
+                .where(Contract.commercial_id == from_id, Contract.client_id.in_(moved_clients))
+                .values(commercial_id=to_id, version_id=Contract.version_id + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+        clients_update = update(Client).where(Client.commercial_id == from_id)
+        if company_name:
+            clients_update = clients_update.where(Client.company_name == company_name)
+        clients_moved = session.execute(
+            clients_update.values(commercial_id=to_id, version_id=Client.version_id + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        session.commit()
+        return clients_moved, contracts_moved
+
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+
 # 🗑️ Delete a Client ─────────────────────────────────────────────────────
+@traced
 def delete_client_logic(client_id: int):
     session = SessionLocal()
     try:
@@ -198,14 +428,24 @@ def delete_client_logic(client_id: int):
         session.close()
 
 
+# ↕️ Listing Order ───────────────────────────────────────────────────────────
+# `total_due` is indexed, so the largest balances come first without a sort step.
+CLIENT_SORTS = {
+    "client_id": (Client.client_id,),
+    "total_due": (Client.total_due.desc(), Client.client_id),
+}
+
+
 # 📋 List Clients Assigned to Logged-in Commercial ────────────────────────
-def list_my_clients_logic():
-    """List clients assigned to the logged-in commercial user only."""
-    user = get_logged_in_user()
-    session = SessionLocal()
+@traced
+def list_my_clients_logic(sort: str = "client_id", since: datetime = None):
+    """List clients assigned to the logged-in commercial user, optionally only those changed since `since`."""
+    session = ReadSessionLocal()
 
     try:
-        clients = session.query(Client).filter(Client.commercial_id == user.user_id).all()
+        user = get_logged_in_user(session)
+        clients = session.execute(client_rows(since).where(Client.commercial_id == user.user_id)
+                                  .order_by(*CLIENT_SORTS[sort])).all()
 
         if not clients:
             console.print("[yellow]⚠️ You have no clients assigned.[/yellow]")
@@ -220,13 +460,26 @@ def list_my_clients_logic():
 
 
 # 🌐 List All Clients ───────────────────────────────────────────────────────
-def list_clients_logic():
-    """List all clients, regardless of role."""
-    get_logged_in_user()
-    session: Session = SessionLocal()
+@traced
+def list_clients_logic(sort: str = "client_id", pager: bool = False, since: datetime = None):
+    """
+    List all clients, regardless of role, in `sort` order (see CLIENT_SORTS).
+
+    With `pager`, browse page by page, fetching each page on demand (needs a terminal).
+    With `since`, only clients edited or contacted at or after that time.
+    """
+    session: Session = ReadSessionLocal()
 
     try:
-        clients = session.query(Client).all()
+        get_logged_in_user(session)
+        if pager and can_page():
+            browse(KeysetPager(session, client_rows(since), CLIENT_SORTS[sort], page_size_for_terminal(),
+                               search_columns=(Client.full_name, Client.email, Client.company_name),
+                               id_column=Client.client_id),
+                   render_clients_table, "📋 All Clients", "No clients found.")
+            return
+        clients = cached_rows(session, "client list", client_rows(since).order_by(*CLIENT_SORTS[sort]),
+                              ["clients"])
 
         if not clients:
             console.print("[yellow]⚠️ No clients found.[/yellow]")
@@ -240,12 +493,34 @@ def list_clients_logic():
         session.close()
 
 
+# 🔢 Rebuild Client Counters ─────────────────────────────────────────────────
+@traced
+def rebuild_client_counters_logic():
+    """Recount every client's contract and event counters with one set-based UPDATE."""
+    session = SessionLocal()
+
+    try:
+        corrected = rebuild_client_counters(session)
+        session.commit()
+        total = session.scalar(select(func.count()).select_from(Client))
+        console.print(f"[green]✅ Counters rebuilt for {total} client(s); {corrected} were out of date.[/green]")
+
+    except Exception as e:
+        session.rollback()
+        console.print(f"[red]❌ Error rebuilding counters: {e}[/red]")
+    finally:
+        session.close()
+
+
 # 🔍 Display Details for a Specific Client ───────────────────────────────
+@traced
 def list_client_details_logic():
     """📋 Display details for a single event by ID."""
-    session = SessionLocal()
+    session = open_read_session()
 
     try:
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
         while True:
             client_id = click.prompt("🔎 Enter the Client ID to show details", type=int)
             client = session.query(Client).filter(Client.client_id == client_id).first()
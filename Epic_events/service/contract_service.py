@@ -2,28 +2,49 @@
 📄 Contract Business Logic for Epic Events CRM
 
 This module contains backend logic for managing contracts: creating, listing, updating,
-deleting, and reassigning contracts. It handles database interactions and enforces role-based validation
+deleting, and reassigning contracts, and recording payments in the `payments` ledger. It handles database interactions and enforces role-based validation
 for secure and consistent operations across the CRM.
 """
 
 # 🧩 External Imports ────────────────────────────────────────────────
+import csv
 import click
 import sentry_sdk
-from rich.console import Console
 from datetime import datetime, UTC
+from sqlalchemy import update, insert, select, func
+from sqlalchemy.exc import IntegrityError
 from werkzeug.exceptions import NotFound
 
 # 🏗️ Internal Imports ────────────────────────────────────────────────
-from Epic_events.database import SessionLocal
-from Epic_events.models import Client, User, Contract, UserRole
+from Epic_events.database import SessionLocal, ReadSessionLocal, release_transaction
+from Epic_events.sentry import traced
+from Epic_events.concurrency import check_version, edit_with_version_check
+from Epic_events.snapshot import open_read_session, is_snapshot_session
+from Epic_events.models import Client, User, Contract, Payment, UserRole
 from Epic_events.service.user_service import get_logged_in_user
-from Epic_events.rich_styles import build_table
-
-# 🎨 Rich Console Setup ──────────────────────────────────────────────
-console = Console()
+from Epic_events.service.client_service import validate_bulk_reassignment, validate_reassignment
+from Epic_events.audit import record_audit, audit_mark, discard_audit_since
+from Epic_events.counters import touch_client_counters
+from Epic_events.result_cache import cached_rows
+from Epic_events.pager import KeysetPager, browse, can_page, page_size_for_terminal
+from Epic_events.rich_styles import build_table, console
+from Epic_events.picker import load_candidates, pick, client_candidates, user_candidates
 
 
 # 🖼️ Utility: Render Contracts Table ─────────────────────────────────
+# Columns read by `render_contracts_table`; listings select only these into plain rows.
+CONTRACT_ROW = (Contract.contract_id, Contract.amount_total, Contract.amount_due, Contract.is_signed,
+                Contract.commercial_id, Contract.client_id, Contract.created_at)
+
+
+def contract_rows(since: datetime = None):
+    """SELECT of CONTRACT_ROW, limited to contracts changed at or after `since`."""
+    query = select(*CONTRACT_ROW)
+    if since is not None:
+        query = query.where(Contract.updated_at >= since)
+    return query
+
+
 def render_contracts_table(contracts, title: str):
     table = build_table(title, ["🆔 ID", "🤑 Total Amount", "💰 Remains to pay", "🤝 Is Signed",
                                         "👤 Commercial Ref", "💼 Client Ref", "Creation Date"])
@@ -40,49 +61,164 @@ def render_contracts_table(contracts, title: str):
     console.print(table)
 
 
-# 📝 Create Contract ─────────────────────────────────────────────────
-def create_contract_logic():
-    session = SessionLocal()
-    now = datetime.now(UTC)
+# 🧱 Core: Create / Update a Contract (no prompts, no commit) ──────────────
+# After creation, `amount_due` only moves through the payments ledger (`record_payment`).
+CONTRACT_FIELDS = ("amount_total", "is_signed")
 
+
+def _as_amount(name: str, value) -> int:
+    """Coerce a whole amount given as int, integral float or digit string; reject fractions, negatives and text."""
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a whole number.")
     try:
-        amount_total = click.prompt("🤑 Total amount of the contract", type=float)
-        amount_due = click.prompt("💰 Remains to pay", type=float)
-        is_signed = click.prompt("✅ Is the contract signed? (True/False)", type=bool)
+        amount = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number.")
+    if not amount.is_integer():
+        raise ValueError(f"{name} must be a whole number, got {value}.")
+    amount = int(amount)
+    if amount < 0:
+        raise ValueError(f"{name} cannot be negative.")
+    return amount
+
+
+def _as_bool(name: str, value) -> bool:
+    """Coerce JSON booleans and 'true'/'false' strings."""
+    if isinstance(value, bool):
+        return value
+    if str(value).strip().lower() in ("true", "1", "yes", "y"):
+        return True
+    if str(value).strip().lower() in ("false", "0", "no", "n"):
+        return False
+    raise ValueError(f"{name} must be true or false.")
+
+
+@traced
+def create_contract(session, client_id: int = None, commercial_id: int = None, amount_total=None, amount_due=None,
+                    is_signed=False, **unknown) -> Contract:
+    """
+    Validate and add a new contract to `session` without committing.
+
+    Shared by the interactive prompts, `--from-json` / option mode and `batch run`.
+
+    Raises:
+        ValueError: If a field is missing or unknown, the client or commercial is invalid,
+            or an amount is malformed.
+    """
+    if unknown:
+        raise ValueError(f"Unknown contract field(s): {', '.join(sorted(unknown))}.")
+    required = {"client_id": client_id, "commercial_id": commercial_id,
+                "amount_total": amount_total, "amount_due": amount_due}
+    missing = [name for name, value in required.items() if value in (None, "")]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}.")
+
+    amount_total = _as_amount("amount_total", amount_total)
+    amount_due = _as_amount("amount_due", amount_due)
+    if amount_due > amount_total:
+        raise ValueError("amount_due cannot exceed amount_total.")
+
+    if not session.query(Client.client_id).filter_by(client_id=client_id).first():
+        raise ValueError(f"Client with ID {client_id} not found.")
+    user = session.query(User).filter_by(user_id=commercial_id).first()
+    if not user or user.role != UserRole.commercial:
+        raise ValueError(f"User with ID {commercial_id} is not a commercial.")
+
+    contract = Contract(
+        amount_total=amount_total,
+        amount_due=amount_due,
+        created_at=datetime.now(UTC),
+        is_signed=_as_bool("is_signed", is_signed),
+        commercial_id=commercial_id,
+        client_id=client_id,
+    )
+    session.add(contract)
+    session.flush()
+    return contract
+
+
+@traced
+def update_contract(session, contract_id: int, expected_version: int = None, **fields) -> Contract:
+    """
+    Validate and apply contract field changes in `session` without committing.
+
+    `amount_due` cannot be set: it changes only with recorded payments. A new `amount_total`
+    moves `amount_due` by the same difference, so the amount already paid is kept.
+
+    Raises:
+        NotFound: If the contract does not exist.
+        ValueError: If a field is unknown or invalid, or the new total is below the amount paid.
+        StaleDataError: If the contract is no longer at `expected_version`.
+    """
+    if "amount_due" in fields:
+        raise ValueError("amount_due only changes with recorded payments (`contract pay`); "
+                         "change amount_total to correct the contract.")
+    unknown = set(fields) - set(CONTRACT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown contract field(s): {', '.join(sorted(unknown))}.")
+
+    contract = session.query(Contract).filter(Contract.contract_id == contract_id).first()
+    if not contract:
+        raise NotFound(f"Contract with ID {contract_id} not found.")
+    check_version(contract, expected_version, f"Contract {contract_id}")
+
+    changes = {}
+    if "amount_total" in fields:
+        changes["amount_total"] = _as_amount("amount_total", fields["amount_total"])
+        paid = contract.amount_total - contract.amount_due
+        if changes["amount_total"] < paid:
+            raise ValueError(f"amount_total cannot be below the {paid} already paid on contract {contract_id}.")
+        changes["amount_due"] = changes["amount_total"] - paid
+    if "is_signed" in fields:
+        changes["is_signed"] = _as_bool("is_signed", fields["is_signed"])
+
+    newly_signed = changes.get("is_signed") and not contract.is_signed
+    for field, value in changes.items():
+        setattr(contract, field, value)
+
+    record_audit(session, "contract.updated", "contract", contract_id, fields=sorted(changes))
+    if newly_signed:
+        record_audit(session, "contract.signed", "contract", contract_id)
+    session.flush()
+    return contract
 
-        while True:
-            client_id = click.prompt("👤 Client ID", type=int)
-            client = session.query(Client).filter_by(client_id=client_id).first()
-            if not client:
-                console.print(f"[red]❌ Client with ID {client_id} not found.[/red]")
-                continue
-            break
 
-        while True:
-            commercial_id = click.prompt("🧑‍💼 Commercial ID", type=int)
-            user = session.query(User).filter_by(user_id=commercial_id).first()
-            if not user:
-                console.print(f"[red]❌ User with ID {commercial_id} not found.[/red]")
-                continue
-            if user.role != UserRole.commercial:
-                console.print(f"[red]❌ User with ID {commercial_id} is not a commercial.[/red]")
-                continue
-            break
+# 📝 Create Contract ─────────────────────────────────────────────────
+@traced
+def prompt_new_contract(session) -> dict:
+    """Ask for the fields of a new contract; client and commercial are picked from preloaded candidates."""
+    amount_total = click.prompt("🤑 Total amount of the contract", type=int)
+    amount_due = click.prompt("💰 Remains to pay", type=int)
+    is_signed = click.prompt("✅ Is the contract signed? (True/False)", type=bool)
+
+    # 📥 Preload clients and commercials in one query
+    found = load_candidates(session, client_candidates(), user_candidates(UserRole.commercial))
+    release_transaction(session)
+    client_id = pick("👤 Client", found["clients"])
+    commercial_id = pick("🧑‍💼 Commercial", found["commercial"])
+
+    return {"amount_total": amount_total, "amount_due": amount_due, "is_signed": is_signed,
+            "client_id": client_id, "commercial_id": commercial_id}
+
+
+@traced
+def create_contract_logic(data: dict = None):
+    """
+    Create a new contract.
+
+    Args:
+        data: Contract fields for non-interactive use; prompts are shown when omitted.
+    """
+    session = SessionLocal()
 
-        console.print(f"[yellow]Debug: user.role = {user.role}[/yellow]")
+    try:
+        if data is None:
+            data = prompt_new_contract(session)
 
-        contract = Contract(
-            amount_total=amount_total,
-            amount_due=amount_due,
-            created_at=now,
-            is_signed=is_signed,
-            commercial_id=commercial_id,
-            client_id=client_id,
-        )
-        session.add(contract)
+        contract = create_contract(session, **data)
         session.commit()
 
-        console.print(f"[green]✅ Contract ID '{contract.contract_id}' attached to client '{client_id}' "
+        console.print(f"[green]✅ Contract ID '{contract.contract_id}' attached to client '{contract.client_id}' "
                       f"added successfully![/green]")
 
     except Exception as e:
@@ -94,12 +230,23 @@ def create_contract_logic():
 
 
 # 📋 List All Contracts ──────────────────────────────────────────────
-def list_contracts_logic():
-    """List All Contracts regardless of role."""
-    session = SessionLocal()
+@traced
+def list_contracts_logic(pager: bool = False, since: datetime = None):
+    """
+    List All Contracts regardless of role.
+
+    `pager` browses page by page (needs a terminal); `since` keeps contracts changed at or after it.
+    """
+    session = ReadSessionLocal()
 
     try:
-        contracts = session.query(Contract).all()
+        if pager and can_page():
+            browse(KeysetPager(session, contract_rows(since), [Contract.contract_id], page_size_for_terminal(),
+                               id_column=Contract.contract_id),
+                   render_contracts_table, "📋 All Contracts", "No Contracts found.")
+            return
+
+        contracts = cached_rows(session, "contract list", contract_rows(since), ["contracts"])
 
         if not contracts:
             console.print("[yellow]⚠️ No Contracts found.[/yellow]")
@@ -114,13 +261,14 @@ def list_contracts_logic():
 
 
 # 📋 List Contracts for Logged-in Commercial ───────────────────────
-def list_my_contracts_logic():
-    """List clients assigned to the logged-in commercial user only."""
-    user = get_logged_in_user()
-    session = SessionLocal()
+@traced
+def list_my_contracts_logic(since: datetime = None):
+    """List contracts assigned to the logged-in commercial user, optionally only those changed since `since`."""
+    session = ReadSessionLocal()
 
     try:
-        contracts = session.query(Contract).filter(Contract.commercial_id == user.user_id).all()
+        user = get_logged_in_user(session)
+        contracts = session.execute(contract_rows(since).where(Contract.commercial_id == user.user_id)).all()
 
         if not contracts:
             console.print("[yellow]⚠️ You have no contracts assigned.[/yellow]")
@@ -135,12 +283,13 @@ def list_my_contracts_logic():
 
 
 # ❗ List Unsigned Contracts ─────────────────────────────────────
-def list_not_signed_contract_logic():
-    """List clients not signed."""
-    session = SessionLocal()
+@traced
+def list_not_signed_contract_logic(since: datetime = None):
+    """List contracts not signed, optionally only those changed since `since`."""
+    session = ReadSessionLocal()
 
     try:
-        contracts = session.query(Contract).filter(Contract.is_signed == "False").all()
+        contracts = session.execute(contract_rows(since).where(Contract.is_signed.is_(False))).all()
         if not contracts:
             console.print("[yellow]⚠️ All Contracts are already singed.[/yellow]")
             return
@@ -153,11 +302,14 @@ def list_not_signed_contract_logic():
 
 
 # 🔍 View Contract Details by ID ──────────────────────────────────
+@traced
 def list_contract_details_logic():
     """📋 Display details for a single event by ID."""
-    session = SessionLocal()
+    session = open_read_session()
 
     try:
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
         while True:
             contract_id = click.prompt("🔎 Enter the Contract ID to show details", type=int)
             contract = session.query(Contract).filter(Contract.contract_id == contract_id).first()
@@ -177,13 +329,14 @@ def list_contract_details_logic():
 
 
 # 📄 List Contracts for a Client ─────────────────────────────────────
-def list_client_contracts_logic():
-    """List contracts linked to a specific client."""
-    session = SessionLocal()
+@traced
+def list_client_contracts_logic(since: datetime = None):
+    """List contracts linked to a specific client, optionally only those changed since `since`."""
+    session = ReadSessionLocal()
 
     try:
         client_id = click.prompt("🔎 Enter Client ID to list attached contracts", type=int)
-        contracts = session.query(Contract).filter(Contract.client_id == client_id).all()
+        contracts = session.execute(contract_rows(since).where(Contract.client_id == client_id)).all()
 
         if not contracts:
             console.print("[yellow]⚠️ No Contracts found.[/yellow]")
@@ -198,72 +351,83 @@ def list_client_contracts_logic():
 
 
 # 🔧 Update Contract ─────────────────────────────────────────────────
-def update_contract_logic(contract_id: int):
-    session = SessionLocal()
+@traced
+def prompt_contract_changes() -> dict:
+    """Ask for contract fields to change; blank answers are skipped (the amount due moves with payments)."""
     updated_fields = {}
 
-    try:
-        while True:
-            contract = session.query(Contract).filter(Contract.contract_id == contract_id).first()
+    while True:
+        amount_total = click.prompt("🤑 Total amount of the contract", default="", show_default=False)
+        if amount_total == "":
+            break
+        if amount_total.isdigit():
+            updated_fields["amount_total"] = amount_total
+            click.secho("✅ Total amount updated.", fg="green")
+            break
+        else:
+            click.secho("❌ Please enter digits only.", fg="red")
 
-            if not contract:
-                click.secho(f"❌  Contract with ID {contract_id} not found.", fg="red")
-                return
+    while True:
+        is_signed = click.prompt("✅ Is the contract signed now? (True)", default="", show_default=False)
+        if is_signed == "":
+            break
+        if is_signed.lower() in ["true"]:
+            updated_fields["is_signed"] = is_signed.lower() == "true"
+            click.secho("✅ Contract signature status updated.", fg="green")
+            break
+        else:
+            click.secho("❌ Please enter 'True' only if "
+                        "contract is signed or leave it empty.", fg="red")
 
-            else:
-                click.secho(f"🔧 Updating contract with ID {contract_id}...", fg="cyan")
-                click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
-                break
+    return updated_fields
 
-        while True:
-            amount_total = click.prompt("🤑 Total amount of the contract", default="", show_default=False)
-            if amount_total == "":
-                break
-            if amount_total.isdigit():
-                updated_fields["amount_total"] = amount_total
-                click.secho("✅ Total amount updated.", fg="green")
-                break
-            else:
-                click.secho("❌ Please enter digits only.", fg="red")
 
-        while True:
-            amount_due = click.prompt("💰 Remains to pay", default="", show_default=False)
-            if amount_due == "":
-                break
-            if amount_due.isdigit():
-                updated_fields["amount_due"] = amount_due
-                click.secho("✅ Remaining amount updated.", fg="green")
-                break
-            else:
-                click.secho("❌ Please enter digits only.", fg="red")
+@traced
+def update_contract_logic(contract_id: int, data: dict = None):
+    """
+    Update a contract's amounts or signature status.
 
-        while True:
-            is_signed = click.prompt("✅ Is the contract signed now? (True)", default="", show_default=False)
-            if is_signed == "":
-                break
-            if is_signed.lower() in ["true"]:
-                updated_fields["is_signed"] = is_signed.lower() == "true"
-                click.secho("✅ Contract signature status updated.", fg="green")
-                sentry_sdk.capture_message(
-                    f"✅ Contract with ID {contract_id} has been signed.",
-                    level="info"
-                )
-                break
-            else:
-                click.secho("❌ Please enter 'True' only if "
-                            "contract is signed or leave it empty.", fg="red")
+    Args:
+        contract_id: ID of the contract to update.
+        data: Fields to change for non-interactive use; prompts are shown when omitted.
+    """
+    session = SessionLocal()
 
+    try:
+        contract = session.query(Contract).filter(Contract.contract_id == contract_id).first()
+
+        if not contract:
+            click.secho(f"❌  Contract with ID {contract_id} not found.", fg="red")
+            return
+
+        data = dict(data) if data is not None else None
+        expected_version = data.pop("version_id", None) if data is not None else None
+
+        def collect():
+            if data is not None:
+                return data
+            click.secho(f"🔧 Updating contract with ID {contract_id}...", fg="cyan")
+            click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
+            return prompt_contract_changes()
+
+        updated_fields = edit_with_version_check(
+            session, Contract, contract_id, f"Contract {contract_id}",
+            collect=collect,
+            apply=lambda s, version, fields: update_contract(s, contract_id, expected_version=version, **fields),
+            expected_version=expected_version,
+            interactive=data is None,
+        )
+        if updated_fields is None:
+            return
         if not updated_fields:
             click.secho("⚠️ No changes entered. Nothing to update.", fg="yellow")
             return
 
-        for field, value in updated_fields.items():
-            if hasattr(contract, field):
-                setattr(contract, field, value)
-
-        session.commit()
         click.secho(f"✅ Contract with ID {contract_id} has been updated.", fg="green")
 
+    except ValueError as e:
+        session.rollback()
+        click.secho(f"❌ Error updating contract: {e}", fg="red")
     except Exception as e:
         session.rollback()
         sentry_sdk.capture_exception(e)  # ✅ Log unexpected error
@@ -272,8 +436,174 @@ def update_contract_logic(contract_id: int):
         session.close()
 
 
+# 💳 Record Payments ─────────────────────────────────────────────────
+@traced
+def record_payment(session, contract_id: int, amount, recorded_by: int = None, reference: str = None,
+                   paid_at: datetime = None) -> int:
+    """
+    Decrement `amount_due` atomically and append the payment to the ledger, without committing.
+
+    The balance is changed by one conditional `UPDATE ... SET amount_due = amount_due - :x
+    WHERE amount_due >= :x RETURNING amount_due`, so concurrent payments never overwrite each
+    other and no row lock is held while a user is typing.
+
+    Returns:
+        The amount still due after this payment.
+
+    Raises:
+        NotFound: If the contract does not exist.
+        ValueError: If the amount is not positive or exceeds the amount due.
+    """
+    amount = _as_amount("amount", amount)
+    if amount == 0:
+        raise ValueError("amount must be greater than zero.")
+
+    updated = session.execute(
+        update(Contract)
+        .where(Contract.contract_id == contract_id, Contract.amount_due >= amount)
+        .values(amount_due=Contract.amount_due - amount, version_id=Contract.version_id + 1)
+        .returning(Contract.amount_due, Contract.client_id)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+
+    if updated is None:
+        amount_due = session.scalar(select(Contract.amount_due).where(Contract.contract_id == contract_id))
+        if amount_due is None:
+            raise NotFound(f"Contract with ID {contract_id} not found.")
+        raise ValueError(f"Payment of {amount} exceeds the amount due ({amount_due}) on contract {contract_id}.")
+    remaining, client_id = updated
+    touch_client_counters(session, client_id)  # Core UPDATE: the flush hook does not see it
+
+    session.execute(insert(Payment).values(
+        contract_id=contract_id,
+        amount=amount,
+        amount_due_after=remaining,
+        paid_at=paid_at or datetime.now(UTC),
+        reference=reference or None,
+        recorded_by=recorded_by,
+    ))
+    record_audit(session, "contract.payment", "contract", contract_id, amount=amount, amount_due=remaining)
+    return remaining
+
+
+@traced
+def pay_contract_logic(contract_id: int, amount, reference: str = None):
+    """Record one payment on a contract and show the new balance."""
+    session = SessionLocal()
+
+    try:
+        user = get_logged_in_user()
+        remaining = record_payment(session, contract_id, amount, recorded_by=user.user_id, reference=reference)
+        session.commit()
+        click.secho(f"✅ Payment of {amount} recorded on contract {contract_id}. Remaining due: {remaining}.",
+                    fg="green")
+
+    except IntegrityError:
+        session.rollback()
+        click.secho(f"❌ A payment with reference '{reference}' was already recorded.", fg="red")
+    except Exception as e:
+        session.rollback()
+        click.secho(f"❌ Error recording payment: {e}", fg="red")
+    finally:
+        session.close()
+
+
+@traced
+def import_payments_logic(path: str, dry_run: bool = False):
+    """
+    Import payments from a bank statement CSV (columns: contract_id, amount, [reference], [paid_at]).
+
+    Each row runs in its own SAVEPOINT: a row that fails (unknown contract, overpayment,
+    reference already imported) is reported and skipped, the others are recorded.
+    `paid_at` accepts ISO 8601 or DD-MM-YYYY.
+    """
+    session = SessionLocal()
+    results = []
+
+    try:
+        user = get_logged_in_user()
+        with open(path, newline="", encoding="utf-8") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                savepoint = session.begin_nested()
+                mark = audit_mark(session)
+                try:
+                    paid_at = row.get("paid_at") or None
+                    if paid_at:
+                        try:
+                            paid_at = datetime.fromisoformat(paid_at)
+                        except ValueError:
+                            paid_at = datetime.strptime(paid_at, "%d-%m-%Y")
+                    remaining = record_payment(session, int(row["contract_id"]), row["amount"],
+                                               recorded_by=user.user_id, reference=row.get("reference"),
+                                               paid_at=paid_at)
+                    savepoint.commit()
+                    results.append((line_no, row.get("contract_id"), row.get("amount"), True,
+                                    f"Remaining due: {remaining}"))
+                except Exception as e:
+                    savepoint.rollback()
+                    discard_audit_since(session, mark)
+                    detail = "Reference already imported." if isinstance(e, IntegrityError) else str(e)
+                    results.append((line_no, row.get("contract_id"), row.get("amount"), False, detail))
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+
+        table = build_table("Payment Import", ["📄 Line", "📄 Contract", "💰 Amount", "📌 Status", "🗒️ Detail"])
+        for line_no, contract_id, amount, ok, detail in results:
+            table.add_row(str(line_no), str(contract_id), str(amount), "✅ ok" if ok else "❌ failed", detail)
+        console.print(table)
+
+        recorded = sum(1 for result in results if result[3])
+        prefix = "🧪 Dry run: nothing was written. " if dry_run else ""
+        console.print(f"[green]{prefix}✅ {recorded} payment(s) valid, {len(results) - recorded} rejected.[/green]")
+
+    except Exception as e:
+        session.rollback()
+        console.print(f"[red]❌ Import aborted: {e}[/red]")
+    finally:
+        session.close()
+
+
+@traced
+def list_contract_payments_logic(contract_id: int, since: datetime = None):
+    """Show the payment ledger of a contract, oldest first (only payments made at or after `since`)."""
+    session = ReadSessionLocal()
+
+    try:
+        query = select(Payment).where(Payment.contract_id == contract_id)
+        if since is not None:
+            query = query.where(Payment.paid_at >= since)
+        payments = session.scalars(query.order_by(Payment.paid_at, Payment.payment_id)).all()
+        if not payments:
+            console.print(f"[yellow]⚠️ No payments recorded for contract {contract_id}.[/yellow]")
+            return
+
+        table = build_table(f"💳 Payments for Contract {contract_id}",
+                            ["🆔 ID", "📅 Paid At", "💰 Amount", "💰 Due After", "🏦 Reference", "👤 Recorded By"])
+        for payment in payments:
+            table.add_row(str(payment.payment_id), str(payment.paid_at), str(payment.amount),
+                          str(payment.amount_due_after), payment.reference or "—",
+                          str(payment.recorded_by) if payment.recorded_by else "—")
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+    finally:
+        session.close()
+
+
 # 🔄 Reassign Contract ───────────────────────────────────────────────
-def reassign_contract_logic(contract_id: int):
+@traced
+def reassign_contract_logic(contract_id: int, data: dict = None):
+    """
+    Reassign the commercial and/or client of a contract.
+
+    Args:
+        contract_id: Contract to reassign.
+        data: `commercial_id` / `client_id` for non-interactive use; pickers are shown when omitted.
+    """
     session = SessionLocal()
     updated_fields = {}
 
@@ -282,38 +612,23 @@ def reassign_contract_logic(contract_id: int):
         if not contract:
             raise NotFound(f"Contract with ID {contract_id} not found.")
 
-        while True:
-            new_commercial_id = click.prompt("👔 Enter the new commercial's user ID", default="", show_default=False)
-            if new_commercial_id == "":
-                break
-            if new_commercial_id.isdigit():
-                new_commercial_id = int(new_commercial_id)
-                new_commercial = session.query(User).filter(
-                    User.user_id == new_commercial_id, User.role == "commercial").first()
-                if not new_commercial:
-                    click.secho(f"❌ User ID {new_commercial_id} is not a valid commercial.", fg="red")
-                    continue
+        if data is not None:
+            updated_fields = validate_reassignment(session, data, "commercial_id", UserRole.commercial, "contract")
+        else:
+            # 📥 Preload commercials and clients in one query
+            found = load_candidates(session, user_candidates(UserRole.commercial), client_candidates())
+            release_transaction(session)
+            click.secho("📋 Leave blank to keep the current value.", fg="cyan")
+
+            new_commercial_id = pick("👔 New Commercial", found["commercial"], optional=True)
+            if new_commercial_id is not None:
                 updated_fields["commercial_id"] = new_commercial_id
                 click.secho("✅ New commercial assigned.", fg="green")
-                break
-            else:
-                click.secho("❌ Please enter a valid integer.", fg="red")
 
-        while True:
-            new_client_id = click.prompt("👨🏻‍💼 Enter the new client ID", default="", show_default=False)
-            if new_client_id == "":
-                break
-            if new_client_id.isdigit():
-                new_client_id = int(new_client_id)
-                new_client = session.query(Client).filter(Client.client_id == new_client_id).first()
-                if not new_client:
-                    click.secho(f"❌ Client ID {new_client_id} is not valid.", fg="red")
-                    continue
+            new_client_id = pick("👨🏻‍💼 New Client", found["clients"], optional=True)
+            if new_client_id is not None:
                 updated_fields["client_id"] = new_client_id
                 click.secho(f"✅ Contract {contract_id} reassigned to new client.", fg="green")
-                break
-            else:
-                click.secho("❌ Please enter a valid integer.", fg="red")
 
         if not updated_fields:
             click.secho("⚠️ No changes made to the contract.", fg="yellow")
@@ -329,6 +644,9 @@ def reassign_contract_logic(contract_id: int):
 
     except NotFound as nf:
         click.secho(str(nf), fg="red")
+    except ValueError as e:
+        session.rollback()
+        click.secho(f"❌ {e}", fg="red")
     except Exception as e:
         session.rollback()
         click.secho(f"❌ Unexpected error: {e}", fg="red")
@@ -336,22 +654,72 @@ def reassign_contract_logic(contract_id: int):
         session.close()
 
 
-# 🗑️ Delete Contract ────────────────────────────────────────────────
-def delete_contract_logic():
+# 🔄 Bulk Reassign Contracts ─────────────────────────────────────────
+@traced
+def reassign_all_contracts_logic(from_id: int, to_id: int, client_id: int = None, unsigned_only: bool = False):
+    """
+    Move every contract of one commercial to another in a single transaction.
+
+    Args:
+        from_id: Commercial currently assigned to the contracts.
+        to_id: Commercial taking over the contracts.
+        client_id: Only move contracts of this client.
+        unsigned_only: Only move contracts that are not signed yet.
+
+    Returns:
+        int: Number of contracts moved.
+    """
     session = SessionLocal()
     try:
-        contract_id = click.prompt("🗑️ Enter the contract ID to delete", type=int)
+        validate_bulk_reassignment(session, from_id, to_id, UserRole.commercial)
+
+        statement = update(Contract).where(Contract.commercial_id == from_id)
+        if client_id is not None:
+            statement = statement.where(Contract.client_id == client_id)
+        if unsigned_only:
+            statement = statement.where(Contract.is_signed.is_(False))
+
+        moved = session.execute(
+            statement.values(commercial_id=to_id, version_id=Contract.version_id + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        return moved
 
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+
+# 🗑️ Delete Contract ────────────────────────────────────────────────
+@traced
+def delete_contract_logic(contract_id: int):
+    session = SessionLocal()
+    try:
         contract = session.query(Contract).filter(Contract.contract_id == contract_id).first()
         if not contract:
             raise NotFound(f"Contract with ID {contract_id} not found.")
 
+        # The payments ledger is kept: a contract with payments cannot be deleted
+        payments = session.scalar(select(func.count()).where(Payment.contract_id == contract_id))
+        if payments:
+            raise ValueError(f"Contract {contract_id} has {payments} recorded payment(s) and cannot be deleted.")
+
         session.delete(contract)
         session.commit()
         click.secho(f"✅ Contract {contract_id} deleted successfully.", fg="green")
 
     except NotFound as nf:
         click.secho(str(nf), fg="red")
+    except ValueError as e:
+        session.rollback()
+        click.secho(f"❌ {e}", fg="red")
+    except IntegrityError:
+        session.rollback()
+        click.secho(f"❌ Contract {contract_id} is still referenced (events or payments) and cannot be deleted.",
+                    fg="red")
     except Exception as e:
         session.rollback()
         click.secho(f"❌ Unexpected error: {e}", fg="red")
@@ -0,0 +1,151 @@
+"""
+📊 Personal Dashboard for Epic Events CRM
+
+This module gathers a user's key numbers in a single query: the contracts and events
+in the user's scope are CTEs, the numbers are aggregated from them into one row, and
+that row is LEFT JOINed to the next events, so one round-trip returns the whole screen.
+
+The scope depends on the role:
+- gestion: every contract and event
+- commercial: the contracts they manage and the events of their clients
+- support: the events assigned to them, plus unassigned events they could claim
+
+The identity comes from the token, so no extra query is needed to look up the user.
+Like the other read-only commands, the query is served from the local snapshot when
+it is fresh.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import select, func, true, false, or_
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.sentry import traced
+from Epic_events.models import Client, Contract, Event
+from Epic_events.snapshot import open_read_session, is_snapshot_session
+from Epic_events.rich_styles import build_table, console
+from Epic_events.auth.utils import get_current_user
+
+# 📅 "Soon" means within this many days.
+HORIZON_DAYS = 7
+
+# 🏷️ Tiles shown per role, in display order: (column, label).
+TILES = {
+    "gestion": [("unsigned_contracts", "✍️ Unsigned contracts"), ("unsigned_value", "💶 Unsigned value"),
+                ("amount_due", "💰 Amount due (signed)"), ("events_soon", "📅 Events in the next 7 days"),
+                ("unassigned_events", "🙋 Unassigned upcoming events")],
+    "commercial": [("my_clients", "👥 My clients"), ("unsigned_contracts", "✍️ My unsigned contracts"),
+                   ("unsigned_value", "💶 Unsigned value"), ("amount_due", "💰 Amount due (signed)"),
+                   ("events_soon", "📅 My clients' events in the next 7 days"),
+                   ("unassigned_events", "🙋 My clients' events without support")],
+    "support": [("events_soon", "📅 My events in the next 7 days"), ("my_upcoming", "🗓️ All my upcoming events"),
+                ("unassigned_events", "🙋 Unassigned events to claim")],
+}
+
+
+# 🧮 One-Query Dashboard ──────────────────────────────────────────────
+def dashboard_query(user_id: int, role: str, limit: int = 10, now: datetime = None):
+    """
+    Build the dashboard SELECT for one user.
+
+    Returns:
+        Select: rows of (<numbers...>, event_id, event_name, start_date, location, client_name,
+        support_id). The numbers repeat on every row; the event columns are NULL when nothing is
+        coming up in the next HORIZON_DAYS.
+    """
+    now = now or datetime.now(UTC)
+    soon = now + timedelta(days=HORIZON_DAYS)
+
+    contracts = select(Contract.amount_due, Contract.amount_total, Contract.is_signed)
+    events = select(Event.event_id, Event.event_name, Event.start_date, Event.location,
+                    Event.client_id, Event.support_id).where(Event.start_date > now)
+    clients = select(Client.client_id)
+    if role == "commercial":
+        contracts = contracts.where(Contract.commercial_id == user_id)
+        clients = clients.where(Client.commercial_id == user_id)
+        events = events.where(Event.client_id.in_(clients))
+    elif role == "support":
+        contracts = contracts.where(false())  # No contract tiles for support
+        clients = clients.where(false())
+        events = events.where(or_(Event.support_id == user_id, Event.support_id.is_(None)))
+    contracts, events, clients = contracts.cte("scope_contracts"), events.cte("scope_events"), clients.cte("scope_clients")
+
+    is_mine = events.c.support_id == user_id
+    # Support staff see their own events as "soon"; other roles see everything in scope.
+    soon_filter = [events.c.start_date <= soon, *([is_mine] if role == "support" else [])]
+    numbers = select(
+        select(func.count()).select_from(clients).scalar_subquery().label("my_clients"),
+        select(func.count()).where(contracts.c.is_signed.is_(False))
+        .scalar_subquery().label("unsigned_contracts"),
+        select(func.coalesce(func.sum(contracts.c.amount_total), 0)).where(contracts.c.is_signed.is_(False))
+        .scalar_subquery().label("unsigned_value"),
+        select(func.coalesce(func.sum(contracts.c.amount_due), 0)).where(contracts.c.is_signed.is_(True))
+        .scalar_subquery().label("amount_due"),
+        select(func.count()).where(*soon_filter).scalar_subquery().label("events_soon"),
+        select(func.count()).where(is_mine).scalar_subquery().label("my_upcoming"),
+        select(func.count()).where(events.c.support_id.is_(None)).scalar_subquery().label("unassigned_events"),
+    ).cte("numbers")
+
+    upcoming = (
+        select(events.c.event_id, events.c.event_name, events.c.start_date, events.c.location,
+               Client.full_name.label("client_name"), events.c.support_id)
+        .join(Client, Client.client_id == events.c.client_id)
+        .where(*soon_filter)
+        .order_by(events.c.start_date)
+        .limit(limit)
+        .subquery("upcoming")
+    )
+    return (select(numbers, upcoming)
+            .select_from(numbers.outerjoin(upcoming, true()))
+            .order_by(upcoming.c.start_date))
+
+
+# 🖼️ Render ─────────────────────────────────────────────────────────
+def render_dashboard(rows, role: str, name: str):
+    """Print the key-number tiles and the next events as one screen."""
+    first = rows[0]._mapping
+    tiles = build_table(f"📊 Dashboard: {name} ({role})", ["📌 Key Number", "🔢 Value"])
+    for column, label in TILES[role]:
+        tiles.add_row(label, f"{first[column]:,}")
+    console.print(tiles)
+
+    events = [row for row in rows if row.event_id is not None]
+    if not events:
+        console.print(f"[green]✅ Nothing scheduled in the next {HORIZON_DAYS} days.[/green]")
+        return
+    table = build_table(f"📅 Next {HORIZON_DAYS} Days",
+                        ["🆔 Event ID", "📝 Event Name", "📅 Start Date", "📍 Location", "💼 Client", "👤 Support"])
+    for row in events:
+        table.add_row(str(row.event_id), row.event_name, f"{row.start_date:%d-%m-%Y %H:%M}", str(row.location),
+                      row.client_name, str(row.support_id) if row.support_id else "❌ Unassigned")
+    console.print(table)
+
+
+# 📊 Dashboard ───────────────────────────────────────────────────────
+@traced
+def dashboard_logic(limit: int = 10):
+    """
+    Show the logged-in user's dashboard, fetched in one query.
+
+    Args:
+        limit: Maximum number of upcoming events listed.
+    """
+    session = open_read_session()
+
+    try:
+        payload = get_current_user()
+        role = payload.get("role")
+        if role not in TILES:
+            console.print(f"[red]❌ No dashboard for role '{role}'.[/red]")
+            return
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
+
+        rows = session.execute(dashboard_query(int(payload["sub"]), role, limit)).all()
+        render_dashboard(rows, role, payload.get("name") or f"user {payload['sub']}")
+
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+    finally:
+        session.close()
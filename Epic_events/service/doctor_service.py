@@ -0,0 +1,198 @@
+"""
+🩺 Diagnostics for Epic Events CRM
+
+This module backs the `doctor` command. It reports how long each startup phase took
+(imports, Sentry, schema check, banners), then measures a representative command
+phase by phase: token decode, database round-trip, and the `event list` query and its
+rendering on a bounded sample of rows. It also shows the connection pool state, the known filter columns that
+have no index, and the table row counts that drive listing cost.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+import io
+import statistics
+
+from click import ClickException
+from sqlalchemy import inspect, select, func, text
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.database import engine, replica_engine, ReadSessionLocal, Base
+from Epic_events.sentry import traced
+from Epic_events.models import Event
+from Epic_events.profiler import STARTUP_PHASES, timed
+from Epic_events.rich_styles import build_table, console
+from Epic_events.auth.utils import get_current_user
+from Epic_events.service.event_service import event_rows, render_events_table
+
+# 🐢 A phase slower than this is flagged.
+SLOW_PHASE_MS = 200
+
+# 🧪 Rows read and rendered by the `event list` phases, whatever the table size.
+SAMPLE_ROWS = 1000
+
+# 🔎 Columns the list, filter and ownership checks search on, per table.
+FILTER_COLUMNS = {
+    "users": ["role", "updated_at"],
+    "clients": ["commercial_id", "total_due", "last_contact", "updated_at"],
+    "contracts": ["client_id", "commercial_id", "is_signed", "updated_at"],
+    "payments": ["contract_id", "paid_at"],
+    "events": ["client_id", "contract_id", "support_id", "start_date", "updated_at"],
+    "events_archive": ["archived_at"],
+    "audit_log": ["created_at", "actor_id", "action"],
+}
+
+
+# 🧮 Utility: Format a duration ─────────────────────────────────────────
+def _status(ms: float) -> str:
+    return "⚠️ slow" if ms > SLOW_PHASE_MS else "✅"
+
+
+def _render_phases(title: str, phases: list[tuple[str, float, str]]):
+    table = build_table(title, ["⏱️ Phase", "🕒 Time (ms)", "🩺 Status", "🗒️ Notes"])
+    for name, ms, note in phases:
+        table.add_row(name, f"{ms:,.1f}", _status(ms), note)
+    console.print(table)
+
+
+# ⏱️ Startup Phases ────────────────────────────────────────────────────
+def startup_phases() -> list[tuple[str, float, str]]:
+    """Phases recorded by main.py before the command ran."""
+    notes = {
+        "imports": "Run `python -X importtime main.py doctor` for a per-module breakdown.",
+        "init_sentry": "Set SENTRY_DSN / SENTRY_TRACE_FILE only where traces are needed.",
+        "init_db": "create_all() checks every table against the catalog.",
+        "banners": "Skipped with --plain.",
+    }
+    return [(name, ms, notes.get(name, "")) for name, ms in STARTUP_PHASES.items()]
+
+
+# 🏓 Database Round-Trip ──────────────────────────────────────────────
+def ping(pings: int) -> tuple[float, list[float]]:
+    """Time a fresh connection checkout, then `pings` round-trips of `SELECT 1` on it."""
+    engine.dispose()  # Measure a real connect, not a pooled connection
+    samples = []
+    connection, connect_ms = timed(engine.connect)
+    with connection:
+        for _ in range(pings):
+            _, ms = timed(lambda: connection.execute(text("SELECT 1")).scalar())
+            samples.append(ms)
+    return connect_ms, samples
+
+
+# 🧪 Representative Command ───────────────────────────────────────────
+def command_phases(pings: int) -> list[tuple[str, float, str]]:
+    """Time each phase of `event list`: token decode, connect, round-trips, query and render."""
+    phases = []
+
+    try:
+        user, ms = timed(get_current_user)
+        phases.append(("token decode", ms, f"Logged in as user {user.get('sub')} ({user.get('role')})."))
+    except ClickException:
+        phases.append(("token decode", 0.0, "Not logged in: commands would stop here."))
+
+    connect_ms, samples = ping(pings)
+    phases.append(("db connect", connect_ms, f"{engine.dialect.name}, new connection incl. setup."))
+    phases.append(("db round-trip", statistics.median(samples),
+                   f"Median of {pings} × SELECT 1 (min {min(samples):.2f}, max {max(samples):.2f})."))
+
+    # Same plain-row SELECT as `event list` (without the result cache), bounded to a sample
+    session = ReadSessionLocal()
+    try:
+        total, count_ms = timed(lambda: session.scalar(select(func.count()).select_from(Event)))
+        events, query_ms = timed(lambda: session.execute(
+            event_rows(Event).order_by(Event.event_id).limit(SAMPLE_ROWS)).all())
+    finally:
+        session.close()
+    phases.append(("event list: count", count_ms, f"{total:,} events in the table."))
+    phases.append(("event list: query", query_ms,
+                   f"First {len(events):,} rows of `event list`; the full listing reads {total:,}."))
+
+    # Render into a buffer so the measurement does not flood the terminal.
+    terminal, console.file = console.file, io.StringIO()
+    try:
+        _, render_ms = timed(render_events_table, events, "All Events")
+    finally:
+        console.file = terminal
+    phases.append(("event list: render", render_ms, "Rich table; try --plain for large listings."))
+    return phases
+
+
+# 🏊 Connection Pool ───────────────────────────────────────────────────
+def render_pool_state():
+    table = build_table("Connection Pools", ["🗄️ Engine", "🧩 Pool", "📊 Status"])
+    table.add_row("primary", type(engine.pool).__name__, engine.pool.status())
+    if replica_engine is not None:
+        table.add_row("replica", type(replica_engine.pool).__name__, replica_engine.pool.status())
+    console.print(table)
+
+
+# 🔎 Missing Indexes ──────────────────────────────────────────────────
+def missing_indexes() -> list[tuple[str, str]]:
+    """(table, column) pairs from FILTER_COLUMNS that lead no index, unique constraint or primary key."""
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    missing = []
+    for table, columns in FILTER_COLUMNS.items():
+        if table not in existing:
+            continue
+        leading = {index["column_names"][0] for index in inspector.get_indexes(table) if index["column_names"]}
+        leading |= {unique["column_names"][0] for unique in inspector.get_unique_constraints(table)}
+        primary = inspector.get_pk_constraint(table)["constrained_columns"]
+        if primary:
+            leading.add(primary[0])
+        missing.extend((table, column) for column in columns if column not in leading)
+    return missing
+
+
+def render_missing_indexes():
+    missing = missing_indexes()
+    if not missing:
+        console.print("[green]✅ Every known filter column is indexed.[/green]")
+        return
+    table = build_table("Missing Indexes", ["📋 Table", "🔎 Column", "🛠️ Suggested DDL"])
+    for table_name, column in missing:
+        table.add_row(table_name, column, f"CREATE INDEX ix_{table_name}_{column} ON {table_name} ({column});")
+    console.print(table)
+
+
+# 🔢 Row Counts ──────────────────────────────────────────────────────
+def row_counts() -> dict[str, int]:
+    """Row count of every mapped table that exists, in one query."""
+    existing = set(inspect(engine).get_table_names())
+    tables = [table for name, table in Base.metadata.tables.items() if name in existing]
+    if not tables:
+        return {}
+    query = select(*(select(func.count()).select_from(table).scalar_subquery().label(table.name)
+                     for table in tables))
+    with engine.connect() as conn:
+        return dict(conn.execute(query).one()._mapping)
+
+
+def render_row_counts():
+    table = build_table("Table Sizes", ["📋 Table", "🔢 Rows"])
+    for name, count in row_counts().items():
+        table.add_row(name, f"{count:,}")
+    console.print(table)
+
+
+# 🩺 Doctor ──────────────────────────────────────────────────────────
+@traced
+def doctor_logic(pings: int = 5):
+    """
+    Print the startup and command phase timings, pool state, missing indexes and row counts.
+
+    Args:
+        pings: Number of `SELECT 1` round-trips to time.
+    """
+    try:
+        phases = startup_phases()
+        if phases:
+            _render_phases("Startup", phases)
+        else:
+            console.print("[yellow]⚠️ No startup timings recorded (run through main.py).[/yellow]")
+        _render_phases("Command: event list", command_phases(pings))
+        render_pool_state()
+        render_missing_indexes()
+        render_row_counts()
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
@@ -8,23 +8,45 @@ and Click for interaction.
 
 # 🧩 External Imports ────────────────────────────────────────────────
 import click
-from rich.console import Console
-from datetime import datetime
+from datetime import datetime, UTC
 
+from sqlalchemy import update, insert, delete, select, literal, exists
+from sqlalchemy.orm import aliased
 from werkzeug.exceptions import NotFound
 
 # 🏗️ Internal Imports ────────────────────────────────────────────────
-from Epic_events.database import SessionLocal
-from Epic_events.models import Client, User, Contract, Event
-from Epic_events.rich_styles import build_table
+from Epic_events.database import SessionLocal, ReadSessionLocal, release_transaction
+from Epic_events.sentry import traced
+from Epic_events.audit import record_audit
+from Epic_events.counters import touch_client_counters
+from Epic_events.result_cache import cached_rows
+from Epic_events.pager import KeysetPager, browse, can_page, page_size_for_terminal
+from Epic_events.concurrency import check_version, edit_with_version_check
+from Epic_events.snapshot import open_read_session, is_snapshot_session
+from Epic_events.models import Client, User, Contract, Event, EventArchive, UserRole
+from Epic_events.partitioning import drop_partitions_before, ensure_event_partitions
+from Epic_events.rich_styles import build_table, console
+from Epic_events.picker import (load_candidates, pick, client_candidates, user_candidates,
+                                signed_contract_candidates)
 from Epic_events.service.user_service import get_logged_in_user
+from Epic_events.service.client_service import validate_bulk_reassignment, validate_reassignment
 
 
-# 🎨 Rich Console Instance ─────────────────────────────────────────────
-console = Console()
+# 🖼️ Utility: Render Events Table ──────────────────────────────────────
+def event_row_columns(model=Event):
+    """Columns read by `render_events_table`; listings select only these into plain rows."""
+    return (model.event_id, model.event_name, model.start_date, model.end_date, model.location,
+            model.support_id, model.client_id, model.contract_id)
+
+
+def event_rows(model=Event, since: datetime = None):
+    """SELECT of `event_row_columns`, limited to rows changed (or archived) at or after `since`."""
+    query = select(*event_row_columns(model))
+    if since is not None:
+        query = query.where((model.archived_at if model is EventArchive else model.updated_at) >= since)
+    return query
 
 
-# 🖼️ Utility: Render Events Table ──────────────────────────────────────
 def render_events_table(events, title: str):
     """Render a styled Rich table of event entries with emoji-enhanced headers."""
     table = build_table(
@@ -75,68 +97,220 @@ def prompt_for_date(label, required=True):
             click.secho("❌ Invalid date format. Please use 'DD-MM-YYYY HH:MM'.", fg="red")
 
 
-# 📝 Create Event ──────────────────────────────────────────────────────
-def create_event_logic():
-    """📌 Create a new event and link it to a contract, client, and support user."""
-    session = SessionLocal()
-    user = get_logged_in_user()
+# 🧠 Utility: Parse a DateTime from non-interactive input ──────────────
+DATE_FORMAT = "%d-%m-%Y %H:%M"
+
+
+def parse_event_date(value) -> datetime:
+    """
+    Parse a date given as 'DD-MM-YYYY HH:MM' (the prompt format) or ISO 8601.
 
+    Raises:
+        ValueError: If the value matches neither format.
+    """
+    if isinstance(value, datetime):
+        return value
     try:
-        # 🔍 Validate Client
-        while True:
-            client_id = click.prompt("👤 Client ID", type=int)
-            client = session.query(Client).filter_by(client_id=client_id).first()
-            if not client:
-                console.print(f"[red]❌ No client found with ID {client_id}. Try again.[/red]")
-                continue
+        return datetime.strptime(str(value), DATE_FORMAT)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}'. Use 'DD-MM-YYYY HH:MM' or ISO 8601.")
 
-            # 🔒 Authorization check for commercial
-            if user.role.value == "commercial" and client.commercial_id != user.user_id:
-                click.secho(f"📋 Client is assigned to commercial ID: {client.commercial_id}", fg="yellow")
-                click.secho(f"👤 Logged-in user ID: {user.user_id}", fg="yellow")
-                return
-            break
 
-        event_name = click.prompt("📝 Enter the event name", type=str)
-        start_date = prompt_for_date("📅 Event's Start Date")
-        end_date = prompt_for_date("📅 Event's End Date")
-        location = click.prompt("📍 Enter the event location", type=str)
-        notes = click.prompt("🗒️ Notes or description", type=str)
+# 🧱 Core: Create / Update an Event (no prompts, no commit) ───────────────
+EVENT_FIELDS = ("event_name", "start_date", "end_date", "location", "notes")
 
-        # 🔧 Validate Support Contact
-        while True:
-            support_id = click.prompt("👨‍🔧 Support ID", type=int)
-            support = session.query(User).filter_by(user_id=support_id, role="support").first()
-            if not support:
-                console.print(f"[red]❌ No support user found with ID {support_id}. Try again.[/red]")
-                continue
-            break
 
-        # 📄 Validate Contract
-        while True:
-            contract_id = click.prompt("📄 Contract ID", type=int)
-            contract = session.query(Contract).filter_by(contract_id=contract_id).first()
-            if not contract:
-                console.print(f"[red]❌ No contract found with ID {contract_id}. Try again.[/red]")
-                continue
+@traced
+def validate_event_refs(session, client_id: int, contract_id: int, support_id: int, user=None) -> list[str]:
+    """
+    Resolve the client, contract and support user of a new event in one joined query.
+
+    Each reference is LEFT JOINed onto a one-row anchor, so a missing row shows up as NULLs
+    instead of hiding the others. Checks existence, the support role, that the contract
+    belongs to the client and is signed, and (for a commercial `user`) client ownership.
+
+    Returns:
+        Every problem found, as messages; an empty list means the references are valid.
+    """
+    anchor = select(literal(1).label("one")).subquery()
+    row = session.execute(
+        select(
+            Client.client_id, Client.commercial_id,
+            Contract.contract_id, Contract.client_id.label("contract_client_id"), Contract.is_signed,
+            User.user_id.label("support_id"), User.role.label("support_role"),
+        )
+        .select_from(anchor)
+        .outerjoin(Client, Client.client_id == client_id)
+        .outerjoin(Contract, Contract.contract_id == contract_id)
+        .outerjoin(User, User.user_id == support_id)
+    ).one()
+
+    errors = []
+    if row.client_id is None:
+        errors.append(f"No client found with ID {client_id}.")
+    elif user is not None and user.role == UserRole.commercial and row.commercial_id != user.user_id:
+        errors.append(f"Client {client_id} is assigned to commercial ID {row.commercial_id}, not to you.")
+
+    if row.contract_id is None:
+        errors.append(f"No contract found with ID {contract_id}.")
+    else:
+        if row.contract_client_id != client_id:
+            errors.append(f"Contract {contract_id} belongs to client {row.contract_client_id}, not {client_id}.")
+        if not row.is_signed:
+            errors.append(f"Contract {contract_id} is not signed yet.")
+
+    if row.support_id is None:
+        errors.append(f"No user found with ID {support_id}.")
+    elif row.support_role != UserRole.support:
+        errors.append(f"User {support_id} is not a support user.")
+    return errors
+
+
+@traced
+def create_event(session, user, client_id: int = None, event_name: str = None, start_date=None, end_date=None,
+                 location: str = None, support_id: int = None, contract_id: int = None, notes: str = None,
+                 **unknown) -> Event:
+    """
+    Validate and add a new event to `session` without committing.
+
+    Shared by the interactive prompts, `--from-json` / option mode and `batch run`.
+
+    Raises:
+        ValueError: If a field is missing or unknown, listing every invalid reference
+            (see `validate_event_refs`), or on bad dates.
+    """
+    if unknown:
+        raise ValueError(f"Unknown event field(s): {', '.join(sorted(unknown))}.")
+    required = {"client_id": client_id, "contract_id": contract_id, "support_id": support_id,
+                "event_name": event_name, "start_date": start_date, "end_date": end_date, "location": location}
+    missing = [name for name, value in required.items() if value in (None, "")]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}.")
+
+    errors = validate_event_refs(session, client_id, contract_id, support_id, user=user)
+    start_date, end_date = parse_event_date(start_date), parse_event_date(end_date)
+    if end_date < start_date:
+        errors.append("The end date cannot be before the start date.")
+    if errors:
+        raise ValueError(" ".join(errors))
+
+    event = Event(
+        event_name=event_name,
+        start_date=start_date,
+        end_date=end_date,
+        location=location,
+        notes=notes,
+        support_id=support_id,
+        client_id=client_id,
+        contract_id=contract_id,
+    )
+    session.add(event)
+    session.flush()
+    return event
+
+
+@traced
+def update_event(session, event_id: int, expected_version: int = None, **fields) -> Event:
+    """
+    Validate and apply event field changes in `session` without committing.
+
+    Raises:
+        NotFound: If the event does not exist.
+        ValueError: If a field is unknown or invalid.
+        StaleDataError: If the event is no longer at `expected_version`.
+    """
+    unknown = set(fields) - set(EVENT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown event field(s): {', '.join(sorted(unknown))}.")
+
+    event = session.query(Event).filter(Event.event_id == event_id).first()
+    if not event:
+        raise NotFound(f"❌ Event with ID {event_id} not found.")
+    check_version(event, expected_version, f"Event {event_id}")
+
+    for field in ("start_date", "end_date"):
+        if field in fields:
+            fields[field] = parse_event_date(fields[field])
+    if fields.get("end_date", event.end_date) < fields.get("start_date", event.start_date):
+        raise ValueError("The end date cannot be before the start date.")
+
+    for field, value in fields.items():
+        setattr(event, field, value)
+    session.flush()
+    return event
+
+
+# 📝 Create Event ──────────────────────────────────────────────────────
+@traced
+def prompt_new_event(session, user) -> dict:
+    """
+    Ask for the fields of a new event, re-prompting until the references are valid together.
+
+    Raises:
+        ValueError: If no client has a signed contract or no support user exists.
+    """
+    # 📥 Preload the commercial's clients, their signed contracts and support users in one query
+    own = user.user_id if user.role == UserRole.commercial else None
+    found = load_candidates(session, client_candidates(own), signed_contract_candidates(own),
+                            user_candidates(UserRole.support))
+
+    # 🔍 Only clients with a signed contract can host an event
+    clients = found["clients"].only(found["contracts"].parents.values())
+    if not clients:
+        raise ValueError("No client has a signed contract yet. Sign a contract before creating an event.")
+    if not found["support"]:
+        raise ValueError("No support user exists yet. Register one before creating an event.")
+
+    while True:
+        release_transaction(session)
+        client_id = pick("👤 Client", clients)
+        contract_id = pick("📄 Contract", found["contracts"].subset(client_id))
+        support_id = pick("👨‍🔧 Support", found["support"])
+
+        # 🔍 Final check of client, contract and support together (one query)
+        errors = validate_event_refs(session, client_id, contract_id, support_id, user=user)
+        if not errors:
             break
+        for error in errors:
+            console.print(f"[red]❌ {error}[/red]")
+        click.secho("🔁 Please choose again.", fg="yellow")
+
+    release_transaction(session)
+    event_name = click.prompt("📝 Enter the event name", type=str)
+    start_date = prompt_for_date("📅 Event's Start Date")
+    end_date = prompt_for_date("📅 Event's End Date")
+    location = click.prompt("📍 Enter the event location", type=str)
+    notes = click.prompt("🗒️ Notes or description", type=str)
+
+    return {"client_id": client_id, "event_name": event_name, "start_date": start_date, "end_date": end_date,
+            "location": location, "notes": notes, "support_id": support_id, "contract_id": contract_id}
+
+
+@traced
+def create_event_logic(data: dict = None):
+    """
+    📌 Create a new event and link it to a contract, client, and support user.
+
+    Args:
+        data: Event fields for non-interactive use; prompts are shown when omitted.
+    """
+    session = SessionLocal()
+    user = get_logged_in_user()
+
+    try:
+        if data is None:
+            data = prompt_new_event(session, user)
 
         # ✅ Create the Event
-        event = Event(
-            event_name=event_name,
-            start_date=start_date,
-            end_date=end_date,
-            location=location,
-            notes=notes,
-            support_id=support_id,
-            client_id=client_id,
-            contract_id=contract_id,
-        )
-        session.add(event)
+        event = create_event(session, user, **data)
         session.commit()
 
         console.print(f"[green]✅ Event '{event.event_name}' successfully created and linked to contract "
-                      f"{contract_id} for {client.full_name}.[/green]")
+                      f"{event.contract_id} for {event.client.full_name}.[/green]")
 
     except Exception as e:
         session.rollback()
@@ -147,11 +321,14 @@ def create_event_logic():
 
 
 # 🔍 View Event Details by ID ─────────────────────────────────────
+@traced
 def list_event_details_logic():
     """📋 Display details for a single event by ID."""
-    session = SessionLocal()
+    session = open_read_session()
 
     try:
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
         while True:
             event_id = click.prompt("🔎 Enter the Event ID to show details", type=int)
             event = session.query(Event).filter(Event.event_id == event_id).first()
@@ -171,18 +348,34 @@ def list_event_details_logic():
 
 
 # 📋 List All Events ─────────────────────────────────────────────────────
-def list_events_logic():
-    """📋 List all events, regardless of user role."""
-    session = SessionLocal()
+@traced
+def list_events_logic(archived: bool = False, pager: bool = False, since: datetime = None):
+    """
+    📋 List all events, regardless of user role.
+
+    Args:
+        archived (bool): Read the archive instead of the hot `events` table.
+        pager (bool): Browse page by page, fetching each page on demand (needs a terminal).
+        since (datetime): Only events changed at or after this time (archived at, for the archive).
+    """
+    session = ReadSessionLocal()
+    model = EventArchive if archived else Event
 
     try:
-        events = session.query(Event).all()
+        if pager and can_page():
+            browse(KeysetPager(session, event_rows(model, since), [model.event_id], page_size_for_terminal(),
+                               search_columns=(model.event_name, model.location), id_column=model.event_id),
+                   render_events_table, "📋 Archived Events" if archived else "📋 All Events",
+                   "No events found in the system.")
+            return
+
+        events = cached_rows(session, "event list", event_rows(model, since), [model.__tablename__])
 
         if not events:
             console.print("[yellow]⚠️ No events found in the system.[/yellow]")
             return
 
-        render_events_table(events, title="📋 All Events")
+        render_events_table(events, title="📋 Archived Events" if archived else "📋 All Events")
 
     except Exception as e:
         console.print(f"[red]❌ Error while listing events: {e}[/red]")
@@ -192,13 +385,16 @@ def list_events_logic():
 
 
 # 📋 List Events for Logged-in Support ────────────────────────────────
-def list_my_events_logic():
-    """List clients assigned to the logged-in commercial user only."""
-    user = get_logged_in_user()
-    session = SessionLocal()
+@traced
+def list_my_events_logic(since: datetime = None):
+    """List events assigned to the logged-in support user, optionally only those changed since `since`."""
+    session = open_read_session()
 
     try:
-        events = session.query(Event).filter(Event.support_id == user.user_id).all()
+        user = get_logged_in_user(session)
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
+        events = session.execute(event_rows(since=since).where(Event.support_id == user.user_id)).all()
 
         if not events:
             console.print("[yellow]⚠️ You have no clients assigned.[/yellow]")
@@ -213,14 +409,16 @@ def list_my_events_logic():
 
 
 # 📄 List Events for a Client ───────────────────────────────────────
-def list_client_events_logic():
-    """📄 List all events linked to a specific client."""
-    session = SessionLocal()
+@traced
+def list_client_events_logic(archived: bool = False, since: datetime = None):
+    """📄 List all events linked to a specific client (hot table, or the archive if `archived`), changed since `since`."""
+    session = ReadSessionLocal()
+    model = EventArchive if archived else Event
 
     try:
         while True:
             client_id = click.prompt("🔎 Enter the Client ID to list their events", type=int)
-            events = session.query(Event).filter(Event.client_id == client_id).all()
+            events = session.execute(event_rows(model, since).where(model.client_id == client_id)).all()
 
             if not events:
                 console.print(f"[yellow]⚠️ No events found for client ID {client_id}. Try another one.[/yellow]")
@@ -237,60 +435,82 @@ def list_client_events_logic():
 
 
 # 🔧 Update Event ───────────────────────────────────────────────────────
-def update_event_logic(event_id: int):
-    """🔧 Update an event's details interactively via the CLI."""
-    session = SessionLocal()
+@traced
+def prompt_event_changes() -> dict:
+    """Ask for event fields to change; blank answers are skipped."""
     updated_fields = {}
 
-    try:
-        # 🆔 Prompt for Event ID
-        while True:
-            event_id = click.prompt("✏️ Confirm the Event ID to update", type=int)
-            event = session.query(Event).filter(Event.event_id == event_id).first()
-            if not event:
-                click.secho(f"❌ No event found with ID {event_id}. Please try again.", fg="red")
-                continue
+    # 📝 Optional fields
+    event_name = click.prompt("📝 New Event Name", default="", show_default=False)
+    if event_name:
+        updated_fields["event_name"] = event_name
+        click.secho("✅ Event name updated.", fg="green")
 
-            click.secho(f"🔧 Updating event ID {event_id}...", fg="blue")
-            click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
-            break
+    start_date = prompt_for_date("📅 New Start Date", required=False)
+    if start_date:
+        updated_fields["start_date"] = start_date
+        click.secho("✅ Start date updated.", fg="green")
+
+    end_date = prompt_for_date("📅 New End Date", required=False)
+    if end_date:
+        updated_fields["end_date"] = end_date
+        click.secho("✅ End date updated.", fg="green")
+
+    location = click.prompt("📍 New Location", default="", show_default=False)
+    if location:
+        updated_fields["location"] = location
+        click.secho("✅ Location updated.", fg="green")
 
-        # 📝 Optional fields
-        event_name = click.prompt("📝 New Event Name", default="", show_default=False)
-        if event_name:
-            updated_fields["event_name"] = event_name
-            click.secho("✅ Event name updated.", fg="green")
+    notes = click.prompt("🗒️ New Notes", default="", show_default=False)
+    if notes:
+        updated_fields["notes"] = notes
+        click.secho("✅ Notes updated.", fg="green")
 
-        start_date = prompt_for_date("📅 New Start Date", required=False)
-        if start_date:
-            updated_fields["start_date"] = start_date
-            click.secho("✅ Start date updated.", fg="green")
+    return updated_fields
 
-        end_date = prompt_for_date("📅 New End Date", required=False)
-        if end_date:
-            updated_fields["end_date"] = end_date
-            click.secho("✅ End date updated.", fg="green")
 
-        location = click.prompt("📍 New Location", default="", show_default=False)
-        if location:
-            updated_fields["location"] = location
-            click.secho("✅ Location updated.", fg="green")
+@traced
+def update_event_logic(event_id: int, data: dict = None):
+    """
+    🔧 Update an event's details.
 
-        notes = click.prompt("🗒️ New Notes", default="", show_default=False)
-        if notes:
-            updated_fields["notes"] = notes
-            click.secho("✅ Notes updated.", fg="green")
+    Args:
+        event_id: ID of the event to update.
+        data: Fields to change for non-interactive use; prompts are shown when omitted.
+    """
+    session = SessionLocal()
 
+    try:
+        if data is None:
+            # 🆔 Prompt for Event ID
+            while True:
+                event_id = click.prompt("✏️ Confirm the Event ID to update", type=int)
+                event = session.query(Event).filter(Event.event_id == event_id).first()
+                if not event:
+                    click.secho(f"❌ No event found with ID {event_id}. Please try again.", fg="red")
+                    continue
+
+                click.secho(f"🔧 Updating event ID {event_id}...", fg="blue")
+                click.secho("📋 Leave any field blank to skip updating it.", fg="cyan")
+                break
+            expected_version = None
+        else:
+            data = dict(data)
+            expected_version = data.pop("version_id", None)
+
+        updated_fields = edit_with_version_check(
+            session, Event, event_id, f"Event {event_id}",
+            collect=prompt_event_changes if data is None else lambda: data,
+            apply=lambda s, version, fields: update_event(s, event_id, expected_version=version, **fields),
+            expected_version=expected_version,
+            interactive=data is None,
+        )
+        if updated_fields is None:
+            return
         if not updated_fields:
             click.secho("⚠️ No changes entered. Nothing was updated.", fg="yellow")
             return
 
-        # 🧠 Apply changes
-        for field, value in updated_fields.items():
-            if hasattr(event, field):
-                setattr(event, field, value)
-
-        session.commit()
         click.secho(f"✅ Event ID {event_id} updated successfully!", fg="green")
 
     except Exception as e:
@@ -301,56 +521,129 @@ def update_event_logic(event_id: int):
         session.close()
 
 
+# 🙋 Claim the Next Unassigned Event ────────────────────────────────────
+@traced
+def claim_next_event(session, support_id: int, now: datetime = None):
+    """
+    Assign the next upcoming unassigned event that fits the support user's calendar.
+
+    Runs as one statement, without committing:
+
+        UPDATE events SET support_id = :me
+        WHERE event_id = (SELECT ... ORDER BY start_date LIMIT 1 FOR UPDATE SKIP LOCKED)
+          AND support_id IS NULL
+        RETURNING ...
+
+    On PostgreSQL, concurrent claimers skip rows another transaction has locked instead of
+    waiting on them, so each one gets a different event. SQLite ignores FOR UPDATE but runs
+    writes one at a time, and `support_id IS NULL` still prevents a double claim. An event
+    is skipped if it overlaps an event already assigned to this support user.
+
+    Returns:
+        The claimed row (event_id, event_name, start_date, end_date, location, client_id),
+        or None when nothing is available.
+    """
+    now = now or datetime.now(UTC)
+    candidate = aliased(Event, name="candidate")
+    busy = aliased(Event, name="busy")
+
+    next_free = (
+        select(candidate.event_id)
+        .where(
+            candidate.support_id.is_(None),
+            candidate.start_date >= now,
+            ~exists().where(
+                busy.support_id == support_id,
+                busy.start_date < candidate.end_date,
+                busy.end_date > candidate.start_date,
+            ),
+        )
+        .order_by(candidate.start_date, candidate.event_id)
+        .limit(1)
+        .with_for_update(skip_locked=True, of=candidate)
+        .scalar_subquery()
+    )
+    claimed = session.execute(
+        update(Event)
+        .where(Event.event_id == next_free, Event.support_id.is_(None))
+        .values(support_id=support_id, version_id=Event.version_id + 1)
+        .returning(Event.event_id, Event.event_name, Event.start_date, Event.end_date, Event.location,
+                   Event.client_id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    if claimed is not None:
+        record_audit(session, "event.claimed", "event", claimed.event_id, support_id=support_id)
+    return claimed
+
+
+@traced
+def claim_event_logic():
+    """🙋 Claim the next unassigned event for the logged-in support user."""
+    session = SessionLocal()
+
+    try:
+        user = get_logged_in_user()
+        claimed = claim_next_event(session, user.user_id)
+        session.commit()
+
+        if claimed is None:
+            console.print("[yellow]⚠️ No unassigned upcoming event fits your schedule.[/yellow]")
+            return
+
+        table = build_table("🙋 Event Claimed", ["🆔 Event ID", "📝 Event Name", "📅 Start Date", "📅 End Date",
+                                                 "📍 Location", "💼 Client Ref"])
+        table.add_row(str(claimed.event_id), claimed.event_name, str(claimed.start_date), str(claimed.end_date),
+                      claimed.location, str(claimed.client_id))
+        console.print(table)
+        console.print(f"[green]✅ Event {claimed.event_id} is now assigned to you.[/green]")
+
+    except Exception as e:
+        session.rollback()
+        console.print(f"[red]❌ Error claiming event: {e}[/red]")
+    finally:
+        session.close()
+
+
 # 🔄 Reassign Event ────────────────────────────────────────────────────
-def reassign_event_logic():
-    """🔄 Reassign the support contact or client for an existing event."""
+@traced
+def reassign_event_logic(event_id: int, data: dict = None):
+    """
+    🔄 Reassign the support contact or client for an existing event.
+
+    Args:
+        event_id: Event to reassign.
+        data: `support_id` / `client_id` for non-interactive use; pickers are shown when omitted.
+    """
     session = SessionLocal()
     updated_fields = {}
 
     try:
         # 🔍 Find the event
-        event_id = click.prompt("🔢 Enter Event ID", type=int)
         event = session.query(Event).filter(Event.event_id == event_id).first()
         if not event:
             raise NotFound(f"❌ Event with ID {event_id} not found.")
 
-        # 👤 Reassign support
-        while True:
-            new_support_id = click.prompt("👔 Enter the new Support's user ID", default="", show_default=False)
-            if new_support_id == "":
-                break
-            if not new_support_id.isdigit():
-                click.secho("❌ Please enter a valid integer.", fg="red")
-                continue
-
-            new_support = session.query(User).filter(
-                User.user_id == int(new_support_id), User.role == "support"
-            ).first()
-            if not new_support:
-                click.secho(f"❌ User ID {new_support_id} is not a valid support.", fg="red")
-                continue
-
-            updated_fields["support_id"] = int(new_support_id)
-            click.secho("✅ New Support assigned.", fg="green")
-            break
-
-        # 🧑 Reassign client
-        while True:
-            new_client_id = click.prompt("👨🏻‍💼 Enter the new Client ID", default="", show_default=False)
-            if new_client_id == "":
-                break
-            if not new_client_id.isdigit():
-                click.secho("❌ Please enter a valid integer.", fg="red")
-                continue
-
-            new_client = session.query(Client).filter(Client.client_id == int(new_client_id)).first()
-            if not new_client:
-                click.secho(f"❌ Client ID {new_client_id} is not valid.", fg="red")
-                continue
-
-            updated_fields["client_id"] = int(new_client_id)
-            click.secho(f"✅ Event '{event.event_name}' reassigned to new client.", fg="green")
-            break
+        if data is not None:
+            updated_fields = validate_reassignment(session, data, "support_id", UserRole.support, "event")
+        else:
+            # 📥 Preload support users and clients in one query
+            found = load_candidates(session, user_candidates(UserRole.support), client_candidates())
+            event_name = event.event_name
+            release_transaction(session)
+            click.secho("📋 Leave blank to keep the current value.", fg="cyan")
+
+            # 👤 Reassign support
+            new_support_id = pick("👔 New Support", found["support"], optional=True)
+            if new_support_id is not None:
+                updated_fields["support_id"] = new_support_id
+                click.secho("✅ New Support assigned.", fg="green")
+
+            # 🧑 Reassign client
+            new_client_id = pick("👨🏻‍💼 New Client", found["clients"], optional=True)
+            if new_client_id is not None:
+                updated_fields["client_id"] = new_client_id
+                click.secho(f"✅ Event '{event_name}' reassigned to new client.", fg="green")
 
         # 🛑 No updates?
         if not updated_fields:
@@ -368,6 +661,9 @@ def reassign_event_logic():
 
     except NotFound as nf:
         click.secho(str(nf), fg="red")
+    except ValueError as e:
+        session.rollback()
+        click.secho(f"❌ {e}", fg="red")
     except Exception as e:
         session.rollback()
         click.secho(f"❌ Unexpected error: {e}", fg="red")
@@ -375,12 +671,116 @@ def reassign_event_logic():
         session.close()
 
 
+# 🔄 Bulk Reassign Events ────────────────────────────────────────────
+@traced
+def reassign_all_events_logic(from_id: int, to_id: int, starting_after: datetime = None, client_id: int = None):
+    """
+    Move every event of one support user to another in a single transaction.
+
+    Args:
+        from_id: Support user currently assigned to the events.
+        to_id: Support user taking over the events.
+        starting_after: Only move events starting after this date.
+        client_id: Only move events of this client.
+
+    Returns:
+        int: Number of events moved.
+    """
+    session = SessionLocal()
+    try:
+        validate_bulk_reassignment(session, from_id, to_id, UserRole.support)
+
+        statement = update(Event).where(Event.support_id == from_id)
+        if starting_after is not None:
+            statement = statement.where(Event.start_date > starting_after)
+        if client_id is not None:
+            statement = statement.where(Event.client_id == client_id)
+
+        moved = session.execute(
+            statement.values(support_id=to_id, version_id=Event.version_id + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        return moved
+
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+
+# 🗄️ Archive Old Events ────────────────────────────────────────────────
+@traced
+def archive_events_logic(before: datetime):
+    """
+    Move every event starting before `before` into `events_archive` in one transaction.
+
+    Rows are copied with a single INSERT ... SELECT and removed with a single DELETE.
+    On a partitioned PostgreSQL table, monthly partitions left empty are dropped.
+
+    Returns:
+        tuple[int, list[str]]: Number of events archived and names of dropped partitions.
+    """
+    session = SessionLocal()
+    try:
+        columns = [column.name for column in EventArchive.__table__.columns if column.name in Event.__table__.c]
+        session.execute(
+            insert(EventArchive).from_select(
+                columns,
+                select(*[Event.__table__.c[name] for name in columns]).where(Event.start_date < before),
+            )
+        )
+        # Archiving upcoming events changes their clients' counters (usually none are upcoming).
+        touch_client_counters(session, *session.scalars(
+            select(Event.client_id).distinct()
+            .where(Event.start_date > datetime.now(UTC), Event.start_date < before)))
+        archived = session.execute(
+            delete(Event).where(Event.start_date < before).execution_options(synchronize_session=False)
+        ).rowcount
+        dropped = drop_partitions_before(session.connection(), before)
+
+        session.commit()
+        return archived, dropped
+
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+
+# 🗓️ Maintain Partitions ───────────────────────────────────────────────
+@traced
+def maintain_partitions_logic(months_ahead: int):
+    """
+    Create the monthly partitions of the next `months_ahead` months in one transaction.
+
+    Events of those months already stored in the DEFAULT partition are moved into their
+    new partition.
+
+    Returns:
+        tuple[list[str], int]: Names of the partitions created and number of events moved.
+    """
+    session = SessionLocal()
+    try:
+        created, moved = ensure_event_partitions(session.connection(), months_ahead)
+        session.commit()
+        return created, moved
+
+    except Exception as e:
+        session.rollback()
+        raise e
+    finally:
+        session.close()
+
+
 # 🗑️ Delete Event ───────────────────────────────────────────────────────
-def delete_event_logic():
+@traced
+def delete_event_logic(event_id: int):
     """🗑️ Delete an event by its ID."""
     session = SessionLocal()
     try:
-        event_id = click.prompt("🗑️ Enter the Event ID to delete", type=int)
         event = session.query(Event).filter(Event.event_id == event_id).first()
 
         if not event:
@@ -0,0 +1,73 @@
+"""
+⏰ Reminder Scheduler Logic for Epic Events CRM
+
+This module backs `reminders run`: it builds the chosen sink and the reminder scheduler,
+then runs it until Ctrl-C (or for a single pass with `--once`).
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+from datetime import timedelta
+
+from sqlalchemy.exc import OperationalError
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.database import ReadSessionLocal
+from Epic_events.sentry import traced
+from Epic_events.config import REMINDER_LOOKAHEAD_HOURS, REMINDER_BATCH_MINUTES
+from Epic_events.reminders import ReminderScheduler, FileSink, SmtpSink, utc_now
+from Epic_events.rich_styles import console
+
+
+def build_sink(sink: str, path=None, smtp_host=None, smtp_port=None):
+    """Sink named `sink` ("file" or "smtp"), with the configured defaults for omitted settings."""
+    if sink == "smtp":
+        return SmtpSink(**{key: value for key, value in (("host", smtp_host), ("port", smtp_port)) if value})
+    return FileSink(path) if path else FileSink()
+
+
+# ⏰ Run Scheduler ───────────────────────────────────────────────────
+@traced
+def run_reminders_logic(lead_hours: float, sink: str, path=None, smtp_host=None, smtp_port=None,
+                        once: bool = False):
+    """
+    Send reminders for events starting within `lead_hours`, then keep running until Ctrl-C.
+
+    Args:
+        lead_hours: How long before the start of an event its support is reminded.
+        sink: "file" or "smtp".
+        path: JSON-lines file for the file sink.
+        smtp_host, smtp_port: Server for the SMTP sink.
+        once: Send the reminders due now and exit, e.g. from cron.
+    """
+    scheduler = ReminderScheduler(
+        ReadSessionLocal,
+        build_sink(sink, path, smtp_host, smtp_port),
+        lead=timedelta(hours=lead_hours),
+        lookahead=timedelta(hours=REMINDER_LOOKAHEAD_HOURS),
+        batch_window=timedelta(minutes=REMINDER_BATCH_MINUTES),
+    )
+    target = (f"{scheduler.sink.host}:{scheduler.sink.port}" if sink == "smtp" else str(scheduler.sink.path))
+
+    def report(sent):
+        console.print(f"[green]📨 {utc_now():%d-%m-%Y %H:%M} UTC: {sent} reminder(s) sent to {target}.[/green]")
+
+    def report_error(error, retry_in):
+        console.print(f"[red]❌ {utc_now():%d-%m-%Y %H:%M} UTC: {error}. "
+                      f"Retrying in {retry_in:g} s ({len(scheduler.heap)} reminder(s) pending).[/red]")
+
+    try:
+        if once:
+            sent = scheduler.tick()
+            if sent:
+                report(sent)
+            else:
+                console.print("[yellow]⚠️ No reminders due.[/yellow]")
+            return
+        console.print(f"[cyan]⏰ Reminding {lead_hours:g} h ahead via {sink} ({target}). "
+                      f"Press Ctrl-C to stop.[/cyan]")
+        scheduler.run(on_batch=report, on_error=report_error)
+    except KeyboardInterrupt:
+        console.print(f"[yellow]⏹️ Reminder scheduler stopped ({scheduler.sent} reminder(s) sent).[/yellow]")
+    except (OperationalError, OSError) as e:
+        # Only reached with --once: the daemon loop retries by itself.
+        console.print(f"[red]❌ Reminders not delivered ({scheduler.sent} sent before the error): {e}[/red]")
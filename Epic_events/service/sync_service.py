@@ -0,0 +1,134 @@
+"""
+🔄 Snapshot Sync Logic for Epic Events CRM
+
+This module pulls rows changed since the last sync from the central database into the
+local SQLite snapshot. Each table is copied incrementally using its change timestamp
+(`updated_at`), and rows deleted on the primary are pruned by primary key,
+comparing one chunk of keys at a time.
+"""
+
+# 🧩 External Imports ────────────────────────────────────────────────
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# 🏗️ Internal Imports ────────────────────────────────────────────────
+from Epic_events.config import CHANGE_OVERLAP_SECONDS
+from Epic_events.database import ReadSessionLocal
+from Epic_events.sentry import traced
+from Epic_events.rich_styles import build_table, console
+from Epic_events.snapshot import snapshot_engine, sync_state, SYNCED_TABLES, init_snapshot
+
+# 📦 Rows are written and pruned in chunks to keep statements below SQLite's variable limit.
+CHUNK_SIZE = 500
+
+
+# 🧮 Utility: Split a list into fixed-size chunks ───────────────────────
+def _chunks(items, size=CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# 🔄 Sync One Table ───────────────────────────────────────────────────
+def _sync_table(primary, snapshot, table, change_column, watermark):
+    """
+    Copy rows changed since `watermark` and prune rows deleted on the primary.
+
+    Returns:
+        tuple: (rows upserted, rows pruned, new watermark)
+    """
+    query = select(table)
+    if watermark is not None:
+        # Re-read an overlap window: a row stamped before the watermark may have committed after
+        # the last sync. Re-applying rows already copied is idempotent.
+        query = query.where(change_column >= watermark - timedelta(seconds=CHANGE_OVERLAP_SECONDS))
+    rows = [dict(row) for row in primary.execute(query).mappings()]
+
+    pk = list(table.primary_key.columns)[0]
+    for chunk in _chunks(rows):
+        upsert = sqlite_insert(table).values(chunk)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[pk.name],
+            set_={column.name: upsert.excluded[column.name] for column in table.columns if column is not pk},
+        )
+        snapshot.execute(upsert)
+
+    pruned = _prune_deleted(primary, snapshot, table, pk)
+    changed = [row[change_column.name] for row in rows] + ([watermark] if watermark is not None else [])
+    new_watermark = max(changed, default=None)
+    return len(rows), pruned, new_watermark
+
+
+# 🧹 Prune Rows Deleted on the Primary ─────────────────────────────────
+def _prune_deleted(primary, snapshot, table, pk) -> int:
+    """
+    Delete snapshot rows whose key no longer exists on the primary; returns rows pruned.
+
+    Walks the snapshot keys in order, one chunk at a time, and asks the primary which keys
+    of that chunk still exist, so neither side's key set is ever loaded whole.
+    """
+    pruned, after = 0, None
+    while True:
+        query = select(pk).order_by(pk).limit(CHUNK_SIZE)
+        if after is not None:
+            query = query.where(pk > after)
+        chunk = snapshot.execute(query).scalars().all()
+        if not chunk:
+            return pruned
+
+        alive = set(primary.execute(select(pk).where(pk.in_(chunk))).scalars())
+        gone = [key for key in chunk if key not in alive]
+        if gone:
+            snapshot.execute(delete(table).where(pk.in_(gone)))
+            pruned += len(gone)
+        after = chunk[-1]
+
+
+# 🚀 Sync the Snapshot ────────────────────────────────────────────────
+@traced
+def sync_snapshot_logic(full: bool = False):
+    """
+    Pull changes from the primary database into the local snapshot.
+
+    Args:
+        full (bool): Ignore stored watermarks and copy every row again.
+    """
+    init_snapshot()
+    primary = ReadSessionLocal()  # Read-only pull: no write lock held on the primary while copying
+    results = []
+
+    try:
+        # The snapshot only mirrors the primary, so its foreign keys are not enforced during sync.
+        with snapshot_engine.connect() as conn:
+            # PRAGMA foreign_keys is ignored inside a transaction, so it goes to the raw connection.
+            conn.connection.driver_connection.execute("PRAGMA foreign_keys=OFF")
+            with conn.begin():
+                watermarks = {} if full else {
+                    name: watermark for name, watermark in
+                    conn.execute(select(sync_state.c.table_name, sync_state.c.watermark))
+                }
+                synced_at = datetime.now(UTC)
+
+                for table, change_column in SYNCED_TABLES:
+                    upserted, pruned, watermark = _sync_table(
+                        primary, conn, table, change_column, watermarks.get(table.name)
+                    )
+                    conn.execute(delete(sync_state).where(sync_state.c.table_name == table.name))
+                    conn.execute(insert(sync_state).values(
+                        table_name=table.name, watermark=watermark, synced_at=synced_at
+                    ))
+                    results.append((table.name, upserted, pruned, watermark))
+            conn.connection.driver_connection.execute("PRAGMA foreign_keys=ON")
+
+        table = build_table("Snapshot Sync", ["🗂️ Table", "⬇️ Pulled", "🧹 Pruned", "🕒 Watermark"])
+        for name, upserted, pruned, watermark in results:
+            table.add_row(name, str(upserted), str(pruned), str(watermark) if watermark else "—")
+        console.print(table)
+        console.print("[green]✅ Local snapshot is up to date.[/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Error while syncing snapshot: {e}[/red]")
+
+    finally:
+        primary.close()
@@ -3,7 +3,7 @@
 
 This module contains all backend logic for user management including registration, login,
 logout, role updates, deletion, and listing. It integrates JWT authentication, password hashing,
-and Sentry logging for error and event tracking.
+Sentry error tracking, and the audit log for business events.
 """
 # 🧩 External Imports ───────────────────────────────────────────────
 from datetime import datetime, timedelta, timezone
@@ -16,17 +16,20 @@ import jwt
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from click import ClickException
-from rich.console import Console
 from rich.panel import Panel
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # 🏗️ Internal Imports ───────────────────────────────────────────────
 from Epic_events.config import SECRET_KEY
-from Epic_events.database import SessionLocal
+from Epic_events.database import SessionLocal, ReadSessionLocal
+from Epic_events.sentry import traced
 from Epic_events.models import User, UserRole
-from Epic_events.rich_styles import build_table
+from Epic_events.rich_styles import build_table, console
 from Epic_events.auth.utils import save_token, load_token, decode_token, get_current_user
+from Epic_events.snapshot import open_read_session, is_snapshot_session
+from Epic_events.audit import record_audit
 
 
 # 🎨 Constants ──────────────────────────────────────────────────────
@@ -38,8 +41,6 @@ TOKEN_FILE = Path.home() / ".epic_crm_token"
 # 🖼️ Utility: Render Users Table ───────────────────────────────────────────────
 def render_users_table(users, title: str):
     """Render a styled Rich table of user entries with emoji-enhanced headers."""
-    console = Console()
-
     table = build_table(
         title,
         [
@@ -60,6 +61,7 @@ def render_users_table(users, title: str):
 
 
 # 👤 USER REGISTRATION ───────────────────────────────────────────────
+@traced
 def register_admin_logic(name, email, password, role):
     """Register the initial admin (with role 'gestion')."""
     session = SessionLocal()
@@ -85,6 +87,7 @@ def register_admin_logic(name, email, password, role):
         session.close()
 
 
+@traced
 def register_user_logic(name, email, password, role):
     """Register a new user with the given role."""
     session = SessionLocal()
@@ -103,23 +106,18 @@ def register_user_logic(name, email, password, role):
 
     try:
         session.add(new_user)
+        session.flush()
+        # 📜 Audit log for creation (written with the same commit)
+        record_audit(session, "user.created", "user", new_user.user_id, name=name, role=role)
         session.commit()
         click.echo("✅ User registered successfully!")
 
-        # ✅ Sentry log for creation
-        sentry_sdk.capture_message(
-            f"👤 New user created: {name} (role={role})",
-            level="info"
-        )
-
     except IntegrityError:
         session.rollback()
         click.echo("❌ Email already in use.")
-        # ⚠️ Log duplicate email attempt to Sentry
-        sentry_sdk.capture_message(
-            f"⚠️ Attempt to register with duplicate email: {email}",
-            level="warning"
-        )
+        # ⚠️ Audit the duplicate email attempt on its own
+        record_audit(session, "user.duplicate_email", "user", email=email)
+        session.commit()
 
     except Exception as e:
         session.rollback()
@@ -131,9 +129,10 @@ def register_user_logic(name, email, password, role):
 
 
 # 🔐 LOGIN / AUTH / LOGOUT ───────────────────────────────────────────
+@traced
 def login_user(email, password):
     """Authenticate user and store JWT."""
-    session = SessionLocal()
+    session = ReadSessionLocal()  # Read-only: no write transaction (and no SQLite lock) for a login
 
     user = session.query(User).filter_by(email=email).first()
 
@@ -168,6 +167,7 @@ def login_user(email, password):
         session.close()
 
 
+@traced
 def logout_user():
     """Delete the stored JWT token."""
     if not TOKEN_FILE.exists():
@@ -181,23 +181,33 @@ def logout_user():
 
 
 # 👁️ CURRENT USER INFO ───────────────────────────────────────────────
-def get_logged_in_user() -> User:
-    """Return the current user object based on the stored JWT token."""
+def get_logged_in_user(session: Optional[Session] = None) -> User:
+    """
+    Return the current user object based on the stored JWT token.
+
+    Args:
+        session: Optional session to look the user up with (e.g. a snapshot read session).
+            When omitted, a short-lived read session is used, so no write lock is taken.
+    """
     payload = get_current_user()
     user_id = payload.get("sub")
 
     if not user_id:
         raise ClickException("❌ Token missing user ID (sub claim).")
 
-    session: Session = SessionLocal()
-    user: Optional[User] = session.get(User, int(user_id))
-    session.close()
+    if session is not None:
+        user: Optional[User] = session.get(User, int(user_id))
+    else:
+        session = ReadSessionLocal()
+        user = session.get(User, int(user_id))
+        session.close()
 
     if not user:
         raise ClickException("❌ Logged-in user not found in database.")
     return user
 
 
+@traced
 def get_logged_user_info():
     """Print information about the currently logged-in user."""
     try:
@@ -215,7 +225,7 @@ def get_logged_user_info():
         click.echo("❌ Token is missing user ID.")
         return
 
-    session = SessionLocal()
+    session = ReadSessionLocal()
     user = session.get(User, int(user_id))
     session.close()
 
@@ -226,6 +236,7 @@ def get_logged_user_info():
 
 
 # 🛠️ USER MODIFICATION ───────────────────────────────────────────────
+@traced
 def delete_user_by_id(user_id: int):
     """Delete a user by ID. Returns True if successful, False otherwise."""
     session: Session = SessionLocal()
@@ -236,11 +247,8 @@ def delete_user_by_id(user_id: int):
             return False
 
         session.delete(user)
+        record_audit(session, "user.deleted", "user", user.user_id, name=user.name, role=user.role.value)
         session.commit()
-        sentry_sdk.capture_message(
-            f"👤 user with ID: {user.user_id} name: {user.name} role: {user.role}) has been deleted.",
-            level="info"
-        )
         return True
 
     except Exception as e:
@@ -252,6 +260,7 @@ def delete_user_by_id(user_id: int):
         session.close()
 
 
+@traced
 def update_user_role_logic(user_id: int, role: str):
     """
     Update the role of a given user.
@@ -269,11 +278,10 @@ def update_user_role_logic(user_id: int, role: str):
         if not user:
             return False
 
+        previous_role = user.role.value
         user.role = UserRole(role)
-        sentry_sdk.capture_message(
-            f"👤 the user ID: {user.user_id} Name: {user.name} has been updated",
-            level="info"
-        )
+        record_audit(session, "user.role_updated", "user", user.user_id,
+                     name=user.name, previous_role=previous_role, role=role)
         session.commit()
         return True
 
@@ -288,12 +296,16 @@ def update_user_role_logic(user_id: int, role: str):
 
 
 # 📋 USER LISTING ────────────────────────────────────────────────────
-def list_users_logic():
-    session = SessionLocal()
-    console = Console()
+@traced
+def list_users_logic(since: datetime = None):
+    """List registered users, optionally only those changed at or after `since`."""
+    session = ReadSessionLocal()
 
     try:
-        users = session.query(User).all()
+        query = select(User.user_id, User.name, User.email, User.role)
+        if since is not None:
+            query = query.where(User.updated_at >= since)
+        users = session.execute(query).all()
         if not users:
             console.print("[yellow]⚠️ No users found.[/yellow]")
             return
@@ -314,12 +326,14 @@ def list_users_logic():
         session.close()
 
 
+@traced
 def list_user_details_logic():
     """📋 Display details for a single event by ID."""
-    session = SessionLocal()
-    console = Console()
+    session = open_read_session()
 
     try:
+        if is_snapshot_session(session):
+            console.print("[dim]📦 Served from the local snapshot (run `sync` to refresh).[/dim]")
         while True:
             user_id = click.prompt("🔎 Enter the User ID to show details", type=int)
             user = session.query(User).filter(User.user_id == user_id).first()
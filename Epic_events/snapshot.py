@@ -0,0 +1,136 @@
+"""
+📦 Local Read-Only Snapshot for Epic Events CRM
+
+This module manages a SQLite copy of the users, clients, contracts and events tables.
+`epic sync` fills it incrementally, and read-only commands are served from it while it
+is fresh enough, saving a round-trip to the central database. Writes always go to the primary.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import Table, MetaData, Column, String, DateTime, select, inspect
+from sqlalchemy.orm import sessionmaker, Session
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .config import SNAPSHOT_PATH, SNAPSHOT_MAX_AGE_MINUTES
+from .database import make_engine, ReadSessionLocal, wrote_recently
+from .models import User, Client, Contract, Event
+
+
+# 🗃️ SNAPSHOT ENGINE & SESSION ──────────────────────────────────────
+snapshot_engine = make_engine(f"sqlite:///{SNAPSHOT_PATH}")
+SnapshotSession = sessionmaker(bind=snapshot_engine)
+
+# 🔒 Columns never copied to the snapshot: it lives on field laptops, so no password hashes.
+EXCLUDED_COLUMNS = {"users": {"password"}}
+
+# 🧭 Mirrored tables, in parent → child order: copies of the primary tables minus the excluded
+# columns. Sync selects these definitions on the primary, so excluded columns are never even read.
+mirror_metadata = MetaData()
+for _table in (User.__table__, Client.__table__, Contract.__table__, Event.__table__):
+    _excluded = EXCLUDED_COLUMNS.get(_table.name, set())
+    Table(_table.name, mirror_metadata,
+          *(column._copy() for column in _table.columns if column.name not in _excluded))
+
+# 🧭 Tables mirrored into the snapshot with their change timestamp.
+SYNCED_TABLES = [(table, table.c.updated_at) for table in mirror_metadata.sorted_tables]
+
+# 📌 Bookkeeping table living only in the snapshot file.
+snapshot_metadata = MetaData()
+sync_state = Table(
+    "sync_state",
+    snapshot_metadata,
+    Column("table_name", String, primary_key=True),
+    Column("watermark", DateTime, nullable=True),
+    Column("synced_at", DateTime, nullable=False),
+)
+
+
+# 🚀 INIT SNAPSHOT SCHEMA ────────────────────────────────────────────
+def init_snapshot():
+    """Create the mirrored tables and the sync bookkeeping table in the snapshot file."""
+    _drop_excluded_columns()
+    mirror_metadata.create_all(bind=snapshot_engine)
+    snapshot_metadata.create_all(bind=snapshot_engine)
+
+
+def _drop_excluded_columns():
+    """
+    Drop mirrored tables that an older snapshot created with now-excluded columns.
+
+    The table is recreated empty and its watermark is forgotten, so the next sync copies it
+    again in full; VACUUM then wipes the old values from the file's free pages.
+    """
+    if not SNAPSHOT_PATH.exists():
+        return
+
+    with snapshot_engine.connect() as conn:
+        inspector = inspect(conn)
+        stale = [
+            name for name, excluded in EXCLUDED_COLUMNS.items()
+            if inspector.has_table(name) and excluded & {column["name"] for column in inspector.get_columns(name)}
+        ]
+        has_sync_state = inspector.has_table("sync_state")
+        conn.rollback()
+        if not stale:
+            return
+
+        # PRAGMA and VACUUM are ignored or refused inside a transaction, so they go to the raw connection.
+        driver_connection = conn.connection.driver_connection
+        driver_connection.execute("PRAGMA foreign_keys=OFF")  # Keep the drop from touching mirrored children
+        with conn.begin():
+            for name in stale:
+                mirror_metadata.tables[name].drop(bind=conn)
+                if has_sync_state:
+                    conn.execute(sync_state.delete().where(sync_state.c.table_name == name))
+        driver_connection.execute("PRAGMA foreign_keys=ON")
+        driver_connection.execute("VACUUM")
+
+
+# ⏳ FRESHNESS ───────────────────────────────────────────────────────
+def last_synced_at():
+    """
+    Return when the snapshot was last fully synced, or None if it never was.
+
+    The oldest table sync time is used so a partially failed sync is not considered fresh.
+    """
+    if not SNAPSHOT_PATH.exists():
+        return None
+
+    with snapshot_engine.connect() as conn:
+        if not snapshot_engine.dialect.has_table(conn, "sync_state"):
+            return None
+        rows = conn.execute(select(sync_state.c.table_name, sync_state.c.synced_at)).all()
+
+    synced = {name: synced_at for name, synced_at in rows}
+    if any(table.name not in synced for table, _ in SYNCED_TABLES):
+        return None
+    return min(synced.values()).replace(tzinfo=UTC)
+
+
+def is_snapshot_fresh() -> bool:
+    """Return True if the snapshot was synced within SNAPSHOT_MAX_AGE_MINUTES."""
+    synced_at = last_synced_at()
+    if synced_at is None:
+        return False
+    return datetime.now(UTC) - synced_at <= timedelta(minutes=SNAPSHOT_MAX_AGE_MINUTES)
+
+
+# 📖 READ SESSION ────────────────────────────────────────────────────
+def open_read_session() -> Session:
+    """
+    Open a session for read-only commands.
+
+    Returns a snapshot session when the local copy is fresh enough, otherwise a replica-routed
+    session (which falls back to the primary). Right after a write the snapshot is skipped, so
+    the user reads their own changes. The session must never be used for writes.
+    """
+    if SNAPSHOT_MAX_AGE_MINUTES > 0 and not wrote_recently() and is_snapshot_fresh():
+        return SnapshotSession()
+    return ReadSessionLocal()
+
+
+def is_snapshot_session(session: Session) -> bool:
+    """Return True if the session reads from the local snapshot."""
+    return session.get_bind() is snapshot_engine
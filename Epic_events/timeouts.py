@@ -0,0 +1,141 @@
+"""
+⏱️ Statement Timeouts and Query Cancellation for Epic Events CRM
+
+A slow listing or a row locked by someone's unfinished edit prompt must not hang a
+command. Every engine built by `make_engine` gets:
+
+- PostgreSQL: `statement_timeout` and `lock_timeout` on the session. They are set when a
+  connection is checked out, and only when the value changed since the last checkout.
+  Ctrl-C cancels the statement on the server (psycopg2 `wait_select`) instead of waiting.
+- SQLite: a progress handler that interrupts a statement past its deadline or on Ctrl-C.
+  Lock waits stay bounded by `busy_timeout` (SQLITE_BUSY_TIMEOUT_MS).
+
+The limit comes from STATEMENT_TIMEOUT_SECONDS, or from `--timeout` for one command.
+A timeout is raised as `TimeoutError`, naming the service function that ran the query.
+A cancelled query is raised as `KeyboardInterrupt`, so Ctrl-C aborts the command as usual.
+"""
+
+# 📦 External Imports ───────────────────────────────────────────────
+import time
+
+from sqlalchemy import event
+
+# 🏗️ Internal Imports ───────────────────────────────────────────────
+from .config import STATEMENT_TIMEOUT_SECONDS, LOCK_TIMEOUT_SECONDS
+from .sentry import current_operation
+
+
+PROGRESS_OPCODES = 10_000  # SQLite VM steps between deadline checks (well under a millisecond)
+TIMEOUT_STATE = "query_timeout"
+
+# PostgreSQL error codes: query_canceled (timeout or user request) and lock_not_available.
+PG_QUERY_CANCELED, PG_LOCK_NOT_AVAILABLE = "57014", "55P03"
+
+_timeout_seconds = STATEMENT_TIMEOUT_SECONDS
+
+
+# 🎚️ Current Limit ──────────────────────────────────────────────────
+def set_query_timeout(seconds: float):
+    """Set the per-statement limit for the rest of this process (0 or None: no limit)."""
+    global _timeout_seconds
+    _timeout_seconds = float(seconds or 0)
+
+
+def query_timeout() -> float:
+    return _timeout_seconds
+
+
+def lock_timeout() -> float:
+    """Lock wait limit: LOCK_TIMEOUT_SECONDS, never longer than the statement timeout."""
+    limits = [limit for limit in (LOCK_TIMEOUT_SECONDS, _timeout_seconds) if limit > 0]
+    return min(limits) if limits else 0.0
+
+
+def describe_query() -> str:
+    return current_operation.get() or "unnamed query"
+
+
+# 🐘 PostgreSQL ─────────────────────────────────────────────────────
+def _apply_server_timeouts(dbapi_connection, connection_record, connection_proxy):
+    wanted = (query_timeout(), lock_timeout())
+    if connection_record.info.get(TIMEOUT_STATE) == wanted:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET statement_timeout = %s", (int(wanted[0] * 1000),))
+    cursor.execute("SET lock_timeout = %s", (int(wanted[1] * 1000),))
+    cursor.close()
+    dbapi_connection.commit()  # A SET inside a rolled-back transaction would be undone
+    connection_record.info[TIMEOUT_STATE] = wanted
+
+
+def _enable_server_cancel():
+    """Let Ctrl-C send a cancel request to the server instead of blocking until the query ends."""
+    import psycopg2.extensions
+    import psycopg2.extras
+    psycopg2.extensions.set_wait_callback(psycopg2.extras.wait_select)
+
+
+# 🗃️ SQLite ─────────────────────────────────────────────────────────
+def _install_progress_handler(dbapi_connection, connection_record):
+    # Ctrl-C raises inside this callback, which also makes SQLite interrupt the statement.
+    state = connection_record.info.setdefault(TIMEOUT_STATE, {"deadline": None})
+
+    def check_deadline():
+        deadline = state["deadline"]
+        return 1 if deadline is not None and time.monotonic() > deadline else 0
+
+    dbapi_connection.set_progress_handler(check_deadline, PROGRESS_OPCODES)
+
+
+def _deadline_passed(state) -> bool:
+    return state["deadline"] is not None and time.monotonic() > state["deadline"]
+
+
+def _start_deadline(conn, cursor, statement, parameters, context, executemany):
+    state = conn.info.get(TIMEOUT_STATE)
+    if state is not None:
+        state["deadline"] = time.monotonic() + query_timeout() if query_timeout() > 0 else None
+
+
+def _clear_deadline(conn):
+    state = conn.info.get(TIMEOUT_STATE)
+    if state is not None:
+        state["deadline"] = None  # COMMIT / ROLLBACK must never be interrupted
+
+
+# 🚨 Error Translation ──────────────────────────────────────────────
+def _translate_error(context):
+    """Turn driver timeout / cancel errors into TimeoutError or KeyboardInterrupt."""
+    error = context.original_exception
+    name = describe_query()
+    if context.dialect.name == "sqlite":
+        state = context.connection.info.get(TIMEOUT_STATE) if context.connection is not None else None
+        if "interrupted" not in str(error) or state is None:
+            return None
+        if not _deadline_passed(state):
+            raise KeyboardInterrupt(f"Query '{name}' cancelled.")
+        raise TimeoutError(f"Query '{name}' exceeded the {query_timeout():g} s statement timeout.") from error
+
+    code = getattr(error, "pgcode", None)
+    if code == PG_LOCK_NOT_AVAILABLE:
+        raise TimeoutError(f"Query '{name}' waited more than {lock_timeout():g} s for a lock "
+                           f"held by another session.") from error
+    if code == PG_QUERY_CANCELED:
+        if "user request" in str(error):
+            raise KeyboardInterrupt(f"Query '{name}' cancelled.")
+        raise TimeoutError(f"Query '{name}' exceeded the {query_timeout():g} s statement timeout.") from error
+    return None
+
+
+# 🔌 Engine Setup ───────────────────────────────────────────────────
+def install_query_timeouts(engine):
+    """Apply statement timeouts, cancellation and error translation to `engine`."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _install_progress_handler)
+        event.listen(engine, "before_cursor_execute", _start_deadline)
+        event.listen(engine, "commit", _clear_deadline)
+        event.listen(engine, "rollback", _clear_deadline)
+    elif engine.dialect.driver == "psycopg2":
+        event.listen(engine, "checkout", _apply_server_timeouts)
+        _enable_server_cancel()
+    event.listen(engine, "handle_error", _translate_error)
@@ -0,0 +1,132 @@
+"""
+🌱 Seeding helpers shared by the Epic Events CRM benchmarks.
+
+The benchmarks run against a throw-away database: point ``DATABASE_URL`` at it
+*before* importing anything from ``Epic_events`` (``use_database`` does this),
+then call ``seed`` to fill it with a realistic spread of users, clients,
+contracts and events.
+"""
+
+# 📦 Standard Library Imports ───────────────────────────────────────────
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+# Make the repository root importable when a benchmark is run as a script.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+# 🗄️ Database Selection ─────────────────────────────────────────────────
+def use_database(url: str):
+    """Point the application at ``url``; must run before importing Epic_events."""
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+
+# 🌱 Seed Data ──────────────────────────────────────────────────────────
+def seed(clients: int = 1000, contracts_per_client: int = 2, events_per_contract: int = 1,
+         commercials: int = 20, supports: int = 20, rng_seed: int = 42):
+    """
+    Insert a deterministic data set with bulk Core inserts.
+
+    Returns:
+        dict: The generated ID lists, keyed by role / entity name.
+    """
+    from sqlalchemy import insert
+    from sqlalchemy.orm import Session
+    from Epic_events.database import engine, Base
+    from Epic_events.counters import rebuild_client_counters
+    from Epic_events.result_cache import bump_table_versions
+    from Epic_events.models import User, Client, Contract, Event, UserRole
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(rng_seed)
+    now = datetime.now(UTC)
+
+    users = []
+    for i in range(commercials):
+        users.append({"name": f"Commercial {i}", "email": f"commercial{i}@epic.test",
+                      "password": "x", "role": UserRole.commercial})
+    for i in range(supports):
+        users.append({"name": f"Support {i}", "email": f"support{i}@epic.test",
+                      "password": "x", "role": UserRole.support})
+    users.append({"name": "Gestion", "email": "gestion@epic.test", "password": "x", "role": UserRole.gestion})
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), users)
+        commercial_ids = list(range(1, commercials + 1))
+        support_ids = list(range(commercials + 1, commercials + supports + 1))
+
+        conn.execute(insert(Client), [
+            {"full_name": f"Client {i}", "email": f"client{i}@epic.test", "phone": f"06{i:08d}",
+             "company_name": f"Company {i % 97}", "commercial_id": rng.choice(commercial_ids)}
+            for i in range(clients)
+        ])
+
+        contract_rows = []
+        for client_id in range(1, clients + 1):
+            for _ in range(contracts_per_client):
+                total = rng.randrange(1000, 50000, 100)
+                contract_rows.append({
+                    "client_id": client_id, "commercial_id": rng.choice(commercial_ids),
+                    "amount_total": total, "amount_due": rng.choice([0, total // 2, total]),
+                    "is_signed": rng.random() < 0.7,
+                })
+        conn.execute(insert(Contract), contract_rows)
+
+        event_rows = []
+        for contract_id, contract in enumerate(contract_rows, start=1):
+            for _ in range(events_per_contract):
+                start = now + timedelta(days=rng.randint(-365, 365), hours=rng.randint(0, 23))
+                event_rows.append({
+                    "event_name": f"Event {contract_id}", "client_id": contract["client_id"],
+                    "contract_id": contract_id, "location": f"Venue {rng.randint(1, 300)}",
+                    "start_date": start, "end_date": start + timedelta(hours=rng.randint(2, 48)),
+                    "support_id": rng.choice(support_ids) if rng.random() < 0.8 else None,
+                    "notes": "seeded",
+                })
+        if event_rows:
+            conn.execute(insert(Event), event_rows)
+
+    # Bulk Core inserts bypass the ORM hooks that keep the client counters and table versions current.
+    with Session(engine) as session:
+        rebuild_client_counters(session)
+        bump_table_versions(session.connection(), ["clients", "contracts", "events", "users"])
+        session.commit()
+
+    return {
+        "commercials": commercial_ids,
+        "supports": support_ids,
+        "gestion": commercials + supports + 1,
+        "clients": clients,
+        "contracts": len(contract_rows),
+        "events": len(event_rows),
+    }
+
+
+# ⏱️ Timing Helpers ─────────────────────────────────────────────────────
+def time_call(fn, repeat: int = 20):
+    """Run ``fn`` ``repeat`` times and return the per-call latencies in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0-100)."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples) -> str:
+    """One-line latency summary: mean, p50, p95 and max in milliseconds."""
+    return (f"mean {statistics.fmean(samples):8.2f} ms   p50 {percentile(samples, 50):8.2f} ms   "
+            f"p95 {percentile(samples, 95):8.2f} ms   max {max(samples):8.2f} ms")
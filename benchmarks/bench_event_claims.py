@@ -0,0 +1,96 @@
+"""
+📊 Concurrent `event claim` throughput and correctness.
+
+Seeds a throw-away database in which every upcoming event is unassigned, then starts
+N support users claiming in parallel threads (one session each) until the queue is
+empty. Reports claims per second, per-claim latency, and checks that no event was
+claimed twice and none was left behind.
+
+Run it against PostgreSQL to exercise ``FOR UPDATE SKIP LOCKED``; on SQLite the
+claims are serialized by the database write lock.
+
+Usage:
+    python benchmarks/bench_event_claims.py --claimers 8 --events 2000
+    python benchmarks/bench_event_claims.py --database-url postgresql+psycopg2://user:pw@localhost/epic_bench
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, summarize
+
+
+@click.command()
+@click.option("--claimers", default=8, show_default=True, help="Concurrent support users claiming.")
+@click.option("--events", default=2000, show_default=True, help="Unassigned events in the queue.")
+@click.option("--database-url", default=None,
+              help="Empty database to use (defaults to a temporary SQLite file).")
+def main(claimers, events, database_url):
+    """Benchmark concurrent claims of unassigned events."""
+    use_database(database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_claims.db'}")
+
+    from sqlalchemy import update, select, func
+    from Epic_events.database import SessionLocal, engine
+    from Epic_events.models import Event
+    from Epic_events.service.event_service import claim_next_event
+
+    ids = seed(clients=events, contracts_per_client=1, events_per_contract=1, supports=claimers)
+
+    # Unassign everything and space the events out so no claim is refused for an overlap.
+    start = datetime.now(UTC) + timedelta(days=1)
+    with engine.begin() as conn:
+        for event_id in range(1, ids["events"] + 1):
+            begins = start + timedelta(hours=3 * event_id)
+            conn.execute(update(Event).where(Event.event_id == event_id)
+                         .values(support_id=None, start_date=begins, end_date=begins + timedelta(hours=2)))
+
+    claimed = []
+    latencies = []
+    lock = threading.Lock()
+
+    def claimer(support_id):
+        session = SessionLocal()
+        mine, samples = [], []
+        try:
+            while True:
+                started = time.perf_counter()
+                row = claim_next_event(session, support_id)
+                session.commit()
+                samples.append((time.perf_counter() - started) * 1000)
+                if row is None:
+                    break
+                mine.append(row.event_id)
+        finally:
+            session.close()
+        with lock:
+            claimed.extend(mine)
+            latencies.extend(samples)
+
+    threads = [threading.Thread(target=claimer, args=(support_id,)) for support_id in ids["supports"]]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with engine.connect() as conn:
+        left = conn.execute(select(func.count()).select_from(Event).where(Event.support_id.is_(None))).scalar()
+    duplicates = [event_id for event_id, count in Counter(claimed).items() if count > 1]
+
+    click.echo(f"🗄️  {engine.dialect.name}, {claimers} claimers, {ids['events']} events")
+    click.echo(f"🙋 {len(claimed)} claims in {elapsed:.2f} s  ({len(claimed) / elapsed:,.0f} claims/s)")
+    click.echo(f"⏱️  per claim: {summarize(latencies)}")
+    click.echo(f"{'✅' if not duplicates else '❌'} duplicate claims: {len(duplicates)}   "
+               f"{'✅' if not left else '❌'} left unassigned: {left}")
+
+
+if __name__ == "__main__":
+    main()
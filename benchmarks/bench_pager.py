@@ -0,0 +1,90 @@
+"""
+📜 Keyset pager: page fetch latency and memory over a large event table.
+
+Seeds about ``--events`` events, then times what `event list --pager` does on each
+keystroke:
+
+- first / last page, next and previous page deep inside the table (keyset cursor)
+- the same deep page read with OFFSET, for comparison
+- jump to an ID, and a forward text search
+
+It also walks ``--walk`` pages forward and reports the peak Python memory
+(tracemalloc) of the pager. That peak stays flat because only a few pages are kept.
+Rendering is not included.
+
+Usage:
+    python benchmarks/bench_pager.py --events 1000000 --page-size 40
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, time_call, summarize
+
+
+@click.command()
+@click.option("--events", default=1_000_000, show_default=True, help="Approximate number of events to seed.")
+@click.option("--page-size", default=40, show_default=True, help="Rows per page.")
+@click.option("--repeat", default=20, show_default=True, help="Timed calls per operation.")
+@click.option("--walk", default=500, show_default=True, help="Pages walked forward for the memory figure.")
+@click.option("--database-url", default=None, help="Benchmark an existing database instead of a fresh SQLite file.")
+def main(events, page_size, repeat, walk, database_url):
+    """Benchmark keyset paging against OFFSET on a large event listing."""
+    use_database(database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_pager.db'}")
+
+    from sqlalchemy import select, func
+    from Epic_events.database import ReadSessionLocal
+    from Epic_events.models import Event
+    from Epic_events.pager import KeysetPager
+    from Epic_events.service.event_service import event_row_columns
+
+    if database_url is None:
+        seed(clients=max(1, events // 20), contracts_per_client=2, events_per_contract=10)
+
+    session = ReadSessionLocal()
+    total = session.scalar(select(func.count()).select_from(Event))
+    middle_id = session.scalar(select(Event.event_id).order_by(Event.event_id).offset(total // 2).limit(1))
+
+    def pager():
+        return KeysetPager(session, select(*event_row_columns()), [Event.event_id], page_size,
+                           search_columns=(Event.event_name, Event.location), id_column=Event.event_id)
+
+    deep = pager()
+    deep.jump(middle_id)
+    offset_query = select(*event_row_columns()).order_by(Event.event_id).offset(total // 2).limit(page_size)
+
+    def next_and_back():
+        deep._pages.clear()  # Time the database, not the page cache
+        deep.next()
+        deep.previous()
+
+    operations = {
+        "first page": lambda: pager().first(),
+        "last page": lambda: pager().last(),
+        "next+previous (keyset, deep)": next_and_back,
+        "deep page (OFFSET)": lambda: session.execute(offset_query).all(),
+        "jump to ID": lambda: pager().jump(middle_id),
+        "search forward": lambda: deep.search("Venue 299"),
+    }
+    click.echo(f"📜 {total:,} events, {page_size} rows per page")
+    for name, operation in operations.items():
+        click.echo(f"  {name:<29} {summarize(time_call(operation, repeat))}")
+
+    walker = pager()
+    tracemalloc.start()
+    walker.first()
+    for _ in range(walk):
+        walker.next()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    click.echo(f"🧠 walked {walk:,} pages: peak {peak / 2 ** 20:.1f} MiB "
+               f"({len(walker._pages)} pages cached, now at ID {walker.rows[0].event_id:,})")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+⏰ Reminder scheduler: refill cost over a large event table, compared to polling it.
+
+Seeds about ``--events`` events spread over two years, then times:
+
+- the first refill (every event starting within lead + lookahead)
+- an incremental refill a few minutes later (new slice of the window plus recent edits)
+- one full-table poll of what is due, which is what a naive scheduler would run instead
+
+Reminders are delivered to a sink that discards them.
+
+Usage:
+    python benchmarks/bench_reminders.py --events 1000000
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, time_call, summarize
+
+
+class NullSink:
+    def send(self, recipient, reminders):
+        pass
+
+
+@click.command()
+@click.option("--events", default=1_000_000, show_default=True, help="Approximate number of events to seed.")
+@click.option("--repeat", default=20, show_default=True, help="Timed calls per operation.")
+@click.option("--database-url", default=None, help="Benchmark an existing database instead of a fresh SQLite file.")
+def main(events, repeat, database_url):
+    """Benchmark reminder refills against polling the whole event table."""
+    use_database(database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_reminders.db'}")
+
+    from sqlalchemy import select, func
+    from Epic_events.database import ReadSessionLocal
+    from Epic_events.models import Event
+    from Epic_events.reminders import ReminderScheduler, utc_now
+
+    if database_url is None:
+        seed(clients=max(1, events // 20), contracts_per_client=2, events_per_contract=10)
+
+    lead, lookahead = timedelta(hours=24), timedelta(hours=6)
+    start = utc_now()
+
+    def scheduler(now):
+        return ReminderScheduler(ReadSessionLocal, NullSink(), lead, lookahead, clock=lambda: now, remember=False)
+
+    def incremental_refill():
+        warm = scheduler(start)
+        warm.refill()
+        warm.clock = lambda: start + timedelta(minutes=5)
+        return warm.refill()
+
+    session = ReadSessionLocal()
+    total = session.scalar(select(func.count()).select_from(Event))
+
+    def poll_everything():
+        # Naive alternative: read every event and compute what is due in Python.
+        return [row for row in session.execute(select(Event.event_id, Event.start_date))
+                if start < row.start_date <= start + lead]
+
+    first = scheduler(start)
+    queued = first.refill()
+    click.echo(f"⏰ {total:,} events, {queued:,} queued by the first refill")
+    for name, operation in {
+        "first refill": lambda: scheduler(start).refill(),
+        "first + incremental refill": incremental_refill,
+        "poll whole table": poll_everything,
+    }.items():
+        click.echo(f"  {name:<27} {summarize(time_call(operation, repeat))}")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+📊 Rendering cost of a large listing: rich tables vs. plain mode.
+
+Renders the same 10,000-event listing through `render_events_table` once with the
+usual rich table and once in plain mode (`--plain` / ``EPIC_PLAIN=1``), writing to
+``/dev/null`` so only the formatting work and the writes are measured. The rows are
+built in memory, so no database round-trip is included.
+
+Usage:
+    python benchmarks/bench_rendering.py --rows 10000 --repeat 3
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import io
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import click
+
+from _seed import use_database, summarize
+
+
+def fake_events(count: int):
+    """Event-shaped rows with the attributes `render_events_table` reads."""
+    start = datetime(2026, 1, 1, 9, 0)
+    return [
+        SimpleNamespace(
+            event_id=i, event_name=f"Event {i}", location=f"Venue {i % 300}",
+            start_date=start + timedelta(hours=i), end_date=start + timedelta(hours=i + 4),
+            support_id=(i % 20) or None, client_id=i // 2 + 1, contract_id=i // 2 + 1,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+@click.command()
+@click.option("--rows", default=10_000, show_default=True, help="Events in the listing.")
+@click.option("--repeat", default=3, show_default=True, help="Renders per mode.")
+def main(rows, repeat):
+    """Benchmark rendering one large event listing in rich and plain mode."""
+    use_database(f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_render.db'}")
+
+    from Epic_events.rich_styles import console, set_plain_mode
+    from Epic_events.service.event_service import render_events_table
+
+    events = fake_events(rows)
+    results = {}
+    with open(os.devnull, "w") as devnull:
+        console.file = devnull
+        for label, plain in (("rich", False), ("plain", True)):
+            set_plain_mode(plain)
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                render_events_table(events, title="All Events")
+                samples.append((time.perf_counter() - started) * 1000)
+            results[label] = samples
+
+        # Output volume of one render per mode.
+        sizes = {}
+        for label, plain in (("rich", False), ("plain", True)):
+            set_plain_mode(plain)
+            console.file = buffer = io.StringIO()
+            render_events_table(events, title="All Events")
+            sizes[label] = len(buffer.getvalue().encode())
+
+    click.echo(f"🧾 {rows:,} rows, {repeat} renders per mode")
+    for label, samples in results.items():
+        click.echo(f"  {label:<5}  {summarize(samples)}   output {sizes[label] / 1024:,.0f} KiB")
+    click.echo(f"⚡ plain is {min(results['rich']) / min(results['plain']):.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
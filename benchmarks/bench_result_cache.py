@@ -0,0 +1,102 @@
+"""
+🗂️ Result cache: cached vs. uncached listings, and the hit rate under writes.
+
+Seeds a database, then times the query behind `event list`, `contract list` and
+`client list --sort total_due` three ways:
+
+- uncached: the listing query and row hydration on every call
+- hit: the cache is warm and no table changed (one small `table_versions` query)
+- mixed: each listing call is preceded, with probability ``--write-ratio``, by a
+  committed contract payment or event edit, as in a busy office; the hit rate shows
+  how often the cache still answers
+
+Rendering is not included: the cache only saves the database work.
+
+Usage:
+    python benchmarks/bench_result_cache.py --clients 5000 --repeat 30 --write-ratio 0.1
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, time_call, summarize
+
+
+@click.command()
+@click.option("--clients", default=5000, show_default=True, help="Clients to seed (2 contracts, 2 events each).")
+@click.option("--repeat", default=30, show_default=True, help="Calls per listing and mode.")
+@click.option("--write-ratio", default=0.1, show_default=True, type=click.FloatRange(0, 1),
+              help="Probability of a committed write before each listing call in the mixed run.")
+@click.option("--disk/--memory", default=False, show_default=True,
+              help="Keep the cache on disk (RESULT_CACHE_DIR) instead of in process memory.")
+@click.option("--database-url", default=None, help="Benchmark an existing database instead of a fresh SQLite file.")
+def main(clients, repeat, write_ratio, disk, database_url):
+    """Benchmark list commands with and without the result cache."""
+    workdir = Path(tempfile.mkdtemp())
+    use_database(database_url or f"sqlite:///{workdir / 'epic_cache.db'}")
+    if disk:
+        os.environ["RESULT_CACHE_DIR"] = str(workdir / "result_cache")
+
+    from sqlalchemy import select, func
+    from Epic_events.database import SessionLocal
+    from Epic_events.models import Client, Contract, Event
+    from Epic_events.result_cache import cached_rows, clear_cache, stats
+    from Epic_events.service.client_service import CLIENT_SORTS
+    from Epic_events.service.contract_service import record_payment
+
+    if database_url is None:
+        seed(clients=clients)
+
+    listings = {
+        "event list": (select(Event.__table__), ["events"]),
+        "contract list": (select(Contract.__table__), ["contracts"]),
+        "client list": (select(Client.__table__).order_by(*CLIENT_SORTS["total_due"]), ["clients"]),
+    }
+    session = SessionLocal()
+    rows = {name: session.execute(query).all() for name, (query, _) in listings.items()}
+    click.echo(f"🗂️ {', '.join(f'{name}: {len(found):,} rows' for name, found in rows.items())}"
+               f" ({'disk' if disk else 'memory'} cache)")
+
+    # 📏 Uncached vs. hit latency per listing.
+    for name, (query, tables) in listings.items():
+        uncached = time_call(lambda: session.execute(query).all(), repeat)
+        session.rollback()
+        cached_rows(session, name, query, tables)  # Warm the entry
+        hits = time_call(lambda: cached_rows(session, name, query, tables), repeat)
+        session.rollback()
+        click.echo(f"  {name:<13} uncached  {summarize(uncached)}")
+        click.echo(f"  {'':<13} hit       {summarize(hits)}   ({min(uncached) / min(hits):.0f}x faster)")
+
+    # ✍️ Mixed reads and writes: how often the cache still answers.
+    clear_cache()
+    rng = random.Random(7)
+    contract_ids = session.scalars(select(Contract.contract_id).where(Contract.amount_due > 1)).all()
+    event_ids = session.scalars(select(Event.event_id)).all()
+    writes = 0
+    for _ in range(repeat):
+        for name, (query, tables) in listings.items():
+            if rng.random() < write_ratio:
+                if rng.random() < 0.5 and contract_ids:
+                    record_payment(session, rng.choice(contract_ids), 1)
+                else:
+                    session.scalars(select(Event).where(Event.event_id == rng.choice(event_ids))).one().notes = f"edited {writes}"
+                session.commit()
+                writes += 1
+            cached_rows(session, name, query, tables)
+            session.rollback()  # Each listing is its own read transaction, like a CLI command
+
+    total = session.scalar(select(func.count()).select_from(Client))
+    session.close()
+    click.echo(f"✍️ Mixed run: {writes} writes over {repeat * len(listings)} listings ({total:,} clients)")
+    for name in listings:
+        hit, miss = stats[f"{name}:hit"], stats[f"{name}:miss"]
+        click.echo(f"  {name:<13} hits {hit:4}   misses {miss:4}   hit rate {100 * hit / max(1, hit + miss):5.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+🪶 Listing reads: full ORM hydration vs. plain rows of the rendered columns.
+
+Seeds ``--rows`` events (and as many contracts) and reads them two ways:
+
+- orm: ``session.query(Event).all()``, the previous listing path, which builds
+  tracked objects in the identity map with every column loaded
+- rows: ``session.execute(select(*event_row_columns())).all()``, what listings run now,
+  which returns immutable tuple rows holding only the columns the table renders
+
+For each path it reports the time to fetch and the peak Python memory (tracemalloc)
+held by the result. The same comparison is run for contracts. Rendering is left out.
+
+Usage:
+    python benchmarks/bench_row_dtos.py --rows 100000 --repeat 3
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, summarize
+
+
+def measure(session_factory, fetch, repeat: int):
+    """Time `fetch` on a fresh session `repeat` times, then its peak traced memory once (MiB)."""
+    samples = []
+    for _ in range(repeat):
+        with session_factory() as session:
+            started = time.perf_counter()
+            result = fetch(session)
+            samples.append((time.perf_counter() - started) * 1000)
+            del result
+        gc.collect()
+
+    with session_factory() as session:
+        tracemalloc.start()
+        result = fetch(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        count = len(result)
+        del result
+    gc.collect()
+    return samples, peak / 2 ** 20, count
+
+
+@click.command()
+@click.option("--rows", default=100_000, show_default=True, help="Events (and contracts) to seed.")
+@click.option("--repeat", default=3, show_default=True, help="Timed reads per path.")
+@click.option("--database-url", default=None, help="Benchmark an existing database instead of a fresh SQLite file.")
+def main(rows, repeat, database_url):
+    """Benchmark ORM hydration against plain rows for the listing queries."""
+    use_database(database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_rows.db'}")
+
+    from sqlalchemy import select
+    from Epic_events.database import SessionLocal
+    from Epic_events.models import Event, Contract
+    from Epic_events.service.event_service import event_row_columns
+    from Epic_events.service.contract_service import CONTRACT_ROW
+
+    if database_url is None:
+        seed(clients=max(1, rows // 2))
+
+    paths = {
+        "events": (lambda s: s.query(Event).all(), lambda s: s.execute(select(*event_row_columns())).all()),
+        "contracts": (lambda s: s.query(Contract).all(), lambda s: s.execute(select(*CONTRACT_ROW)).all()),
+    }
+    for name, (orm, plain) in paths.items():
+        orm_ms, orm_mib, count = measure(SessionLocal, orm, repeat)
+        row_ms, row_mib, _ = measure(SessionLocal, plain, repeat)
+        click.echo(f"🪶 {name}: {count:,} rows, {repeat} reads per path")
+        click.echo(f"  orm   {summarize(orm_ms)}   peak {orm_mib:8.1f} MiB")
+        click.echo(f"  rows  {summarize(row_ms)}   peak {row_mib:8.1f} MiB")
+        click.echo(f"  ⚡ rows are {min(orm_ms) / min(row_ms):.1f}x faster and use "
+                   f"{orm_mib / max(row_mib, 0.01):.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+📊 Concurrent load test of the service layer.
+
+Seeds a throw-away database, then runs N workers (threads, or processes with
+``--processes``) that pick operations from a weighted mix for a fixed duration.
+Writes go through the same non-interactive service functions and edit loop as the
+CLI (``edit_with_version_check`` + ``update_contract`` or the event reassignment
+write, ``record_payment``). Listings call the ``list_*_logic`` functions in plain mode
+with their output discarded. A short think time between reading a row and writing
+it stands in for the user typing at the prompts.
+
+For each operation type the report shows throughput, p50/p95/p99 latency, version
+conflicts, deadlocks / lock timeouts, other errors and lost updates:
+
+- ``update_contract`` adds 100 to ``amount_total`` (and so to ``amount_due``). The final
+  totals must equal the initial totals plus 100 per successful update.
+- ``pay_contract`` takes 1 off ``amount_due``. The final balances must match the
+  payments recorded and the total increases.
+- ``reassign_event`` changes ``support_id``. Two successful reassignments based on the
+  same version of an event mean one of them was lost.
+
+``--unguarded`` writes without the expected version (the behaviour before optimistic
+concurrency), which shows what the version check prevents.
+
+Usage:
+    python benchmarks/bench_service_load.py --workers 8 --duration 10
+    python benchmarks/bench_service_load.py --mix update_contract=5,reassign_event=3,list_events=1 --hot-rows 5
+    python benchmarks/bench_service_load.py --processes --database-url postgresql+psycopg2://user:pw@localhost/epic_bench
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, percentile
+
+DEFAULT_MIX = "update_contract=30,reassign_event=30,pay_contract=20,list_events=10,list_contracts=10"
+
+
+# 🧮 Operations ────────────────────────────────────────────────────────
+def build_operations(ids: dict, hot_rows: int, think_ms: float, unguarded: bool):
+    """
+    Operation name -> callable(session, rng) returning an optional ledger key.
+
+    Imports happen here so a spawned worker process picks up its own engine.
+    """
+    from sqlalchemy import select
+    from Epic_events.models import Contract, Event
+    from Epic_events.concurrency import edit_with_version_check, check_version
+    from Epic_events.service.contract_service import update_contract, record_payment, list_contracts_logic
+    from Epic_events.service.event_service import list_events_logic
+
+    contracts = range(1, min(hot_rows, ids["contracts"]) + 1)
+    events = range(1, min(hot_rows, ids["events"]) + 1)
+
+    def think():
+        time.sleep(think_ms / 1000)
+
+    def update_contract_op(session, rng):
+        contract_id = rng.choice(contracts)
+        read = {}
+
+        def collect():
+            contract = session.get(Contract, contract_id)
+            read["version"] = contract.version_id
+            think()
+            return {"amount_total": contract.amount_total + 100}
+
+        def apply(session, expected_version, changes):
+            update_contract(session, contract_id, None if unguarded else expected_version, **changes)
+
+        edit_with_version_check(session, Contract, contract_id, f"Contract {contract_id}",
+                                collect, apply, interactive=False)
+        return ("contract", contract_id, read["version"])
+
+    def reassign_event_op(session, rng):
+        event_id = rng.choice(events)
+        read = {}
+
+        def collect():
+            event = session.scalars(select(Event).where(Event.event_id == event_id)).one()
+            read["version"] = event.version_id
+            think()
+            # A different support every time: an unchanged value is not written and keeps the version.
+            return {"support_id": rng.choice([s for s in ids["supports"] if s != event.support_id])}
+
+        def apply(session, expected_version, changes):
+            # Same write as `reassign_event_logic`: support_id is not an `update_event` field.
+            event = session.scalars(select(Event).where(Event.event_id == event_id)).one()
+            check_version(event, None if unguarded else expected_version, f"Event {event_id}")
+            event.support_id = changes["support_id"]
+            session.flush()
+
+        edit_with_version_check(session, Event, event_id, f"Event {event_id}",
+                                collect, apply, interactive=False)
+        return ("event", event_id, read["version"])
+
+    def pay_contract_op(session, rng):
+        contract_id = rng.choice(contracts)
+        record_payment(session, contract_id, 1, recorded_by=ids["gestion"])
+        session.commit()
+        return ("payment", contract_id, None)
+
+    return {
+        "update_contract": update_contract_op,
+        "reassign_event": reassign_event_op,
+        "pay_contract": pay_contract_op,
+        "list_events": lambda session, rng: list_events_logic(),
+        "list_contracts": lambda session, rng: list_contracts_logic(),
+    }
+
+
+def classify(error: Exception) -> str:
+    """Bucket an exception: version conflict, deadlock / lock timeout, rejected input, or error."""
+    from sqlalchemy.exc import OperationalError, DBAPIError
+    from sqlalchemy.orm.exc import StaleDataError
+
+    if isinstance(error, StaleDataError):
+        return "conflict"
+    if isinstance(error, (OperationalError, DBAPIError)):
+        message = str(error).lower()
+        code = getattr(getattr(error, "orig", None), "pgcode", None)
+        if code in ("40P01", "40001", "55P03") or "deadlock" in message or "locked" in message:
+            return "deadlock"
+    if isinstance(error, ValueError):
+        return "rejected"
+    return "error"
+
+
+# 🧵 Worker ────────────────────────────────────────────────────────────
+def run_worker(worker_id: int, database_url: str, ids: dict, mix: dict, duration: float,
+               hot_rows: int, think_ms: float, unguarded: bool):
+    """
+    Run operations until `duration` elapses.
+
+    Returns:
+        list: (operation, latency_ms, outcome, ledger_key) per operation.
+    """
+    use_database(database_url)
+    from Epic_events.database import SessionLocal
+    from Epic_events.rich_styles import console, set_plain_mode
+
+    set_plain_mode(True)
+    console.file = open(os.devnull, "w")
+
+    operations = build_operations(ids, hot_rows, think_ms, unguarded)
+    names, weights = list(mix), list(mix.values())
+    rng = random.Random(worker_id)
+    results = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        session = SessionLocal()
+        started = time.perf_counter()
+        key, outcome = None, "ok"
+        try:
+            key = operations[name](session, rng)
+        except Exception as e:
+            session.rollback()
+            outcome = classify(e)
+        finally:
+            session.close()
+        results.append((name, (time.perf_counter() - started) * 1000, outcome, key))
+    return results
+
+
+# 🔍 Lost Update Checks ────────────────────────────────────────────────
+def contract_balances(engine):
+    from sqlalchemy import select
+    from Epic_events.models import Contract
+
+    with engine.connect() as conn:
+        rows = conn.execute(select(Contract.contract_id, Contract.amount_total, Contract.amount_due))
+        return {contract_id: (total, due) for contract_id, total, due in rows}
+
+
+def lost_updates(results, before: dict, after: dict) -> Counter:
+    """Per operation, the number of successful writes whose effect is missing from the database."""
+    lost = Counter()
+    successes = defaultdict(Counter)
+    reads = Counter()
+    for name, _, outcome, key in results:
+        if outcome != "ok" or key is None:
+            continue
+        kind, entity_id, version = key
+        successes[kind][entity_id] += 1
+        if kind == "event":
+            reads[(entity_id, version)] += 1
+
+    for contract_id, (total, due) in after.items():
+        total_before, due_before = before[contract_id]
+        lost["update_contract"] += successes["contract"][contract_id] - (total - total_before) // 100
+        lost["pay_contract"] += successes["payment"][contract_id] - (due_before + (total - total_before) - due)
+    lost["reassign_event"] = sum(count - 1 for count in reads.values() if count > 1)
+    return lost
+
+
+# 🚀 Entry Point ────────────────────────────────────────────────────────
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+@click.command()
+@click.option("--workers", default=8, show_default=True, help="Concurrent staff members.")
+@click.option("--duration", default=10.0, show_default=True, help="Seconds to run.")
+@click.option("--mix", default=DEFAULT_MIX, show_default=True, help="Weighted operation mix: name=weight,...")
+@click.option("--hot-rows", default=20, show_default=True,
+              help="Writes target only the first N contracts / events (lower = more contention).")
+@click.option("--think-ms", default=5.0, show_default=True, help="Pause between reading a row and writing it.")
+@click.option("--clients", default=500, show_default=True, help="Clients to seed (two contracts each).")
+@click.option("--processes", is_flag=True, help="Run workers as processes instead of threads.")
+@click.option("--unguarded", is_flag=True, help="Write without the expected version (shows lost updates).")
+@click.option("--database-url", default=None,
+              help="Empty database to use (defaults to a temporary SQLite file).")
+def main(workers, duration, mix, hot_rows, think_ms, clients, processes, unguarded, database_url):
+    """Load-test the service layer with concurrent mixed operations."""
+    database_url = database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'epic_load.db'}"
+    use_database(database_url)
+    mix = parse_mix(mix)
+
+    from Epic_events.database import engine
+
+    ids = seed(clients=clients)
+    unknown = set(mix) - set(build_operations(ids, hot_rows, think_ms, unguarded))
+    if unknown:
+        raise click.BadParameter(f"unknown operation(s): {', '.join(sorted(unknown))}", param_hint="--mix")
+    before = contract_balances(engine)
+
+    args = [(worker_id, database_url, ids, mix, duration, hot_rows, think_ms, unguarded)
+            for worker_id in range(workers)]
+    started = time.perf_counter()
+    if processes:
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            batches = pool.starmap(run_worker, args)
+    else:
+        batches = [None] * workers
+
+        def thread_main(index):
+            batches[index] = run_worker(*args[index])
+
+        threads = [threading.Thread(target=thread_main, args=(index,)) for index in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    results = [row for batch in batches for row in batch]
+    lost = lost_updates(results, before, contract_balances(engine))
+
+    click.echo(f"🗄️  {engine.dialect.name}, {workers} {'processes' if processes else 'threads'}, "
+               f"{elapsed:.1f} s, hot rows {hot_rows}, think {think_ms:g} ms"
+               f"{', UNGUARDED writes' if unguarded else ''}")
+    click.echo(f"{'operation':<16}{'ok':>7}{'ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+               f"{'conflict':>10}{'deadlock':>10}{'rejected':>10}{'error':>7}{'lost':>6}")
+    for name in mix:
+        rows = [row for row in results if row[0] == name]
+        if not rows:
+            continue
+        latencies = [ms for _, ms, _, _ in rows]
+        outcomes = Counter(outcome for _, _, outcome, _ in rows)
+        click.echo(f"{name:<16}{outcomes['ok']:>7}{outcomes['ok'] / elapsed:>9.1f}"
+                   f"{percentile(latencies, 50):>9.1f}{percentile(latencies, 95):>9.1f}"
+                   f"{percentile(latencies, 99):>9.1f}{outcomes['conflict']:>10}{outcomes['deadlock']:>10}"
+                   f"{outcomes['rejected']:>10}{outcomes['error']:>7}{lost[name]:>6}")
+    total_lost = sum(lost.values())
+    click.echo(f"{'✅' if not total_lost else '❌'} lost updates: {total_lost}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+📊 Read latency of the common list commands on a local SQLite file.
+
+Seeds a throw-away database file with the embedded SQLite profile and times the
+queries behind ``client list-clients``, ``client list-my-clients``,
+``contract list``, ``contract not-signed``, ``event list`` and
+``event list-my-event`` (query + ORM hydration, no terminal rendering).
+
+Usage:
+    python benchmarks/bench_sqlite_listings.py --clients 5000 --repeat 20
+"""
+
+# 📦 Imports ───────────────────────────────────────────────────────────
+import tempfile
+from pathlib import Path
+
+import click
+
+from _seed import use_database, seed, time_call, summarize
+
+
+@click.command()
+@click.option("--clients", default=5000, show_default=True, help="Number of clients to seed.")
+@click.option("--repeat", default=20, show_default=True, help="Timed runs per command.")
+@click.option("--path", type=click.Path(dir_okay=False), default=None,
+              help="SQLite file to use (defaults to a temporary file).")
+def main(clients, repeat, path):
+    """Benchmark list-command read latency against an embedded SQLite file."""
+    db_path = Path(path) if path else Path(tempfile.mkdtemp()) / "epic_bench.db"
+    use_database(f"sqlite:///{db_path}")
+
+    from sqlalchemy import text
+    from Epic_events.database import SessionLocal, engine
+    from Epic_events.models import Client, Contract, Event
+
+    ids = seed(clients=clients)
+    commercial_id = ids["commercials"][0]
+    support_id = ids["supports"][0]
+
+    with engine.connect() as conn:
+        pragmas = {name: conn.execute(text(f"PRAGMA {name}")).scalar()
+                   for name in ("journal_mode", "synchronous", "foreign_keys", "mmap_size", "cache_size")}
+    size = sum(p.stat().st_size for p in db_path.parent.glob(f"{db_path.name}*"))
+    click.echo(f"📁 {db_path}  ({size / 1e6:.1f} MB incl. WAL)")
+    click.echo(f"⚙️  pragmas: {pragmas}")
+    click.echo(f"🌱 {ids['clients']} clients, {ids['contracts']} contracts, {ids['events']} events\n")
+
+    def run(query):
+        def call():
+            session = SessionLocal()
+            try:
+                query(session).all()
+            finally:
+                session.close()
+        return call
+
+    commands = {
+        "client list-clients": run(lambda s: s.query(Client)),
+        "client list-my-clients": run(lambda s: s.query(Client).filter(Client.commercial_id == commercial_id)),
+        "contract list": run(lambda s: s.query(Contract)),
+        "contract not-signed": run(lambda s: s.query(Contract).filter(Contract.is_signed.is_(False))),
+        "event list": run(lambda s: s.query(Event)),
+        "event list-my-event": run(lambda s: s.query(Event).filter(Event.support_id == support_id)),
+    }
+
+    for name, call in commands.items():
+        call()  # warm the page cache / mmap
+        click.echo(f"{name:<24} {summarize(time_call(call, repeat))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,22 @@ with a stylized welcome and banner screen. It also captures and reports unexpect
 """
 
 # 📦 Module Imports ──────────────────────────────────────────────────
+import os
+import sys
+import time
+
+IMPORTS_STARTED = time.perf_counter()
+
+# ─── ⌨️ Shell Completion ──────────────────────────────────────────────
+# `eval "$(_EPIC_COMPLETE=bash_source epic)"` installs completion for an `epic` launcher.
+# Tab is answered from the ID cache before the CLI, SQLAlchemy and Sentry are imported.
+COMPLETE_VAR = "_EPIC_COMPLETE"
+if __name__ == "__main__" and COMPLETE_VAR in os.environ:
+    from Epic_events.completion import complete_from_cache
+    if complete_from_cache(os.environ[COMPLETE_VAR]):
+        sys.exit(0)
+
 # ─── 🎨 Visual Imports ────────────────────────────────────────────────
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
@@ -16,17 +30,14 @@ from pyfiglet import Figlet
 # ─── 🧠 Application Imports ───────────────────────────────────────────
 from Epic_events.database import init_db
 from Epic_events.cli import cli
-from Epic_events.sentry import init_sentry
+from Epic_events.sentry import init_sentry, command_transaction
+from Epic_events.rich_styles import console, set_plain_mode, is_plain_mode
+from Epic_events.profiler import record_phase, startup_phase
 
 # ─── 🌍 External Imports ───────────────────────────────────────────
 import sentry_sdk
 
-# 🔐 Initialize Sentry
-init_sentry()
-
-# ─── 🖥️ Console Setup ─────────────────────────────────────────────────
-console = Console()
-
+record_phase("imports", IMPORTS_STARTED)
 
 # ─── 🚀 Main Entry Point ──────────────────────────────────────────────
 def main():
@@ -34,18 +45,41 @@ def main():
     Launch the CRM application:
     - Initializes Sentry
     - Sets up the database
-    - Displays styled banners
+    - Displays styled banners (skipped in plain mode)
     - Starts the CLI interface
+
+    Each startup phase is timed for `doctor`.
+    Completions the ID cache cannot answer run only the CLI: no Sentry, no database, no banners.
+    Plain mode (`--plain` or `EPIC_PLAIN=1`) is decided before anything is printed.
     """
+    if COMPLETE_VAR in os.environ:
+        cli(prog_name="epic", complete_var=COMPLETE_VAR)
+        return
+
     # 🔐 Initialize Sentry
-    init_sentry()
+    with startup_phase("init_sentry"):
+        init_sentry()
 
     # 📂 Initialize the database
-    init_db()
+    with startup_phase("init_db"):
+        init_db()
 
     # Use case for Sentry
     """raise Exception("🔥 Test error for Sentry!")"""
 
+    set_plain_mode(os.getenv("EPIC_PLAIN") == "1" or "--plain" in sys.argv[1:])
+    if not is_plain_mode():
+        with startup_phase("banners"):
+            show_startup_banners()
+
+    # 💻 Launch the CLI application inside one traced transaction per command
+    with command_transaction():
+        cli(complete_var=COMPLETE_VAR)
+
+
+# ─── 🖼️ Startup Banners ───────────────────────────────────────────────
+def show_startup_banners():
+    """Print the startup panel, the ASCII-art title and the welcome panel."""
     # ✅ Show styled startup success panel
     console.print(
         Panel.fit(
@@ -74,9 +108,6 @@ def main():
     )
     console.print(welcome_panel)
 
-    # 💻 Launch the CLI application
-    cli()
-
 
 # 🧪 Entry Point: Run Script with Error Handling and Sentry Logging ──────
 if __name__ == "__main__":